@@ -0,0 +1,27 @@
+"""add source run prefilter stats
+
+Revision ID: 0003_source_run_prefilter
+Revises: 0002_source_runs
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_source_run_prefilter"
+down_revision = "0002_source_runs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "source_runs",
+        sa.Column("items_skipped", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("source_runs", sa.Column("parse_ms_saved", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("source_runs", "parse_ms_saved")
+    op.drop_column("source_runs", "items_skipped")
@@ -0,0 +1,25 @@
+"""add source run download bytes
+
+Revision ID: 0004_source_run_bytes
+Revises: 0003_source_run_prefilter
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_source_run_bytes"
+down_revision = "0003_source_run_prefilter"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "source_runs",
+        sa.Column("bytes_downloaded", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("source_runs", "bytes_downloaded")
@@ -0,0 +1,29 @@
+"""move raw payloads to blob store refs
+
+Revision ID: 0005_raw_document_blobs
+Revises: 0004_source_run_bytes
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_raw_document_blobs"
+down_revision = "0004_source_run_bytes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("raw_documents", sa.Column("raw_text_ref", sa.String(length=64), nullable=True))
+    op.add_column("raw_documents", sa.Column("raw_text_size", sa.Integer(), nullable=True))
+    op.add_column("raw_documents", sa.Column("raw_html_ref", sa.String(length=64), nullable=True))
+    op.add_column("raw_documents", sa.Column("raw_html_size", sa.Integer(), nullable=True))
+    # Existing payloads stay inline until scripts/backfill_blobs.py moves them.
+
+
+def downgrade() -> None:
+    op.drop_column("raw_documents", "raw_html_size")
+    op.drop_column("raw_documents", "raw_html_ref")
+    op.drop_column("raw_documents", "raw_text_size")
+    op.drop_column("raw_documents", "raw_text_ref")
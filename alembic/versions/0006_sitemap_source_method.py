@@ -0,0 +1,25 @@
+"""add sitemap source method
+
+Revision ID: 0006_sitemap_source_method
+Revises: 0005_raw_document_blobs
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "0006_sitemap_source_method"
+down_revision = "0005_raw_document_blobs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE sourcemethod ADD VALUE IF NOT EXISTS 'sitemap'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop a single enum value; sitemap sources must be removed manually.
+    pass
@@ -0,0 +1,22 @@
+"""add adaptive source poll interval
+
+Revision ID: 0007_source_adaptive_poll
+Revises: 0006_sitemap_source_method
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_source_adaptive_poll"
+down_revision = "0006_sitemap_source_method"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("sources", sa.Column("effective_poll_interval_min", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("sources", "effective_poll_interval_min")
@@ -0,0 +1,37 @@
+"""add source circuit breaker state
+
+Revision ID: 0008_source_circuit_breaker
+Revises: 0007_source_adaptive_poll
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008_source_circuit_breaker"
+down_revision = "0007_source_adaptive_poll"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    circuit_state = sa.Enum("closed", "open", "half_open", name="circuitstate")
+    circuit_state.create(bind, checkfirst=True)
+
+    op.add_column(
+        "sources",
+        sa.Column("circuit_state", circuit_state, nullable=False, server_default="closed"),
+    )
+    op.add_column("sources", sa.Column("circuit_open_until", sa.DateTime(), nullable=True))
+    op.add_column(
+        "source_runs",
+        sa.Column("circuit_state", circuit_state, nullable=False, server_default="closed"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("source_runs", "circuit_state")
+    op.drop_column("sources", "circuit_open_until")
+    op.drop_column("sources", "circuit_state")
+    sa.Enum(name="circuitstate").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,139 @@
+"""add document canonical url hash
+
+Revision ID: 0009_document_canonical_url_hash
+Revises: 0008_source_circuit_breaker
+Create Date: 2026-10-17
+"""
+
+import hashlib
+import posixpath
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009_document_canonical_url_hash"
+down_revision = "0008_source_circuit_breaker"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of app.utils.urls.canonicalize_url as of this revision, so later changes to the
+# canonicalization rules do not change what this migration writes.
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "yclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "mkt_tok",
+    "_hsenc",
+    "_hsmi",
+    "cmpid",
+    "ocid",
+    "ref",
+    "ref_src",
+    "spm",
+    "sr_share",
+    "s_kwcid",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_", "__hs")
+
+# Wrapper URLs that carry the destination in a query parameter.
+REDIRECT_PARAMS = {
+    "www.google.com": ("/url", ("q", "url")),
+    "google.com": ("/url", ("q", "url")),
+    "l.facebook.com": ("/l.php", ("u",)),
+    "lm.facebook.com": ("/l.php", ("u",)),
+    "out.reddit.com": ("", ("url",)),
+    "medium.com": ("/r/", ("url",)),
+    "l.messenger.com": ("/l.php", ("u",)),
+}
+HOST_ALIASES = {
+    "dx.doi.org": "doi.org",
+    "m.youtube.com": "youtube.com",
+}
+LEGACY_PUBMED = re.compile(r"^/pubmed/(\d+)/?$")
+# youtu.be/<id> is the share form of youtube.com/watch?v=<id>.
+SHORT_YOUTUBE = re.compile(r"^/([A-Za-z0-9_-]+)$")
+
+
+def _unwrap_redirect(host: str, path: str, query: str) -> str | None:
+    rule = REDIRECT_PARAMS.get(host)
+    if not rule or not path.startswith(rule[0]):
+        return None
+    params = dict(parse_qsl(query))
+    for name in rule[1]:
+        target = params.get(name)
+        if target and target.startswith(("http://", "https://")):
+            return target
+    return None
+
+
+def _is_tracking(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    url = url.strip()
+    for _ in range(3):
+        parts = urlsplit(url)
+        target = _unwrap_redirect((parts.hostname or "").lower(), parts.path, parts.query)
+        if not target:
+            break
+        url = target
+
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in {"http", "https"} or not parts.hostname:
+        return url
+    host = parts.hostname.lower().rstrip(".").removeprefix("www.")
+    host = HOST_ALIASES.get(host, host)
+    port = parts.port
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    path = posixpath.normpath(path) if path != "/" else path
+    if host == "ncbi.nlm.nih.gov" and (match := LEGACY_PUBMED.match(path)):
+        netloc, path = "pubmed.ncbi.nlm.nih.gov", f"/{match.group(1)}"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    if host == "youtu.be" and (match := SHORT_YOUTUBE.match(path)):
+        netloc, path = "youtube.com", "/watch"
+        params.append(("v", match.group(1)))
+    query = urlencode(sorted((name, value) for name, value in params if not _is_tracking(name)))
+    # http and https variants of the same page collapse onto one key.
+    return urlunsplit(("https", netloc, path, query, ""))
+
+
+def upgrade() -> None:
+    op.add_column("documents", sa.Column("canonical_url_hash", sa.String(length=64), nullable=True))
+    op.create_index("ix_documents_canonical_url_hash", "documents", ["canonical_url_hash"])
+
+    bind = op.get_bind()
+    documents = sa.table(
+        "documents",
+        sa.column("id", sa.Integer()),
+        sa.column("canonical_url", sa.Text()),
+        sa.column("canonical_url_hash", sa.String()),
+    )
+    rows = bind.execute(sa.select(documents.c.id, documents.c.canonical_url)).all()
+    for document_id, url in rows:
+        canonical = canonicalize_url(url)
+        canonical_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        bind.execute(
+            documents.update()
+            .where(documents.c.id == document_id)
+            .values(canonical_url=canonical, canonical_url_hash=canonical_hash)
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_documents_canonical_url_hash", table_name="documents")
+    op.drop_column("documents", "canonical_url_hash")
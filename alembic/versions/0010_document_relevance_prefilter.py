@@ -0,0 +1,26 @@
+"""add document relevance prefilter columns
+
+Revision ID: 0010_document_relevance_prefilter
+Revises: 0009_document_canonical_url_hash
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_document_relevance_prefilter"
+down_revision = "0009_document_canonical_url_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("documents", sa.Column("relevance_score", sa.Float(), nullable=True))
+    op.add_column("documents", sa.Column("relevance_decision", sa.String(length=16), nullable=True))
+    op.create_index("ix_documents_relevance_decision", "documents", ["relevance_decision"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_documents_relevance_decision", table_name="documents")
+    op.drop_column("documents", "relevance_decision")
+    op.drop_column("documents", "relevance_score")
@@ -0,0 +1,26 @@
+"""add llm run input compression columns
+
+Revision ID: 0011_llm_run_compression
+Revises: 0010_document_relevance_prefilter
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011_llm_run_compression"
+down_revision = "0010_document_relevance_prefilter"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("llm_runs", sa.Column("input_tokens_estimated", sa.Integer(), nullable=True))
+    op.add_column("llm_runs", sa.Column("prepared_tokens_estimated", sa.Integer(), nullable=True))
+    op.add_column("llm_runs", sa.Column("compression_ratio", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("llm_runs", "compression_ratio")
+    op.drop_column("llm_runs", "prepared_tokens_estimated")
+    op.drop_column("llm_runs", "input_tokens_estimated")
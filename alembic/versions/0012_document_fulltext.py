@@ -0,0 +1,28 @@
+"""add document open-access full text enrichment columns
+
+Revision ID: 0012_document_fulltext
+Revises: 0011_llm_run_compression
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0012_document_fulltext"
+down_revision = "0011_llm_run_compression"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("documents", sa.Column("pmcid", sa.String(length=32), nullable=True))
+    op.add_column("documents", sa.Column("fulltext_status", sa.String(length=16), nullable=True))
+    op.add_column("documents", sa.Column("fulltext_ref", sa.String(length=64), nullable=True))
+    op.create_index("ix_documents_fulltext_status", "documents", ["fulltext_status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_documents_fulltext_status", table_name="documents")
+    op.drop_column("documents", "fulltext_ref")
+    op.drop_column("documents", "fulltext_status")
+    op.drop_column("documents", "pmcid")
@@ -0,0 +1,25 @@
+"""add document full text fetch attempts
+
+Revision ID: 0013_document_fulltext_attempts
+Revises: 0012_document_fulltext
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0013_document_fulltext_attempts"
+down_revision = "0012_document_fulltext"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "documents",
+        sa.Column("fulltext_attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("documents", "fulltext_attempts")
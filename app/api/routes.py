@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+from celery import group
 from celery.result import AsyncResult
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
 from sqlalchemy.orm import Session
@@ -33,8 +34,12 @@ from app.schemas import (
     InsightOut,
     InsightPatch,
     LLMRunOut,
+    ManualIngestBatchOut,
+    ManualIngestBatchRequest,
+    ManualIngestItemResult,
     ManualIngestRequest,
     PipelineMetricsOut,
+    PrefilterMetricsOut,
     ProtocolOut,
     RawDocumentDetailOut,
     RawDocumentListItemOut,
@@ -43,27 +48,30 @@ from app.schemas import (
     SourceRunOut,
     SourceUpdate,
 )
-from app.services.audit import record_audit
+from app.services.audit import record_audit, record_audits
+from app.services.blobstore import load_raw_html, load_raw_text
+from app.services.circuit_breaker import circuit_state
 from app.services.idempotency import resolve_cached_response, store_response
-from app.services.pipeline import bump_metric, get_pipeline_metrics, upsert_raw_document
+from app.services.pipeline import (
+    bulk_upsert_raw_documents,
+    bump_metric,
+    get_pipeline_metrics,
+    upsert_raw_document,
+)
 from app.services.publish.beehiiv import publish_draft
+from app.services.relevance import prefilter_precision
+from app.services.scheduler import next_due_at
 from app.services.publish.bundle import build_bundle
 from app.services.llm.prompts import prompt_for
 from app.state_machine.document_status import enforce_transition
 from app.tasks.celery_app import celery_app
-from app.tasks.jobs import ingest_sources, triage_document
+from app.tasks.jobs import enqueue_triage, ingest_sources, triage_signature
 from app.core.responses import success_response
 from app.core.time import now_utc
 
 router = APIRouter(prefix="/v1", tags=["v1"])
 
 
-def _next_scheduled_at(source: Source):
-    if not source.last_scraped_at:
-        return None
-    return source.last_scraped_at + timedelta(minutes=source.poll_interval_min)
-
-
 def _serialize_llm_run(run: LLMRun) -> dict:
     llm_run = LLMRunOut.model_validate(run).model_dump(mode="json")
     try:
@@ -79,9 +87,9 @@ def list_sources(db: Session = Depends(get_db)):
     payload = []
     for source in sources:
         item = SourceOut.model_validate(source).model_dump(mode="json")
-        item["next_scheduled_at"] = (
-            _next_scheduled_at(source).isoformat() if _next_scheduled_at(source) else None
-        )
+        next_due = next_due_at(source)
+        item["next_scheduled_at"] = next_due.isoformat() if next_due else None
+        item["circuit_state"] = circuit_state(source).value
         payload.append(item)
     return success_response(payload)
 
@@ -147,6 +155,9 @@ def update_source(
 
     for key, value in payload.model_dump(exclude_none=True).items():
         setattr(source, key, value)
+    if payload.poll_interval_min is not None:
+        # An explicit interval restarts adaptation from the new baseline.
+        source.effective_poll_interval_min = None
 
     record_audit(db, "system", "update", "source", source.id, payload.model_dump(exclude_none=True))
     response = SourceOut.model_validate(source).model_dump(mode="json")
@@ -203,13 +214,99 @@ def manual_ingest(
     )
     db.commit()
 
-    task = triage_document.delay(document.id)
+    task = enqueue_triage(source, document)
     response = {"document_id": document.id, "task_id": task.id}
     store_response(db, idempotency_key, "/v1/manual-ingest", payload.model_dump(), response)
     db.commit()
     return success_response(response)
 
 
+@router.post("/manual-ingest/batch")
+def manual_ingest_batch(
+    payload: ManualIngestBatchRequest,
+    request: Request,
+    idempotency_key: str = Header(alias="Idempotency-Key"),
+    db: Session = Depends(get_db),
+):
+    cached = resolve_cached_response(db, request, "/v1/manual-ingest/batch", payload.model_dump())
+    if cached:
+        return success_response(cached)
+
+    source_names = {item.source_name for item in payload.items}
+    sources = {source.name: source for source in db.query(Source).filter(Source.name.in_(source_names)).all()}
+    missing = [
+        Source(
+            name=name,
+            method=SourceMethod.manual,
+            config_json={},
+            active=True,
+            poll_interval_min=1440,
+            trust_tier="manual",
+        )
+        for name in sorted(source_names - sources.keys())
+    ]
+    if missing:
+        db.add_all(missing)
+        db.flush()
+        sources.update({source.name: source for source in missing})
+
+    entries = [
+        (
+            sources[item.source_name],
+            {
+                "external_id": item.url,
+                "url": item.url,
+                "title": item.title,
+                "raw_text": item.text,
+                "raw_html": item.text,
+                "http_meta": {"manual": True, "operator": item.operator},
+            },
+        )
+        for item in payload.items
+    ]
+    results = bulk_upsert_raw_documents(db, entries)
+    record_audits(
+        db,
+        "manual_ingest",
+        "document",
+        [
+            (item.operator, document.id, item.model_dump())
+            for item, (document, created) in zip(payload.items, results, strict=True)
+            if created
+        ],
+    )
+    db.commit()
+
+    created = [
+        (sources[item.source_name], document)
+        for item, (document, is_new) in zip(payload.items, results, strict=True)
+        if is_new
+    ]
+    created_ids = [document.id for _, document in created]
+    triage_group_id = None
+    if created:
+        group_result = group(triage_signature(source, document) for source, document in created).apply_async()
+        triage_group_id = group_result.id
+    response = ManualIngestBatchOut(
+        items=[
+            ManualIngestItemResult(
+                index=index,
+                url=item.url,
+                status="created" if created else "existing",
+                document_id=document.id,
+                raw_document_id=document.raw_document_id,
+            )
+            for index, (item, (document, created)) in enumerate(zip(payload.items, results, strict=True))
+        ],
+        created=len(created_ids),
+        existing=len(results) - len(created_ids),
+        triage_group_id=triage_group_id,
+    ).model_dump(mode="json")
+    store_response(db, idempotency_key, "/v1/manual-ingest/batch", payload.model_dump(), response)
+    db.commit()
+    return success_response(response)
+
+
 @router.post("/ingest/run")
 def run_ingest(
     payload: IngestRunRequest,
@@ -322,7 +419,7 @@ def list_raw_documents(
     rows = query.order_by(RawDocument.fetched_at.desc()).offset(offset).limit(limit).all()
     items = []
     for raw, source, document in rows:
-        preview = (raw.raw_text or "")[:500]
+        preview = (document.normalized_text or "")[:500]
         items.append(
             RawDocumentListItemOut(
                 id=raw.id,
@@ -364,10 +461,14 @@ def raw_document_detail(raw_document_id: int, db: Session = Depends(get_db)):
         url=raw.url,
         fetched_at=raw.fetched_at,
         http_meta_json=raw.http_meta_json,
-        raw_text=raw.raw_text,
-        raw_html=raw.raw_html,
+        raw_text=load_raw_text(raw),
+        raw_html=load_raw_html(raw),
+        raw_text_size=raw.raw_text_size,
+        raw_html_size=raw.raw_html_size,
         content_hash=raw.content_hash,
         document_id=document.id,
+        canonical_url=document.canonical_url,
+        language=document.language,
         title=document.title,
         published_at=document.published_at,
         status=document.status,
@@ -586,3 +687,9 @@ async def publish_bundle(
 def pipeline_metrics(db: Session = Depends(get_db)):
     payload = PipelineMetricsOut(**get_pipeline_metrics(db))
     return success_response(payload.model_dump())
+
+
+@router.get("/metrics/prefilter")
+def prefilter_metrics(db: Session = Depends(get_db)):
+    payload = PrefilterMetricsOut(**prefilter_precision(db))
+    return success_response(payload.model_dump())
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+
+import httpx
+import zstandard
+
+from app.core.config import get_settings
+
+
+class CassetteMissError(LookupError):
+    pass
+
+
+@dataclass
+class CassetteEntry:
+    key: str
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    elapsed_ms: float
+
+    def as_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "content": base64.b64encode(self.content).decode(),
+            "elapsed_ms": round(self.elapsed_ms, 1),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CassetteEntry:
+        return cls(
+            key=data["key"],
+            status_code=data["status_code"],
+            headers=[(name, value) for name, value in data["headers"]],
+            content=base64.b64decode(data["content"]),
+            elapsed_ms=float(data.get("elapsed_ms", 0.0)),
+        )
+
+
+# Never persisted, and replay must not depend on which key or contact recorded the archive.
+CREDENTIAL_PARAMS = ("api_key", "email", "tool")
+# Incremental PubMed searches put today's date window in the URL; without dropping it a cassette
+# would only replay on the day it was recorded.
+VOLATILE_PARAMS = {"eutils.ncbi.nlm.nih.gov": ("mindate", "maxdate", "reldate")}
+
+
+def request_key(request: httpx.Request) -> str:
+    body_hash = hashlib.sha256(request.content).hexdigest()[:16] if request.content else "-"
+    url = request.url
+    for name in (*CREDENTIAL_PARAMS, *VOLATILE_PARAMS.get(url.host, ())):
+        url = url.copy_remove_param(name)
+    return f"{request.method} {url} {body_hash}"
+
+
+class Cassette:
+    def __init__(self, path: Path, level: int = 6) -> None:
+        self.path = path
+        self._level = level
+        self._lock = threading.Lock()
+        self._entries: dict[str, list[CassetteEntry]] = defaultdict(list)
+        self._positions: dict[str, int] = defaultdict(int)
+        if path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def _load(self) -> None:
+        data = zstandard.ZstdDecompressor().decompress(self.path.read_bytes())
+        for line in data.splitlines():
+            if line.strip():
+                entry = CassetteEntry.from_dict(json.loads(line))
+                self._entries[entry.key].append(entry)
+
+    def add(self, entry: CassetteEntry) -> None:
+        with self._lock:
+            self._entries[entry.key].append(entry)
+
+    def next(self, key: str) -> CassetteEntry:
+        # Repeated requests replay their recordings in order; the last one keeps answering after that.
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise CassetteMissError(f"No recorded response for {key}")
+            position = self._positions[key]
+            self._positions[key] = position + 1
+            return entries[min(position, len(entries) - 1)]
+
+    def rewind(self) -> None:
+        with self._lock:
+            self._positions.clear()
+
+    def save(self) -> None:
+        with self._lock:
+            lines = [
+                json.dumps(entry.as_dict(), separators=(",", ":"))
+                for entries in self._entries.values()
+                for entry in entries
+            ]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zstandard.ZstdCompressor(level=self._level).compress("\n".join(lines).encode())
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(compressed)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+@lru_cache(maxsize=8)
+def get_cassette(path: str) -> Cassette:
+    return Cassette(Path(path), level=get_settings().blob_store_zstd_level)
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        cassette: Cassette,
+        mode: str,
+        transport: httpx.AsyncBaseTransport | None = None,
+        latency_scale: float = 1.0,
+        latency_ms: float = 0.0,
+    ) -> None:
+        if mode not in {"record", "replay"}:
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        if mode == "record" and transport is None:
+            raise ValueError("Recording needs a network transport")
+        self._cassette = cassette
+        self._mode = mode
+        self._transport = transport
+        self._latency_scale = latency_scale
+        self._latency_ms = latency_ms
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        key = request_key(request)
+        if self._mode == "replay":
+            entry = self._cassette.next(key)
+            delay = (entry.elapsed_ms * self._latency_scale + self._latency_ms) / 1000
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return httpx.Response(entry.status_code, headers=entry.headers, content=entry.content, request=request)
+
+        assert self._transport is not None
+        started = perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            # Raw bytes are kept with their Content-Encoding, so replay decodes exactly like the live fetch.
+            content = b"".join([chunk async for chunk in response.stream])  # type: ignore[union-attr]
+        finally:
+            await response.aclose()
+        self._cassette.add(
+            CassetteEntry(
+                key=key,
+                status_code=response.status_code,
+                headers=list(response.headers.multi_items()),
+                content=content,
+                elapsed_ms=(perf_counter() - started) * 1000,
+            )
+        )
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=content, request=request
+        )
+
+    async def aclose(self) -> None:
+        if self._mode == "record":
+            self._cassette.save()
+        if self._transport is not None:
+            await self._transport.aclose()
@@ -32,7 +32,82 @@ class Settings(BaseSettings):
 
     llm_timeout_seconds: int = 40
     llm_max_retries: int = 3
+    llm_triage_input_tokens: int = 1500
+    llm_analysis_input_tokens: int = 6000
+    llm_verification_input_tokens: int = 6000
     ingest_http_timeout_seconds: int = 20
+    ingest_max_concurrency: int = 8
+    ingest_upsert_batch_size: int = 100
+    ingest_stream_queue_size: int = 8
+    ingest_per_host_concurrency: int = 2
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_max_connections_per_host: int = 4
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = False
+    ncbi_rate_limit_per_second: float | None = None
+    rate_limits: str = ""
+    rate_limit_backend: str = "redis"
+    rate_limit_burst_seconds: float = 0.0
+    pubmed_lookback_days: int = 7
+    pubmed_max_records: int = 1000
+    pubmed_efetch_batch_size: int = 200
+    pubmed_seen_pmid_limit: int = 5000
+    pmc_enrichment_enabled: bool = False
+    pmc_idmap_batch_size: int = 200
+    pmc_fulltext_concurrency: int = 3
+    pmc_fulltext_sections: str = "results,methods,materials,conclusion"
+    pmc_cache_path: str = "data/pmc"
+    pmc_negative_cache_days: int = 7
+    pmc_enrich_batch_size: int = 100
+    pmc_enrich_delay_seconds: int = 30
+    pmc_fulltext_max_attempts: int = 3
+    pmc_fetch_lease_minutes: int = 30
+    ingest_max_download_bytes: int = 10000000
+    ingest_parse_executor: str = "thread"
+    ingest_parse_workers: int = 2
+    browser_max_contexts: int = 2
+    browser_context_max_uses: int = 50
+    browser_blocked_resources: str = "image,font,media"
+    html_listing_concurrency: int = 4
+    html_listing_max_new_per_poll: int = 20
+    html_listing_seen_limit: int = 2000
+    html_listing_max_attempts: int = 3
+    sitemap_concurrency: int = 4
+    sitemap_max_new_per_poll: int = 20
+    sitemap_max_tracked_urls: int = 20000
+    sitemap_max_age_days: int = 30
+    rss_seen_id_limit: int = 2000
+    scheduler_jitter_ratio: float = 0.1
+    scheduler_max_jitter_seconds: int = 300
+    circuit_failure_threshold: int = 3
+    circuit_base_backoff_seconds: int = 300
+    circuit_max_backoff_seconds: int = 86400
+    adaptive_polling_enabled: bool = True
+    adaptive_poll_min_interval_min: int = 15
+    adaptive_poll_max_interval_min: int = 1440
+    adaptive_poll_target_items: float = 1.0
+    adaptive_poll_backoff_factor: float = 1.5
+    adaptive_poll_history_runs: int = 12
+    adaptive_poll_min_runs: int = 3
+    covered_languages: str = "en"
+    uncovered_language_policy: str = "defer"
+    deferred_triage_priority: int = 9
+    relevance_prefilter_enabled: bool = True
+    relevance_reject_below: float = 0.02
+    relevance_reject_enforced: bool = False
+    relevance_fast_track_above: float = 1.0
+    relevance_model_path: str = ""
+    dns_cache_ttl_seconds: int = 300
+    dns_negative_cache_ttl_seconds: int = 60
+    dns_cache_max_entries: int = 1024
+    http_cassette_mode: str = "off"
+    http_cassette_path: str = "data/cassettes/ingest.jsonl.zst"
+    http_cassette_latency_scale: float = 1.0
+    http_cassette_latency_ms: float = 0.0
+    blob_store_backend: str = "local"
+    blob_store_path: str = "data/blobs"
+    blob_store_zstd_level: int = 6
     idempotency_ttl_hours: int = 168
     source_run_retention_days: int = 30
 
@@ -40,6 +115,10 @@ class Settings(BaseSettings):
     def allowed_fetch_host_list(self) -> list[str]:
         return [item.strip().lower() for item in self.allowed_fetch_hosts.split(",") if item.strip()]
 
+    @property
+    def covered_language_list(self) -> list[str]:
+        return [item.strip().lower() for item in self.covered_languages.split(",") if item.strip()]
+
     @model_validator(mode="after")
     def validate_feature_flags(self) -> "Settings":
         if self.api_auth_enabled and not self.api_auth_token and self.env not in {"test"}:
@@ -48,6 +127,10 @@ class Settings(BaseSettings):
             raise ValueError(
                 "beehiiv_api_key and beehiiv_publication_id are required when beehiiv_enabled=true"
             )
+        if self.http_cassette_mode not in {"off", "record", "replay"}:
+            raise ValueError("http_cassette_mode must be one of off, record, replay")
+        if self.uncovered_language_policy not in {"triage", "defer", "skip"}:
+            raise ValueError("uncovered_language_policy must be one of triage, defer, skip")
         if self.llm_enabled and (not self.openai_api_key and not self.anthropic_api_key):
             raise ValueError(
                 "At least one provider key is required when llm_enabled=true"
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import AsyncIterator, Callable
+
+import httpx
+
+from app.core.cassette import CassetteTransport, get_cassette
+from app.core.config import get_settings
+from app.utils.network import PinnedDNSBackend
+from app.utils.ratelimit import get_rate_limiter
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except Exception:  # noqa: BLE001
+    HTTP2_AVAILABLE = False
+
+CLIENT_TIMEOUTS: dict[str, Callable[[], float]] = {
+    "ingest": lambda: float(get_settings().ingest_http_timeout_seconds),
+    "publish": lambda: 20.0,
+}
+PINNED_DNS_CLIENTS = {"ingest"}
+CASSETTE_CLIENTS = {"ingest"}
+
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host: int) -> None:
+        self._transport = transport
+        self._per_host = max(1, per_host)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphores.setdefault(request.url.host, asyncio.Semaphore(self._per_host))
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        if response.is_closed:
+            semaphore.release()
+            return response
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await get_rate_limiter().acquire(request.url.host)
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class PinnedDNSTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # httpx does not expose httpcore's network_backend hook, so wrap it on the pool.
+        pool = self._pool
+        pool._network_backend = PinnedDNSBackend(pool._network_backend)  # type: ignore[attr-defined]
+
+
+def _network_transport(pin_dns: bool) -> httpx.AsyncBaseTransport:
+    settings = get_settings()
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+    transport_class = PinnedDNSTransport if pin_dns else httpx.AsyncHTTPTransport
+    return transport_class(limits=limits, http2=settings.http2_enabled and HTTP2_AVAILABLE)
+
+
+def build_transport(pin_dns: bool = False, cassette: bool = False) -> httpx.AsyncBaseTransport:
+    settings = get_settings()
+    mode = settings.http_cassette_mode if cassette else "off"
+    transport: httpx.AsyncBaseTransport
+    if mode == "replay":
+        transport = CassetteTransport(
+            get_cassette(settings.http_cassette_path),
+            "replay",
+            latency_scale=settings.http_cassette_latency_scale,
+            latency_ms=settings.http_cassette_latency_ms,
+        )
+    elif mode == "record":
+        transport = CassetteTransport(
+            get_cassette(settings.http_cassette_path), "record", transport=_network_transport(pin_dns)
+        )
+    else:
+        transport = _network_transport(pin_dns)
+    # Rate limiting sits outermost so waiting for a token does not hold a connection slot.
+    return RateLimitedTransport(
+        HostLimitedTransport(transport, per_host=settings.http_max_connections_per_host)
+    )
+
+
+def get_http_client(name: str = "ingest") -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    clients = _clients.setdefault(loop, {})
+    client = clients.get(name)
+    if client is None or client.is_closed:
+        timeout = CLIENT_TIMEOUTS.get(name, CLIENT_TIMEOUTS["ingest"])()
+        transport = build_transport(pin_dns=name in PINNED_DNS_CLIENTS, cassette=name in CASSETTE_CLIENTS)
+        client = httpx.AsyncClient(transport=transport, timeout=timeout, follow_redirects=False)
+        clients[name] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
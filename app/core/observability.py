@@ -23,3 +23,51 @@ LLM_LATENCY = Histogram(
     "LLM call latency",
     ["stage", "provider", "model"],
 )
+
+INGEST_FETCH_LATENCY = Histogram(
+    "longevai_ingest_fetch_latency_seconds",
+    "Per-source ingestion fetch latency",
+    ["method"],
+)
+
+INGEST_BYTES_DOWNLOADED = Counter(
+    "longevai_ingest_bytes_downloaded_total",
+    "Response body bytes downloaded by ingestion fetchers",
+    ["source"],
+)
+
+SOURCE_CIRCUIT_TRANSITIONS = Counter(
+    "longevai_source_circuit_transitions_total",
+    "Source circuit breaker state transitions",
+    ["state"],
+)
+
+DNS_CACHE_LOOKUPS = Counter(
+    "longevai_dns_cache_lookups_total",
+    "DNS safety verdict cache lookups",
+    ["result"],
+)
+
+LLM_CALLS_AVOIDED = Counter(
+    "longevai_llm_calls_avoided_total",
+    "Triage LLM calls skipped before reaching a provider",
+    ["reason"],
+)
+
+TRIAGE_DEFERRED = Counter(
+    "longevai_triage_deferred_total",
+    "Triage tasks enqueued at low priority for uncovered languages",
+    ["language"],
+)
+
+LLM_INPUT_TOKENS_SAVED = Counter(
+    "longevai_llm_input_tokens_saved_total",
+    "Estimated input tokens removed by per-stage budget preparation",
+    ["stage"],
+)
+
+PMC_FULLTEXT_ENRICHMENTS = Counter(
+    "longevai_pmc_fulltext_enrichments_total",
+    "Open-access full-text enrichment outcomes for triaged PubMed documents",
+    ["status", "origin"],
+)
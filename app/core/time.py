@@ -3,3 +3,10 @@ from datetime import UTC, datetime
 
 def now_utc() -> datetime:
     return datetime.now(UTC)
+
+
+def as_utc(value: datetime) -> datetime:
+    # DateTime columns come back naive; they are always written as UTC.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
@@ -12,6 +12,7 @@ from starlette.responses import JSONResponse, Response
 from app.api.routes import router as api_router
 from app.core.auth import enforce_api_auth
 from app.core.config import get_settings
+from app.core.http import close_http_clients
 from app.core.observability import REQUEST_COUNT, REQUEST_LATENCY
 from app.core.responses import error_response
 from app.db.init_db import init_db
@@ -26,6 +27,7 @@ async def lifespan(app: FastAPI):
     FastAPIInstrumentor.instrument_app(app)
     SQLAlchemyInstrumentor().instrument(engine=get_engine())
     yield
+    await close_http_clients()
 
 
 app = FastAPI(title=settings.app_name, lifespan=lifespan)
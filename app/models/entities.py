@@ -6,6 +6,7 @@ from enum import Enum
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     CheckConstraint,
     Date,
@@ -31,6 +32,7 @@ class SourceMethod(str, Enum):
     pubmed = "pubmed"
     html = "html"
     manual = "manual"
+    sitemap = "sitemap"
 
 
 class DocumentStatus(str, Enum):
@@ -68,6 +70,12 @@ class SourceRunStatus(str, Enum):
     skipped = "skipped"
 
 
+class CircuitState(str, Enum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
 class Source(Base):
     __tablename__ = "sources"
     __table_args__ = (Index("ix_sources_active_method", "active", "method"),)
@@ -78,11 +86,16 @@ class Source(Base):
     config_json: Mapped[dict] = mapped_column(JSON, default=dict)
     active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     poll_interval_min: Mapped[int] = mapped_column(Integer, default=60, nullable=False)
+    effective_poll_interval_min: Mapped[int | None] = mapped_column(Integer)
     trust_tier: Mapped[str] = mapped_column(String(50), default="standard", nullable=False)
     last_scraped_at: Mapped[datetime | None] = mapped_column(DateTime)
     last_success_at: Mapped[datetime | None] = mapped_column(DateTime)
     last_error: Mapped[str | None] = mapped_column(Text)
     failure_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    circuit_state: Mapped[CircuitState] = mapped_column(
+        SAEnum(CircuitState), default=CircuitState.closed, nullable=False
+    )
+    circuit_open_until: Mapped[datetime | None] = mapped_column(DateTime)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=now_utc, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=now_utc, onupdate=now_utc, nullable=False
@@ -103,6 +116,12 @@ class SourceRun(Base):
     finished_at: Mapped[datetime | None] = mapped_column(DateTime)
     items_discovered: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     items_ingested: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    items_skipped: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    parse_ms_saved: Mapped[int | None] = mapped_column(Integer)
+    bytes_downloaded: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    circuit_state: Mapped[CircuitState] = mapped_column(
+        SAEnum(CircuitState), default=CircuitState.closed, nullable=False
+    )
     error: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=now_utc, nullable=False)
 
@@ -119,8 +138,12 @@ class RawDocument(Base):
     url: Mapped[str] = mapped_column(Text, nullable=False)
     fetched_at: Mapped[datetime] = mapped_column(DateTime, default=now_utc, nullable=False)
     http_meta_json: Mapped[dict] = mapped_column(JSON, default=dict)
-    raw_text: Mapped[str | None] = mapped_column(Text)
-    raw_html: Mapped[str | None] = mapped_column(Text)
+    raw_text: Mapped[str | None] = mapped_column(Text, deferred=True)
+    raw_html: Mapped[str | None] = mapped_column(Text, deferred=True)
+    raw_text_ref: Mapped[str | None] = mapped_column(String(64))
+    raw_text_size: Mapped[int | None] = mapped_column(Integer)
+    raw_html_ref: Mapped[str | None] = mapped_column(String(64))
+    raw_html_size: Mapped[int | None] = mapped_column(Integer)
     content_hash: Mapped[str] = mapped_column(String(64), index=True, nullable=False)
 
     source: Mapped[Source] = relationship()
@@ -132,9 +155,16 @@ class Document(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     raw_document_id: Mapped[int] = mapped_column(ForeignKey("raw_documents.id"), unique=True, nullable=False)
     canonical_url: Mapped[str] = mapped_column(Text, nullable=False)
+    canonical_url_hash: Mapped[str | None] = mapped_column(String(64), index=True)
     title: Mapped[str | None] = mapped_column(Text)
     published_at: Mapped[datetime | None] = mapped_column(DateTime)
     language: Mapped[str] = mapped_column(String(16), default="en", nullable=False)
+    relevance_score: Mapped[float | None] = mapped_column(Float)
+    relevance_decision: Mapped[str | None] = mapped_column(String(16), index=True)
+    pmcid: Mapped[str | None] = mapped_column(String(32))
+    fulltext_status: Mapped[str | None] = mapped_column(String(16), index=True)
+    fulltext_ref: Mapped[str | None] = mapped_column(String(64))
+    fulltext_attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     normalized_text: Mapped[str] = mapped_column(Text, nullable=False)
     status: Mapped[DocumentStatus] = mapped_column(
         SAEnum(DocumentStatus), default=DocumentStatus.ingested, nullable=False, index=True
@@ -172,6 +202,9 @@ class LLMRun(Base):
     prompt_version: Mapped[str] = mapped_column(String(64), nullable=False)
     input_tokens: Mapped[int | None] = mapped_column(Integer)
     output_tokens: Mapped[int | None] = mapped_column(Integer)
+    input_tokens_estimated: Mapped[int | None] = mapped_column(Integer)
+    prepared_tokens_estimated: Mapped[int | None] = mapped_column(Integer)
+    compression_ratio: Mapped[float | None] = mapped_column(Float)
     latency_ms: Mapped[int | None] = mapped_column(Integer)
     cost_usd: Mapped[float | None] = mapped_column(Numeric(10, 6))
     raw_response_json: Mapped[dict] = mapped_column(JSON, default=dict)
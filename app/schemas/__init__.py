@@ -11,8 +11,13 @@ from app.schemas.common import (
     InsightOut,
     InsightPatch,
     LLMRunOut,
+    ManualIngestBatchOut,
+    ManualIngestBatchRequest,
+    ManualIngestItemResult,
     ManualIngestRequest,
     PipelineMetricsOut,
+    PrefilterDecisionStats,
+    PrefilterMetricsOut,
     ProtocolOut,
     RawDocumentDetailOut,
     RawDocumentListItemOut,
@@ -37,8 +42,13 @@ __all__ = [
     "InsightOut",
     "InsightPatch",
     "LLMRunOut",
+    "ManualIngestBatchOut",
+    "ManualIngestBatchRequest",
+    "ManualIngestItemResult",
     "ManualIngestRequest",
     "PipelineMetricsOut",
+    "PrefilterDecisionStats",
+    "PrefilterMetricsOut",
     "ProtocolOut",
     "RawDocumentDetailOut",
     "RawDocumentListItemOut",
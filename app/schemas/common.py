@@ -4,6 +4,7 @@ from typing import Any, Literal
 from pydantic import BaseModel, Field, HttpUrl
 
 from app.models.entities import (
+    CircuitState,
     DocumentStatus,
     EditorStatus,
     LLMStage,
@@ -30,6 +31,19 @@ class SourceConfig(BaseModel):
     headers: dict[str, str] = Field(default_factory=dict)
     selectors: list[str] = Field(default_factory=list)
     cooldown_seconds: int = Field(default=0, ge=0)
+    min_poll_interval_min: int | None = Field(default=None, ge=1, le=10080)
+    max_poll_interval_min: int | None = Field(default=None, ge=1, le=10080)
+    languages: list[str] = Field(default_factory=list)
+    language_policy: Literal["triage", "defer", "skip"] | None = None
+    mode: Literal["page", "listing"] | None = None
+    article_selectors: list[str] = Field(default_factory=list)
+    link_pattern: str | None = None
+    max_download_bytes: int | None = Field(default=None, ge=1024)
+    max_age_days: int | None = Field(default=None, ge=1)
+    dynamic_wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] | None = None
+    dynamic_wait_selector: str | None = None
+    dynamic_timeout_ms: int | None = Field(default=None, ge=1000, le=120000)
+    dynamic_settle_ms: int | None = Field(default=None, ge=0, le=30000)
 
 
 class SourceCreate(BaseModel):
@@ -56,12 +70,15 @@ class SourceOut(BaseModel):
     config_json: dict
     active: bool
     poll_interval_min: int
+    effective_poll_interval_min: int | None = None
     trust_tier: str
     last_scraped_at: datetime | None = None
     last_success_at: datetime | None = None
     next_scheduled_at: datetime | None = None
     last_error: str | None = None
     failure_count: int
+    circuit_state: CircuitState = CircuitState.closed
+    circuit_open_until: datetime | None = None
 
     model_config = {"from_attributes": True}
 
@@ -78,6 +95,25 @@ class ManualIngestRequest(BaseModel):
     operator: str = "editor"
 
 
+class ManualIngestBatchRequest(BaseModel):
+    items: list[ManualIngestRequest] = Field(min_length=1, max_length=500)
+
+
+class ManualIngestItemResult(BaseModel):
+    index: int
+    url: str
+    status: Literal["created", "existing"]
+    document_id: int
+    raw_document_id: int
+
+
+class ManualIngestBatchOut(BaseModel):
+    items: list[ManualIngestItemResult]
+    created: int
+    existing: int
+    triage_group_id: str | None = None
+
+
 class InsightOut(BaseModel):
     id: int
     document_id: int
@@ -133,6 +169,9 @@ class LLMRunOut(BaseModel):
     prompt_version: str
     input_tokens: int | None
     output_tokens: int | None
+    input_tokens_estimated: int | None = None
+    prepared_tokens_estimated: int | None = None
+    compression_ratio: float | None = None
     latency_ms: int | None
     cost_usd: float | None
     raw_response_json: dict = Field(default_factory=dict)
@@ -159,6 +198,10 @@ class SourceRunOut(BaseModel):
     finished_at: datetime | None
     items_discovered: int
     items_ingested: int
+    items_skipped: int
+    parse_ms_saved: int | None
+    bytes_downloaded: int
+    circuit_state: CircuitState
     error: str | None
 
     model_config = {"from_attributes": True}
@@ -186,8 +229,12 @@ class RawDocumentDetailOut(BaseModel):
     http_meta_json: dict
     raw_text: str | None = None
     raw_html: str | None = None
+    raw_text_size: int | None = None
+    raw_html_size: int | None = None
     content_hash: str
     document_id: int
+    canonical_url: str | None = None
+    language: str | None = None
     title: str | None = None
     published_at: datetime | None = None
     status: DocumentStatus
@@ -221,6 +268,18 @@ class PipelineMetricsOut(BaseModel):
     today_rejected: int
 
 
+class PrefilterDecisionStats(BaseModel):
+    documents: int
+    labelled: int
+    labelled_relevant: int
+    precision: float | None = None
+
+
+class PrefilterMetricsOut(BaseModel):
+    decisions: dict[str, PrefilterDecisionStats]
+    llm_calls_saved: int
+
+
 class ClaimModel(BaseModel):
     claim_text: str
     claim_type: str
@@ -275,6 +334,9 @@ class LLMRunIn(BaseModel):
     prompt_version: str
     input_tokens: int | None = None
     output_tokens: int | None = None
+    input_tokens_estimated: int | None = None
+    prepared_tokens_estimated: int | None = None
+    compression_ratio: float | None = None
     latency_ms: int | None = None
     cost_usd: float | None = None
     raw_response_json: dict = Field(default_factory=dict)
@@ -13,3 +13,18 @@ def record_audit(db: Session, actor: str, action: str, entity_type: str, entity_
             payload_json=payload,
         )
     )
+
+
+def record_audits(db: Session, action: str, entity_type: str, entries: list[tuple[str, int, dict]]) -> None:
+    db.add_all(
+        [
+            AuditLog(
+                actor=actor,
+                action=action,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                payload_json=payload,
+            )
+            for actor, entity_id, payload in entries
+        ]
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+import zstandard
+
+from app.core.config import get_settings
+from app.models.entities import RawDocument
+
+
+class BlobNotFoundError(LookupError):
+    pass
+
+
+class BlobStore(Protocol):
+    def put(self, data: bytes) -> str: ...
+
+    def get(self, digest: str) -> bytes: ...
+
+    def exists(self, digest: str) -> bool: ...
+
+
+class LocalBlobStore:
+    def __init__(self, root: Path, level: int = 6) -> None:
+        self._root = root
+        self._level = level
+
+    def _path(self, digest: str) -> Path:
+        return self._root / digest[:2] / digest[2:4] / f"{digest}.zst"
+
+    def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if path.exists():
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zstandard.ZstdCompressor(level=self._level).compress(data)
+        # Write-then-rename so concurrent writers of the same digest never expose a partial blob.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(compressed)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        try:
+            compressed = self._path(digest).read_bytes()
+        except FileNotFoundError as exc:
+            raise BlobNotFoundError(digest) from exc
+        return zstandard.ZstdDecompressor().decompress(compressed)
+
+    def exists(self, digest: str) -> bool:
+        return self._path(digest).exists()
+
+
+@lru_cache
+def get_blob_store() -> BlobStore:
+    settings = get_settings()
+    if settings.blob_store_backend == "local":
+        return LocalBlobStore(Path(settings.blob_store_path), level=settings.blob_store_zstd_level)
+    raise ValueError(f"Unknown blob store backend: {settings.blob_store_backend}")
+
+
+def put_text(value: str | None) -> tuple[str | None, int | None]:
+    if value is None:
+        return None, None
+    data = value.encode("utf-8")
+    return get_blob_store().put(data), len(data)
+
+
+def get_text(digest: str | None) -> str | None:
+    if digest is None:
+        return None
+    return get_blob_store().get(digest).decode("utf-8")
+
+
+def store_raw_payloads(raw: RawDocument, raw_text: str | None, raw_html: str | None) -> None:
+    raw.raw_text_ref, raw.raw_text_size = put_text(raw_text)
+    raw.raw_html_ref, raw.raw_html_size = put_text(raw_html)
+    raw.raw_text = None
+    raw.raw_html = None
+
+
+def load_raw_text(raw: RawDocument) -> str | None:
+    # Rows written before the blob store keep their payload inline until backfilled.
+    return get_text(raw.raw_text_ref) if raw.raw_text_ref else raw.raw_text
+
+
+def load_raw_html(raw: RawDocument) -> str | None:
+    return get_text(raw.raw_html_ref) if raw.raw_html_ref else raw.raw_html
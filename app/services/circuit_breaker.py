@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+
+from app.core.config import get_settings
+from app.core.observability import SOURCE_CIRCUIT_TRANSITIONS
+from app.core.time import as_utc, now_utc
+from app.models.entities import CircuitState, Source
+
+CIRCUIT_OPEN_ERROR = "circuit_open"
+
+
+def circuit_state(source: Source, now: datetime | None = None) -> CircuitState:
+    if source.circuit_state != CircuitState.open:
+        return source.circuit_state or CircuitState.closed
+    if source.circuit_open_until and as_utc(source.circuit_open_until) <= (now or now_utc()):
+        return CircuitState.half_open
+    return CircuitState.open
+
+
+def circuit_backoff(failure_count: int) -> timedelta:
+    settings = get_settings()
+    exponent = max(0, failure_count - settings.circuit_failure_threshold)
+    seconds = settings.circuit_base_backoff_seconds * (2 ** min(exponent, 16))
+    return timedelta(seconds=min(seconds, settings.circuit_max_backoff_seconds))
+
+
+def _transition(source: Source, state: CircuitState) -> None:
+    if source.circuit_state != state:
+        SOURCE_CIRCUIT_TRANSITIONS.labels(state.value).inc()
+    source.circuit_state = state
+
+
+def begin_attempt(source: Source, now: datetime | None = None, force: bool = False) -> CircuitState:
+    state = circuit_state(source, now)
+    if state == CircuitState.open and force:
+        state = CircuitState.half_open
+    if state == CircuitState.half_open:
+        _transition(source, CircuitState.half_open)
+    return state
+
+
+def record_success(source: Source) -> None:
+    source.failure_count = 0
+    source.circuit_open_until = None
+    _transition(source, CircuitState.closed)
+
+
+def record_failure(source: Source, now: datetime | None = None) -> None:
+    source.failure_count += 1
+    if source.failure_count < get_settings().circuit_failure_threshold:
+        return
+    source.circuit_open_until = (now or now_utc()) + circuit_backoff(source.failure_count)
+    _transition(source, CircuitState.open)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import get_settings
+
+try:
+    from playwright.async_api import Error as PlaywrightError
+    from playwright.async_api import async_playwright
+except Exception:  # noqa: BLE001
+    async_playwright = None  # type: ignore[assignment]
+    PlaywrightError = Exception  # type: ignore[assignment,misc]
+
+logger = logging.getLogger(__name__)
+
+WAIT_UNTIL_VALUES = {"commit", "domcontentloaded", "load", "networkidle"}
+
+
+@dataclass(frozen=True)
+class WaitStrategy:
+    wait_until: str = "domcontentloaded"
+    selector: str | None = None
+    timeout_ms: int = 15000
+    settle_ms: int = 0
+
+    @classmethod
+    def from_config(cls, config: dict) -> WaitStrategy:
+        wait_until = str(config.get("dynamic_wait_until") or cls.wait_until)
+        if wait_until not in WAIT_UNTIL_VALUES:
+            raise ValueError(f"Unsupported dynamic_wait_until: {wait_until}")
+        return cls(
+            wait_until=wait_until,
+            selector=config.get("dynamic_wait_selector") or None,
+            timeout_ms=int(config.get("dynamic_timeout_ms") or cls.timeout_ms),
+            settle_ms=int(config.get("dynamic_settle_ms") or 0),
+        )
+
+
+@dataclass
+class _PooledContext:
+    context: Any
+    uses: int = 0
+    broken: bool = False
+
+
+class BrowserPool:
+    def __init__(self, max_contexts: int, max_uses: int, blocked_resources: set[str]) -> None:
+        self._max_uses = max(1, max_uses)
+        self._blocked = blocked_resources
+        self._slots = asyncio.Semaphore(max(1, max_contexts))
+        self._idle: list[_PooledContext] = []
+        self._launch_lock = asyncio.Lock()
+        self._playwright: Any = None
+        self._browser: Any = None
+        self.launches = 0
+        self.contexts_created = 0
+
+    async def _ensure_browser(self) -> Any:
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._browser is not None:
+                logger.warning("Headless browser disconnected, relaunching")
+                self._idle.clear()
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self.launches += 1
+            return self._browser
+
+    async def _block_route(self, route: Any) -> None:
+        if route.request.resource_type in self._blocked:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _acquire_context(self) -> _PooledContext:
+        browser = await self._ensure_browser()
+        while self._idle:
+            pooled = self._idle.pop()
+            if pooled.context.browser is browser:
+                return pooled
+        context = await browser.new_context()
+        if self._blocked:
+            await context.route("**/*", self._block_route)
+        self.contexts_created += 1
+        return _PooledContext(context=context)
+
+    async def _release_context(self, pooled: _PooledContext) -> None:
+        pooled.uses += 1
+        if pooled.broken or pooled.uses >= self._max_uses:
+            try:
+                await pooled.context.close()
+            except PlaywrightError:
+                pass
+            return
+        self._idle.append(pooled)
+
+    async def fetch(self, url: str, wait: WaitStrategy | None = None) -> str:
+        wait = wait or WaitStrategy()
+        async with self._slots:
+            pooled = await self._acquire_context()
+            page = None
+            try:
+                page = await pooled.context.new_page()
+                page.on("crash", lambda _: setattr(pooled, "broken", True))
+                await page.goto(url, wait_until=wait.wait_until, timeout=wait.timeout_ms)
+                if wait.selector:
+                    await page.wait_for_selector(wait.selector, timeout=wait.timeout_ms)
+                if wait.settle_ms:
+                    await page.wait_for_timeout(wait.settle_ms)
+                return await page.content()
+            except PlaywrightError:
+                pooled.broken = pooled.broken or page is None or page.is_closed()
+                raise
+            finally:
+                if page is not None and not page.is_closed():
+                    try:
+                        await page.close()
+                    except PlaywrightError:
+                        pooled.broken = True
+                await self._release_context(pooled)
+
+    async def aclose(self) -> None:
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            try:
+                await pooled.context.close()
+            except PlaywrightError:
+                pass
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool] = weakref.WeakKeyDictionary()
+
+
+def browser_available() -> bool:
+    return async_playwright is not None
+
+
+def get_browser_pool() -> BrowserPool:
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        settings = get_settings()
+        blocked = {item.strip() for item in settings.browser_blocked_resources.split(",") if item.strip()}
+        pool = BrowserPool(
+            max_contexts=settings.browser_max_contexts,
+            max_uses=settings.browser_context_max_uses,
+            blocked_resources=blocked,
+        )
+        _pools[loop] = pool
+    return pool
+
+
+async def close_browser_pool() -> None:
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.aclose()
@@ -1,3 +1,4 @@
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 
 from pydantic import BaseModel, Field
@@ -6,6 +7,7 @@ from pydantic import BaseModel, Field
 class IngestedItem(BaseModel):
     external_id: str
     url: str
+    canonical_url: str | None = None
     title: str | None = None
     published_at: datetime | None = None
     raw_text: str | None = None
@@ -17,3 +19,27 @@ def normalize_text(text: str | None) -> str:
     if not text:
         return ""
     return " ".join(text.split())
+
+
+EmitBatch = Callable[[list[IngestedItem]], Awaitable[None]]
+
+
+class ItemBatcher:
+    def __init__(self, on_batch: EmitBatch | None, size: int) -> None:
+        self.items: list[IngestedItem] = []
+        self.count = 0
+        self._on_batch = on_batch
+        self._size = max(1, size)
+
+    async def add(self, item: IngestedItem) -> None:
+        self.items.append(item)
+        self.count += 1
+        if self._on_batch is not None and len(self.items) >= self._size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        # Without a callback items are kept and returned whole.
+        if self._on_batch is None or not self.items:
+            return
+        batch, self.items = self.items, []
+        await self._on_batch(batch)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import codecs
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.http import get_http_client
+from app.core.observability import INGEST_BYTES_DOWNLOADED
+
+FEED_CONTENT_TYPES = ("xml", "rss", "atom", "text/html", "text/plain")
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+XML_CONTENT_TYPES = ("xml", "text/plain")
+JSON_CONTENT_TYPES = ("json", "text/plain")
+
+
+class DownloadError(ValueError):
+    pass
+
+
+class DownloadTooLarge(DownloadError):
+    pass
+
+
+class UnexpectedContentType(DownloadError):
+    pass
+
+
+@dataclass
+class DownloadBudget:
+    label: str
+    max_bytes: int
+    bytes_downloaded: int = 0
+
+
+@dataclass
+class Download:
+    url: str
+    status_code: int
+    headers: httpx.Headers
+    text: str
+
+
+_budget: ContextVar[DownloadBudget | None] = ContextVar("download_budget", default=None)
+
+
+@contextmanager
+def download_budget(label: str, max_bytes: int | None = None) -> Iterator[DownloadBudget]:
+    budget = DownloadBudget(label=label, max_bytes=max_bytes or get_settings().ingest_max_download_bytes)
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget.reset(token)
+
+
+def _current_budget() -> DownloadBudget:
+    return _budget.get() or DownloadBudget(label="unscoped", max_bytes=get_settings().ingest_max_download_bytes)
+
+
+def max_download_bytes() -> int:
+    return _current_budget().max_bytes
+
+
+def _check_headers(response: httpx.Response, allowed_types: tuple[str, ...], max_bytes: int) -> None:
+    content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type and allowed_types and not any(allowed in content_type for allowed in allowed_types):
+        raise UnexpectedContentType(f"Unexpected content type {content_type!r} from {response.url}")
+    length = response.headers.get("content-length")
+    if length and length.isdigit() and int(length) > max_bytes:
+        raise DownloadTooLarge(f"Response from {response.url} declares {length} bytes, limit is {max_bytes}")
+
+
+async def iter_limited_bytes(
+    response: httpx.Response, allowed_types: tuple[str, ...] = ()
+) -> AsyncIterator[bytes]:
+    # Headers are checked before any body byte is read; the cap counts decoded bytes so a
+    # compressed response cannot expand past it.
+    budget = _current_budget()
+    _check_headers(response, allowed_types, budget.max_bytes)
+    received = 0
+    async for chunk in response.aiter_bytes():
+        received += len(chunk)
+        budget.bytes_downloaded += len(chunk)
+        INGEST_BYTES_DOWNLOADED.labels(budget.label).inc(len(chunk))
+        if received > budget.max_bytes:
+            raise DownloadTooLarge(f"Response from {response.url} exceeded {budget.max_bytes} bytes")
+        yield chunk
+
+
+def _text_decoder(response: httpx.Response) -> codecs.IncrementalDecoder:
+    try:
+        factory = codecs.getincrementaldecoder(response.charset_encoding or "utf-8")
+    except LookupError:
+        factory = codecs.getincrementaldecoder("utf-8")
+    return factory(errors="replace")
+
+
+async def download_text(
+    url: str,
+    allowed_types: tuple[str, ...],
+    *,
+    method: str = "GET",
+    params: dict | None = None,
+    data: dict | None = None,
+    headers: dict | None = None,
+) -> Download:
+    client = get_http_client()
+    async with client.stream(method, url, params=params, data=data, headers=headers) as response:
+        if response.status_code == 304:
+            return Download(url=str(response.url), status_code=304, headers=response.headers, text="")
+        response.raise_for_status()
+        decoder = _text_decoder(response)
+        parts = [decoder.decode(chunk) async for chunk in iter_limited_bytes(response, allowed_types)]
+        parts.append(decoder.decode(b"", final=True))
+        return Download(
+            url=str(response.url), status_code=response.status_code, headers=response.headers, text="".join(parts)
+        )
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from time import perf_counter
+from urllib.parse import urlparse
+
+from app.models.entities import Source, SourceMethod
+from app.services.ingestion.common import EmitBatch, IngestedItem
+from app.services.ingestion.pubmed import EUTILS
+
+PUBMED_HOST = urlparse(EUTILS).hostname
+
+
+@dataclass
+class SourceFetch:
+    items: list[IngestedItem] = field(default_factory=list)
+    cursor: dict | None = None
+    stats: dict = field(default_factory=dict)
+    skip_reason: str | None = None
+    bytes_downloaded: int = 0
+
+
+@dataclass
+class SourceFetchResult:
+    source_id: int
+    host: str | None
+    fetch: SourceFetch | None = None
+    error: Exception | None = None
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class ItemBatch:
+    source_id: int
+    items: list[IngestedItem]
+
+
+@dataclass
+class IngestionRunSummary:
+    sources: int = 0
+    failures: int = 0
+    wall_clock_seconds: float = 0.0
+    source_seconds_total: float = 0.0
+    # Time the consumer spent persisting batches; fetches keep running while it does.
+    store_seconds: float = 0.0
+    per_source_seconds: dict[int, float] = field(default_factory=dict)
+
+    @property
+    def speedup(self) -> float:
+        if self.wall_clock_seconds <= 0:
+            return 1.0
+        return self.source_seconds_total / self.wall_clock_seconds
+
+    def as_dict(self) -> dict:
+        return {
+            "sources": self.sources,
+            "failures": self.failures,
+            "wall_clock_seconds": round(self.wall_clock_seconds, 3),
+            "source_seconds_total": round(self.source_seconds_total, 3),
+            "speedup": round(self.speedup, 2),
+            "store_seconds": round(self.store_seconds, 3),
+        }
+
+
+def source_host(source: Source) -> str | None:
+    if source.method == SourceMethod.pubmed:
+        return PUBMED_HOST
+    url = (source.config_json or {}).get("url")
+    if not url:
+        return None
+    return (urlparse(str(url)).hostname or "").lower() or None
+
+
+class _FetchLimiter:
+    def __init__(self, max_concurrency: int, per_host_concurrency: int) -> None:
+        self._global = asyncio.Semaphore(max(1, max_concurrency))
+        self._per_host = max(1, per_host_concurrency)
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    async def run(self, source: Source, fetch: Callable[[Source], Awaitable[SourceFetch]]) -> SourceFetchResult:
+        host = source_host(source)
+        result = SourceFetchResult(source_id=source.id, host=host)
+        host_limit = None
+        if host:
+            host_limit = self._hosts.setdefault(host, asyncio.Semaphore(self._per_host))
+        async with self._global:
+            if host_limit is not None:
+                await host_limit.acquire()
+            started = perf_counter()
+            try:
+                result.fetch = await fetch(source)
+            except Exception as exc:  # noqa: BLE001
+                result.error = exc
+            finally:
+                result.elapsed_seconds = perf_counter() - started
+                if host_limit is not None:
+                    host_limit.release()
+        return result
+
+
+def _summarize(results: list[SourceFetchResult], started: float) -> IngestionRunSummary:
+    return IngestionRunSummary(
+        sources=len(results),
+        failures=sum(1 for result in results if result.error is not None),
+        wall_clock_seconds=perf_counter() - started,
+        source_seconds_total=sum(result.elapsed_seconds for result in results),
+        per_source_seconds={result.source_id: result.elapsed_seconds for result in results},
+    )
+
+
+class SourceFetchStream:
+    def __init__(
+        self,
+        sources: Sequence[Source],
+        fetch: Callable[[Source, EmitBatch], Awaitable[SourceFetch]],
+        max_concurrency: int,
+        per_host_concurrency: int,
+        queue_size: int,
+    ) -> None:
+        self._sources = sources
+        self._fetch = fetch
+        self._limiter = _FetchLimiter(max_concurrency, per_host_concurrency)
+        self._queue_size = max(1, queue_size)
+        self.summary = IngestionRunSummary()
+
+    async def __aiter__(self) -> AsyncIterator[ItemBatch | SourceFetchResult]:
+        # Bounded, so a fast fetcher waits for the consumer instead of buffering a whole backfill.
+        queue: asyncio.Queue[ItemBatch | SourceFetchResult] = asyncio.Queue(maxsize=self._queue_size)
+
+        async def _run(source: Source) -> None:
+            async def emit(items: list[IngestedItem]) -> None:
+                if items:
+                    await queue.put(ItemBatch(source_id=source.id, items=items))
+
+            await queue.put(await self._limiter.run(source, lambda current: self._fetch(current, emit)))
+
+        started = perf_counter()
+        tasks = [asyncio.create_task(_run(source)) for source in self._sources]
+        results: list[SourceFetchResult] = []
+        try:
+            while len(results) < len(tasks):
+                event = await queue.get()
+                if isinstance(event, SourceFetchResult):
+                    results.append(event)
+                yield event
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.summary = _summarize(results, started)
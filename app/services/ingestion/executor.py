@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from app.core.config import get_settings
+
+EXECUTOR_KINDS = {"process", "thread", "inline"}
+
+logger = logging.getLogger(__name__)
+
+_executors: dict[str, Executor] = {}
+_lock = threading.Lock()
+_fallback_warned = False
+
+
+def cpu_executor_kind() -> str:
+    global _fallback_warned
+    kind = get_settings().ingest_parse_executor
+    if kind not in EXECUTOR_KINDS:
+        raise ValueError(f"Unknown ingest parse executor: {kind}")
+    if kind == "process" and multiprocessing.current_process().daemon:
+        # Celery prefork children are daemonic and cannot start their own processes.
+        if not _fallback_warned:
+            _fallback_warned = True
+            logger.warning(
+                "INGEST_PARSE_EXECUTOR=process is unavailable in a daemonic worker process; parsing on "
+                "threads instead (run the worker with --pool=threads or --pool=solo for the process pool)"
+            )
+        return "thread"
+    return kind
+
+
+def get_executor(kind: str) -> Executor | None:
+    if kind == "inline":
+        return None
+    with _lock:
+        executor = _executors.get(kind)
+        if executor is None:
+            workers = max(1, get_settings().ingest_parse_workers)
+            if kind == "process":
+                executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest-parse")
+            _executors[kind] = executor
+        return executor
+
+
+async def _run[T](kind: str, func: Callable[..., T], *args: Any) -> T:
+    executor = get_executor(kind)
+    if executor is None:
+        return func(*args)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        with _lock:
+            if _executors.get(kind) is executor:
+                del _executors[kind]
+        raise
+
+
+async def run_cpu_bound[T](func: Callable[..., T], *args: Any) -> T:
+    # func and args cross a process boundary: use module-level functions and plain data.
+    return await _run(cpu_executor_kind(), func, *args)
+
+
+async def run_in_thread[T](func: Callable[..., T], *args: Any) -> T:
+    # For stateful work (incremental parsers) that cannot be pickled to a worker process.
+    kind = "inline" if get_settings().ingest_parse_executor == "inline" else "thread"
+    return await _run(kind, func, *args)
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def reset_executors() -> None:
+    # Pools inherited through fork belong to the parent process.
+    with _lock:
+        _executors.clear()
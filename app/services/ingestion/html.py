@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-import httpx
+import asyncio
+import logging
+import re
+from typing import Any
+from urllib.parse import urldefrag, urljoin, urlparse
+
 import trafilatura
 from bs4 import BeautifulSoup
-from typing import Any
 
 from app.core.config import get_settings
-from app.services.ingestion.common import IngestedItem
-from app.utils.network import assert_allowed_url
+from app.services.ingestion.browser import WaitStrategy, browser_available, get_browser_pool
+from app.services.ingestion.common import EmitBatch, IngestedItem, ItemBatcher
+from app.services.ingestion.download import HTML_CONTENT_TYPES, Download, download_text
+from app.services.ingestion.executor import run_cpu_bound
+from app.utils.hashing import sha256_text
+from app.utils.network import assert_allowed_url_async
+from app.utils.urls import canonical_link
+
+logger = logging.getLogger(__name__)
 
-try:
-    from playwright.async_api import async_playwright
-except Exception:  # noqa: BLE001
-    async_playwright = None  # type: ignore[assignment]
+_VOLATILE_HTML = re.compile(r"<script\b.*?</script>|<style\b.*?</style>|<!--.*?-->", re.IGNORECASE | re.DOTALL)
 
 
 def _extract_with_bs4(html: str, selectors: list[str] | None = None) -> str:
@@ -29,45 +37,178 @@ def _extract_with_bs4(html: str, selectors: list[str] | None = None) -> str:
     )
 
 
-async def _fetch_dynamic_html(url: str) -> str | None:
-    if async_playwright is None:
+def _extract_text(html: str, selectors: list[str] | None = None) -> str:
+    return trafilatura.extract(html) or _extract_with_bs4(html, selectors)
+
+
+async def _fetch_dynamic_html(url: str, wait: WaitStrategy | None = None) -> str | None:
+    if not browser_available():
         return None
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        try:
-            page = await browser.new_page()
-            await page.goto(url, wait_until="domcontentloaded", timeout=15000)
-            return await page.content()
-        finally:
-            await browser.close()
-
-
-async def fetch_html_items(url: str, selectors: list[str] | None = None) -> list[IngestedItem]:
-    assert_allowed_url(url)
-    settings = get_settings()
-    async with httpx.AsyncClient(timeout=settings.ingest_http_timeout_seconds, follow_redirects=False) as client:
-        response = await client.get(url)
-        response.raise_for_status()
+    return await get_browser_pool().fetch(url, wait)
 
+
+async def fetch_page_item(
+    url: str, selectors: list[str] | None = None, wait: WaitStrategy | None = None, title: str | None = None
+) -> IngestedItem:
+    await assert_allowed_url_async(url)
+    response = await download_text(url, HTML_CONTENT_TYPES)
+    return await _item_from_response(url, response, selectors, wait, title)
+
+
+async def _item_from_response(
+    url: str,
+    response: Download,
+    selectors: list[str] | None = None,
+    wait: WaitStrategy | None = None,
+    title: str | None = None,
+) -> IngestedItem:
     html = response.text
-    text = trafilatura.extract(html)
-    if not text:
-        text = _extract_with_bs4(html, selectors)
+    text = await run_cpu_bound(_extract_text, html, selectors)
 
     # Optional JS fallback.
     if not text:
-        dynamic_html = await _fetch_dynamic_html(url)
+        dynamic_html = await _fetch_dynamic_html(url, wait)
         if dynamic_html:
-            text = trafilatura.extract(dynamic_html) or _extract_with_bs4(dynamic_html, selectors)
+            text = await run_cpu_bound(_extract_text, dynamic_html, selectors)
             html = dynamic_html
 
-    return [
-        IngestedItem(
-            external_id=url,
-            url=url,
-            title=None,
-            raw_text=text,
-            raw_html=html,
-            http_meta={"status_code": response.status_code, "selector_profile": selectors or []},
-        )
-    ]
+    return IngestedItem(
+        external_id=url,
+        url=url,
+        canonical_url=canonical_link(html, url),
+        title=title,
+        raw_text=text,
+        raw_html=html,
+        http_meta={
+            "status_code": response.status_code,
+            "selector_profile": selectors or [],
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        },
+    )
+
+
+def html_fingerprint(html: str) -> str:
+    # Scripts, styles and comments carry nonces, cache busters and tracking ids that change
+    # on every request without the readable content changing.
+    body = _VOLATILE_HTML.sub(" ", html)
+    return sha256_text(" ".join(body.split()))
+
+
+async def fetch_html_items(
+    url: str,
+    selectors: list[str] | None = None,
+    wait: WaitStrategy | None = None,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    fingerprint: str | None = None,
+) -> tuple[list[IngestedItem], dict]:
+    await assert_allowed_url_async(url)
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    response = await download_text(url, HTML_CONTENT_TYPES, headers=headers)
+    if response.status_code == 304:
+        return [], {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fingerprint": fingerprint,
+            "skip_reason": "not_modified",
+        }
+
+    validators = {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+        "fingerprint": html_fingerprint(response.text),
+    }
+    if fingerprint and validators["fingerprint"] == fingerprint:
+        return [], {**validators, "skip_reason": "content_unchanged"}
+    item = await _item_from_response(url, response, selectors, wait)
+    return [item], {**validators, "skip_reason": None}
+
+
+def _extract_links(
+    html: str, base_url: str, selectors: list[str], link_pattern: str | None = None
+) -> list[tuple[str, str | None]]:
+    soup = BeautifulSoup(html, "html.parser")
+    pattern = re.compile(link_pattern) if link_pattern else None
+    links: dict[str, str | None] = {}
+    for selector in selectors or ["a[href]"]:
+        for node in soup.select(selector):
+            anchors = [node] if node.name == "a" else node.select("a[href]")
+            for anchor in anchors:
+                href = anchor.get("href")
+                if not isinstance(href, str) or not href.strip():
+                    continue
+                link = urldefrag(urljoin(base_url, href.strip())).url
+                if urlparse(link).scheme not in {"http", "https"} or link == base_url:
+                    continue
+                if pattern and not pattern.search(link):
+                    continue
+                links.setdefault(link, anchor.get_text(" ", strip=True) or None)
+    return list(links.items())
+
+
+async def fetch_html_listing(
+    url: str,
+    selectors: list[str],
+    cursor_json: dict,
+    article_selectors: list[str] | None = None,
+    link_pattern: str | None = None,
+    wait: WaitStrategy | None = None,
+    on_batch: EmitBatch | None = None,
+) -> tuple[list[IngestedItem], dict]:
+    settings = get_settings()
+    await assert_allowed_url_async(url)
+    response = await download_text(url, HTML_CONTENT_TYPES)
+    links = await run_cpu_bound(_extract_links, response.text, response.url, selectors, link_pattern)
+
+    seen = list(cursor_json.get("seen_links") or [])
+    seen_set = set(seen)
+    failures: dict[str, int] = dict(cursor_json.get("failed_links") or {})
+    new_links = [(link, title) for link, title in links if link not in seen_set]
+    # Links that failed before queue behind fresh ones, so a broken article cannot starve the batch.
+    new_links.sort(key=lambda entry: failures.get(entry[0], 0))
+    batch = new_links[: max(1, settings.html_listing_max_new_per_poll)]
+    limit = asyncio.Semaphore(max(1, settings.html_listing_concurrency))
+    # Articles are handed on as they arrive, so a large listing is not held until the last fetch.
+    batcher = ItemBatcher(on_batch, settings.ingest_upsert_batch_size)
+
+    async def _fetch_article(link: str, title: str | None) -> bool:
+        async with limit:
+            try:
+                item = await fetch_page_item(link, article_selectors, wait, title=title)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Listing article fetch failed for %s: %s", link, exc)
+                return False
+        await batcher.add(item)
+        return True
+
+    fetched = await asyncio.gather(*(_fetch_article(link, title) for link, title in batch))
+    await batcher.flush()
+    done_links: list[str] = []
+    abandoned = 0
+    for (link, _), ok in zip(batch, fetched, strict=True):
+        if ok:
+            failures.pop(link, None)
+            done_links.append(link)
+            continue
+        failures[link] = failures.get(link, 0) + 1
+        if failures[link] >= max(1, settings.html_listing_max_attempts):
+            # Give up: mark it seen so it stops taking a slot on every poll.
+            del failures[link]
+            done_links.append(link)
+            abandoned += 1
+    listed = {link for link, _ in links}
+    seen = (done_links + seen)[: settings.html_listing_seen_limit]
+    return batcher.items, {
+        **cursor_json,
+        "seen_links": seen,
+        "failed_links": {link: count for link, count in failures.items() if link in listed},
+        "listing_links": len(links),
+        "listing_new_links": len(new_links),
+        "listing_failures": len(batch) - batcher.count,
+        "listing_abandoned": abandoned,
+    }
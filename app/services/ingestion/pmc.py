@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+import zstandard
+
+from app.core.config import get_settings
+from app.core.time import now_utc
+from app.services.ingestion.pubmed import eutils_get, with_api_key
+
+PMC_LINKNAME = "pubmed_pmc"
+FULLTEXT_PENDING = "pending"
+FULLTEXT_FETCHING = "fetching"
+
+
+@dataclass
+class FulltextTarget:
+    document_id: int
+    pmid: str | None = None
+    doi: str | None = None
+    pmcid: str | None = None
+
+
+@dataclass
+class FulltextResult:
+    status: str
+    pmcid: str | None = None
+    text: str | None = None
+    cached: bool = False
+
+
+class FulltextCache:
+    def __init__(self, root: Path, level: int = 6) -> None:
+        self._root = root
+        self._level = level
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.lower().encode()).hexdigest()
+        return self._root / digest[:2] / f"{digest}.json.zst"
+
+    def get(self, key: str) -> dict | None:
+        try:
+            data = self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        return json.loads(zstandard.ZstdDecompressor().decompress(data))
+
+    def put(self, key: str, value: dict) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zstandard.ZstdCompressor(level=self._level).compress(json.dumps(value).encode())
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(compressed)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+@lru_cache(maxsize=4)
+def get_fulltext_cache(path: str) -> FulltextCache:
+    return FulltextCache(Path(path), level=get_settings().blob_store_zstd_level)
+
+
+def _section_wanted(section: ET.Element, wanted: tuple[str, ...]) -> bool:
+    label = f"{section.get('sec-type') or ''} {section.findtext('title') or ''}".lower()
+    return any(keyword in label for keyword in wanted)
+
+
+def _section_text(section: ET.Element) -> str:
+    paragraphs = [" ".join("".join(node.itertext()).split()) for node in section.iter("p")]
+    return "\n".join(paragraph for paragraph in paragraphs if paragraph)
+
+
+def extract_sections(xml_text: str, wanted: tuple[str, ...]) -> str | None:
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        return None
+    body = root.find(".//body")
+    # Articles outside the open-access subset come back with front matter only.
+    if body is None:
+        return None
+    parts = []
+    for section in body.findall("sec"):
+        if not _section_wanted(section, wanted):
+            continue
+        text = _section_text(section)
+        if text:
+            parts.append(f"## {' '.join((section.findtext('title') or '').split())}\n{text}")
+    return "\n\n".join(parts) or None
+
+
+async def map_pmids_to_pmcids(pmids: list[str]) -> dict[str, str]:
+    settings = get_settings()
+    mapping: dict[str, str] = {}
+    batch_size = max(1, settings.pmc_idmap_batch_size)
+    for start in range(0, len(pmids), batch_size):
+        batch = pmids[start : start + batch_size]
+        # One `id` parameter per PMID keeps the linksets separate, so each maps back to its PMID.
+        response = await eutils_get(
+            "elink.fcgi",
+            with_api_key({"dbfrom": "pubmed", "db": "pmc", "linkname": PMC_LINKNAME, "retmode": "json", "id": batch}),
+        )
+        for linkset in json.loads(response.text).get("linksets", []):
+            ids = [str(value) for value in linkset.get("ids", [])]
+            for linksetdb in linkset.get("linksetdbs", []):
+                links = linksetdb.get("links") or []
+                if linksetdb.get("linkname") == PMC_LINKNAME and ids and links:
+                    mapping[ids[0]] = f"PMC{links[0]}"
+    return mapping
+
+
+async def fetch_pmc_sections(pmcid: str) -> str | None:
+    settings = get_settings()
+    response = await eutils_get(
+        "efetch.fcgi", with_api_key({"db": "pmc", "id": pmcid.removeprefix("PMC"), "retmode": "xml"})
+    )
+    wanted = tuple(item.strip().lower() for item in settings.pmc_fulltext_sections.split(",") if item.strip())
+    return extract_sections(response.text, wanted)
+
+
+def _cache_keys(target: FulltextTarget, pmcid: str | None) -> list[str]:
+    keys = [f"pmcid:{pmcid}"] if pmcid else []
+    if target.doi:
+        keys.append(f"doi:{target.doi.lower()}")
+    if target.pmid:
+        keys.append(f"pmid:{target.pmid}")
+    return keys
+
+
+def _cached_result(cache: FulltextCache, target: FulltextTarget) -> FulltextResult | None:
+    settings = get_settings()
+    for key in _cache_keys(target, target.pmcid):
+        entry = cache.get(key)
+        if entry is None:
+            continue
+        if not entry.get("text"):
+            # "Not in PMC" and "in PMC without open-access body" both go stale: embargoed papers
+            # join the open-access subset later.
+            checked_at = entry.get("checked_at")
+            max_age = timedelta(days=settings.pmc_negative_cache_days)
+            if not checked_at or now_utc() - datetime.fromisoformat(checked_at) > max_age:
+                continue
+            return FulltextResult(status="unavailable", pmcid=entry.get("pmcid"), cached=True)
+        return FulltextResult(status="enriched", pmcid=entry["pmcid"], text=entry["text"], cached=True)
+    return None
+
+
+async def enrich_fulltext(targets: list[FulltextTarget]) -> dict[int, FulltextResult]:
+    settings = get_settings()
+    cache = get_fulltext_cache(settings.pmc_cache_path)
+    results: dict[int, FulltextResult] = {}
+    pending: list[FulltextTarget] = []
+    for target in targets:
+        cached = _cached_result(cache, target)
+        if cached is not None:
+            results[target.document_id] = cached
+        elif target.pmcid or target.pmid:
+            pending.append(target)
+        else:
+            results[target.document_id] = FulltextResult(status="unavailable")
+
+    unmapped = sorted({target.pmid for target in pending if not target.pmcid and target.pmid})
+    mapping = await map_pmids_to_pmcids(unmapped) if unmapped else {}
+    limit = asyncio.Semaphore(max(1, settings.pmc_fulltext_concurrency))
+    checked_at = now_utc().isoformat()
+
+    async def _fetch(target: FulltextTarget) -> None:
+        pmcid = target.pmcid or mapping.get(target.pmid or "")
+        if not pmcid:
+            for key in _cache_keys(target, None):
+                cache.put(key, {"pmcid": None, "checked_at": checked_at})
+            results[target.document_id] = FulltextResult(status="unavailable")
+            return
+        try:
+            async with limit:
+                text = await fetch_pmc_sections(pmcid)
+        except Exception:  # noqa: BLE001
+            results[target.document_id] = FulltextResult(status="failed", pmcid=pmcid)
+            return
+        entry = {"pmcid": pmcid, "doi": target.doi, "text": text, "checked_at": checked_at}
+        for key in _cache_keys(target, pmcid):
+            cache.put(key, entry)
+        results[target.document_id] = FulltextResult(
+            status="enriched" if text else "unavailable", pmcid=pmcid, text=text
+        )
+
+    await asyncio.gather(*(_fetch(target) for target in pending))
+    return results
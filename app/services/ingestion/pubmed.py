@@ -1,14 +1,34 @@
+import json
 import re
 import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from datetime import timedelta
+from typing import cast
 
 import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from app.core.config import get_settings
+from app.core.http import get_http_client
+from app.core.time import now_utc
 from app.services.ingestion.common import IngestedItem
+from app.services.ingestion.download import (
+    JSON_CONTENT_TYPES,
+    XML_CONTENT_TYPES,
+    Download,
+    download_text,
+    iter_limited_bytes,
+)
+from app.services.ingestion.executor import run_in_thread
 
 EUTILS = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
 DOI_PATTERN = re.compile(r"10\.\d{4,9}/[-._;()/:A-Z0-9]+", re.IGNORECASE)
+EUTILS_DATE_FORMAT = "%Y/%m/%d"
+# ESearch will not page past the first 10,000 hits of a query.
+ESEARCH_MAX_RECORDS = 10000
+EUTILS_CONTENT_TYPES = JSON_CONTENT_TYPES + XML_CONTENT_TYPES
+# No date filter: the cursor's edat mindate/maxdate window bounds each incremental search.
+DEFAULT_PUBMED_QUERY = '(longevity OR "health span" OR aging)'
 
 
 @retry(
@@ -17,12 +37,16 @@ DOI_PATTERN = re.compile(r"10\.\d{4,9}/[-._;()/:A-Z0-9]+", re.IGNORECASE)
     retry=retry_if_exception_type(httpx.HTTPError),
     reraise=True,
 )
-async def _eutils_get(path: str, params: dict) -> httpx.Response:
+async def eutils_get(path: str, params: dict, data: dict | None = None) -> Download:
+    method = "POST" if data is not None else "GET"
+    return await download_text(f"{EUTILS}/{path}", EUTILS_CONTENT_TYPES, method=method, params=params, data=data)
+
+
+def with_api_key(params: dict) -> dict:
     settings = get_settings()
-    async with httpx.AsyncClient(timeout=settings.ingest_http_timeout_seconds) as client:
-        response = await client.get(f"{EUTILS}/{path}", params=params)
-    response.raise_for_status()
-    return response
+    if settings.ncbi_api_key:
+        params["api_key"] = settings.ncbi_api_key
+    return params
 
 
 def _extract_doi(text: str) -> str | None:
@@ -30,60 +54,179 @@ def _extract_doi(text: str) -> str | None:
     return match.group(0) if match else None
 
 
-async def fetch_pubmed_items(query: str, retmax: int = 20) -> list[IngestedItem]:
+def _article_to_item(article: ET.Element) -> IngestedItem | None:
+    pmid = article.findtext(".//PMID")
+    title = article.findtext(".//ArticleTitle") or ""
+    abstract_nodes = article.findall(".//Abstract/AbstractText")
+    abstract = "\n".join(["".join(node.itertext()) for node in abstract_nodes])
+    if not pmid:
+        return None
+
+    doi = article.findtext(".//ArticleId[@IdType='doi']") or _extract_doi(abstract)
+    pmcid = article.findtext("./PubmedData/ArticleIdList/ArticleId[@IdType='pmc']")
+    url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
+    external_id = f"pmid:{pmid}"
+    if doi:
+        external_id = f"doi:{doi.lower()}"
+
+    return IngestedItem(
+        external_id=external_id,
+        url=url,
+        title=title,
+        raw_text=abstract,
+        raw_html=abstract,
+        http_meta={"provider": "pubmed", "pmid": pmid, "doi": doi, "pmcid": pmcid},
+    )
+
+
+class PubmedArticleStream:
+    def __init__(self) -> None:
+        self._parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+        self._root: ET.Element | None = None
+        self.failed = False
+
+    def feed(self, chunk: bytes) -> list[IngestedItem]:
+        if self.failed:
+            return []
+        try:
+            self._parser.feed(chunk)
+            return self._drain()
+        except ET.ParseError:
+            self.failed = True
+            return []
+
+    def close(self) -> list[IngestedItem]:
+        if self.failed:
+            return []
+        try:
+            self._parser.close()
+            return self._drain()
+        except ET.ParseError:
+            self.failed = True
+            return []
+
+    def _drain(self) -> list[IngestedItem]:
+        items: list[IngestedItem] = []
+        events = cast(Iterator[tuple[str, ET.Element]], self._parser.read_events())
+        for event, element in events:
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+            if element.tag != "PubmedArticle":
+                continue
+            item = _article_to_item(element)
+            if item:
+                items.append(item)
+            # Finished articles are dropped from the tree so memory stays bounded by one article.
+            element.clear()
+            if self._root is not None:
+                self._root.clear()
+        return items
+
+
+async def iter_pubmed_articles(chunks: AsyncIterator[bytes]) -> AsyncIterator[IngestedItem]:
+    stream = PubmedArticleStream()
+    # The pull parser keeps state between chunks, so it runs on a thread rather than a process.
+    async for chunk in chunks:
+        for item in await run_in_thread(stream.feed, chunk):
+            yield item
+    for item in await run_in_thread(stream.close):
+        yield item
+
+
+@retry(
+    wait=wait_exponential(multiplier=1, min=1, max=8),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception_type(httpx.HTTPError),
+    reraise=True,
+)
+async def _efetch_items(params: dict) -> list[IngestedItem]:
+    async with get_http_client().stream("GET", f"{EUTILS}/efetch.fcgi", params=params) as response:
+        response.raise_for_status()
+        chunks = iter_limited_bytes(response, XML_CONTENT_TYPES)
+        return [item async for item in iter_pubmed_articles(chunks)]
+
+
+async def fetch_pubmed_incremental(
+    query: str,
+    cursor: dict,
+    on_batch: Callable[[list[IngestedItem]], Awaitable[None]] | None = None,
+) -> tuple[list[IngestedItem], dict]:
     settings = get_settings()
-    params = {
+    today = now_utc().date()
+    mindate = cursor.get("maxdate") or (
+        today - timedelta(days=settings.pubmed_lookback_days)
+    ).strftime(EUTILS_DATE_FORMAT)
+    maxdate = today.strftime(EUTILS_DATE_FORMAT)
+
+    search_params = {
         "db": "pubmed",
         "term": query,
         "retmode": "json",
         "sort": "pub+date",
-        "retmax": retmax,
+        "usehistory": "y",
+        "datetype": "edat",
+        "mindate": mindate,
+        "maxdate": maxdate,
+        "retmax": settings.pubmed_max_records,
     }
-    if settings.ncbi_api_key:
-        params["api_key"] = settings.ncbi_api_key
-
-    search = await _eutils_get("esearch.fcgi", params)
-    ids = search.json().get("esearchresult", {}).get("idlist", [])
-    if not ids:
-        return []
-
-    fetch_params = {
-        "db": "pubmed",
-        "id": ",".join(ids),
-        "retmode": "xml",
+    search = await eutils_get("esearch.fcgi", with_api_key(dict(search_params)))
+    result = json.loads(search.text).get("esearchresult", {})
+    ids: list[str] = list(result.get("idlist", []))
+    count = int(result.get("count") or len(ids))
+    # esearch returns at most retmax ids per call; page until the window's full count is listed.
+    while len(ids) < min(count, ESEARCH_MAX_RECORDS):
+        page = await eutils_get("esearch.fcgi", with_api_key({**search_params, "retstart": len(ids)}))
+        page_ids = json.loads(page.text).get("esearchresult", {}).get("idlist", [])
+        if not page_ids:
+            break
+        ids.extend(page_ids)
+    seen = set(cursor.get("recent_pmids") or [])
+    new_ids = [pmid for pmid in ids if pmid not in seen]
+    # The cursor window overlaps by a day; the PMID ring filters that overlap out. A window that
+    # could not be listed in full keeps its start, so the next poll picks up the remainder.
+    complete = len(ids) >= count
+    next_cursor = {
+        "mindate": mindate,
+        "maxdate": maxdate if complete else cursor.get("maxdate"),
+        "recent_pmids": (new_ids + list(cursor.get("recent_pmids") or []))[
+            : settings.pubmed_seen_pmid_limit
+        ],
     }
-    if settings.ncbi_api_key:
-        fetch_params["api_key"] = settings.ncbi_api_key
-    raw = await _eutils_get("efetch.fcgi", fetch_params)
+    if not new_ids:
+        return [], next_cursor
 
-    try:
-        root = ET.fromstring(raw.text)
-    except ET.ParseError:
-        return []
+    webenv = result.get("webenv")
+    query_key = result.get("querykey")
+    if len(new_ids) < len(ids) or not webenv:
+        post = await eutils_get(
+            "epost.fcgi",
+            with_api_key({"db": "pubmed"}),
+            data={"id": ",".join(new_ids), **({"WebEnv": webenv} if webenv else {})},
+        )
+        post_root = ET.fromstring(post.text)
+        webenv = post_root.findtext("WebEnv") or webenv
+        query_key = post_root.findtext("QueryKey")
 
     items: list[IngestedItem] = []
-    for article in root.findall(".//PubmedArticle"):
-        pmid = article.findtext(".//PMID")
-        title = article.findtext(".//ArticleTitle") or ""
-        abstract_nodes = article.findall(".//Abstract/AbstractText")
-        abstract = "\n".join(["".join(node.itertext()) for node in abstract_nodes])
-        if not pmid:
-            continue
-
-        doi = article.findtext(".//ArticleId[@IdType='doi']") or _extract_doi(abstract)
-        url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
-        external_id = f"pmid:{pmid}"
-        if doi:
-            external_id = f"doi:{doi.lower()}"
-
-        items.append(
-            IngestedItem(
-                external_id=external_id,
-                url=url,
-                title=title,
-                raw_text=abstract,
-                raw_html=abstract,
-                http_meta={"provider": "pubmed", "pmid": pmid, "doi": doi},
+    batch_size = max(1, settings.pubmed_efetch_batch_size)
+    for retstart in range(0, len(new_ids), batch_size):
+        batch = await _efetch_items(
+            with_api_key(
+                {
+                    "db": "pubmed",
+                    "WebEnv": webenv,
+                    "query_key": query_key,
+                    "retstart": retstart,
+                    "retmax": batch_size,
+                    "retmode": "xml",
+                }
             )
         )
-    return items
+        # Streaming callers take each batch as it is parsed, so a backfill is never held in full.
+        if on_batch is not None:
+            await on_batch(batch)
+        else:
+            items.extend(batch)
+    return items, next_cursor
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import xml.etree.ElementTree as ET
+import zlib
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import cast
+
+from app.core.config import get_settings
+from app.core.http import get_http_client
+from app.core.time import now_utc
+from app.services.ingestion.browser import WaitStrategy
+from app.services.ingestion.common import EmitBatch, IngestedItem, ItemBatcher
+from app.services.ingestion.download import DownloadTooLarge, iter_limited_bytes, max_download_bytes
+from app.services.ingestion.executor import run_in_thread
+from app.services.ingestion.html import fetch_page_item
+from app.utils.network import assert_allowed_url_async
+
+logger = logging.getLogger(__name__)
+
+SITEMAP_CONTENT_TYPES = ("xml", "text/plain", "gzip", "octet-stream")
+MAX_INDEX_DEPTH = 2
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class SitemapParseError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class SitemapEntry:
+    kind: str
+    loc: str
+    lastmod: str | None
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+class SitemapStream:
+    def __init__(self, max_bytes: int | None = None) -> None:
+        self._parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+        self._max_bytes = max_bytes
+        self._inflated = 0
+        self._inflater: zlib._Decompress | None = None
+        # Leading bytes are held back until there are enough to sniff the gzip magic.
+        self._head: bytes | None = b""
+        self._root: ET.Element | None = None
+
+    def feed(self, chunk: bytes) -> list[SitemapEntry]:
+        if self._head is not None:
+            chunk = self._head + chunk
+            if len(chunk) < len(GZIP_MAGIC):
+                self._head = chunk
+                return []
+            self._head = None
+            # Sniffed rather than taken from the URL or headers: httpx already decodes
+            # Content-Encoding: gzip, and inflating that output again would fail.
+            if chunk.startswith(GZIP_MAGIC):
+                self._inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._inflater is not None:
+            chunk = self._inflate(chunk, self._inflater)
+        return self._parse(lambda: self._parser.feed(chunk))
+
+    def close(self) -> list[SitemapEntry]:
+        entries: list[SitemapEntry] = []
+        if self._head:
+            tail, self._head = self._head, None
+            entries.extend(self._parse(lambda: self._parser.feed(tail)))
+        if self._inflater is not None:
+            rest = self._inflater.flush()
+            self._count_inflated(len(rest))
+            if rest:
+                entries.extend(self._parse(lambda: self._parser.feed(rest)))
+        entries.extend(self._parse(self._parser.close))
+        return entries
+
+    def _inflate(self, chunk: bytes, inflater: zlib._Decompress) -> bytes:
+        # Capping the output as it is produced keeps a small gzip bomb from expanding in memory.
+        limit = self._max_bytes - self._inflated + 1 if self._max_bytes else 0
+        data = inflater.decompress(chunk, limit)
+        self._count_inflated(len(data))
+        return data
+
+    def _count_inflated(self, size: int) -> None:
+        self._inflated += size
+        if self._max_bytes and self._inflated > self._max_bytes:
+            raise DownloadTooLarge(f"Sitemap inflated past {self._max_bytes} bytes")
+
+    def _parse(self, step) -> list[SitemapEntry]:
+        try:
+            step()
+        except ET.ParseError as exc:
+            raise SitemapParseError(f"Malformed sitemap XML: {exc}") from exc
+        entries: list[SitemapEntry] = []
+        events = cast(Iterator[tuple[str, ET.Element]], self._parser.read_events())
+        for event, element in events:
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+            kind = _local_name(element.tag)
+            if kind not in {"url", "sitemap"}:
+                continue
+            fields = {_local_name(child.tag): (child.text or "").strip() for child in element}
+            if fields.get("loc"):
+                entries.append(SitemapEntry(kind=kind, loc=fields["loc"], lastmod=fields.get("lastmod") or None))
+            element.clear()
+            if self._root is not None:
+                self._root.clear()
+        return entries
+
+
+async def iter_sitemap_entries(url: str) -> AsyncIterator[SitemapEntry]:
+    await assert_allowed_url_async(url)
+    async with get_http_client().stream("GET", url) as response:
+        response.raise_for_status()
+        stream = SitemapStream(max_bytes=max_download_bytes())
+        async for chunk in iter_limited_bytes(response, SITEMAP_CONTENT_TYPES):
+            for entry in await run_in_thread(stream.feed, chunk):
+                yield entry
+        for entry in await run_in_thread(stream.close):
+            yield entry
+
+
+def _parse_lastmod(lastmod: str | None) -> datetime | None:
+    if not lastmod:
+        return None
+    try:
+        parsed = datetime.fromisoformat(lastmod)
+    except ValueError:
+        return None
+    return parsed.astimezone(UTC).replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+def _is_recent(lastmod: str | None, cutoff: str) -> bool:
+    # W3C datetimes sort lexically once truncated to the date part.
+    return lastmod is None or lastmod[:10] >= cutoff
+
+
+async def fetch_sitemap_items(
+    url: str,
+    cursor_json: dict,
+    selectors: list[str] | None = None,
+    link_pattern: str | None = None,
+    max_age_days: int | None = None,
+    wait: WaitStrategy | None = None,
+    on_batch: EmitBatch | None = None,
+) -> tuple[list[IngestedItem], dict]:
+    settings = get_settings()
+    pattern = re.compile(link_pattern) if link_pattern else None
+    known: dict[str, str] = dict(cursor_json.get("lastmod") or {})
+    known_sitemaps: dict[str, str] = dict(cursor_json.get("sitemaps") or {})
+    age_days = max_age_days if max_age_days is not None else settings.sitemap_max_age_days
+    cutoff = (now_utc() - timedelta(days=age_days)).date().isoformat()
+
+    candidates: list[tuple[SitemapEntry, str]] = []
+    child_lastmods: dict[str, str] = {}
+    pending = [(url, 0)]
+    while pending:
+        sitemap_url, depth = pending.pop()
+        async for entry in iter_sitemap_entries(sitemap_url):
+            if entry.kind == "sitemap":
+                # Child sitemaps whose lastmod has not moved cannot contain changed URLs.
+                unchanged = entry.lastmod and known_sitemaps.get(entry.loc) == entry.lastmod
+                if depth < MAX_INDEX_DEPTH and not unchanged and _is_recent(entry.lastmod, cutoff):
+                    pending.append((entry.loc, depth + 1))
+                    if entry.lastmod:
+                        child_lastmods[entry.loc] = entry.lastmod
+                continue
+            if pattern and not pattern.search(entry.loc):
+                continue
+            if entry.loc in known and known[entry.loc] == (entry.lastmod or ""):
+                continue
+            if not _is_recent(entry.lastmod, cutoff):
+                continue
+            candidates.append((entry, sitemap_url))
+
+    candidates.sort(key=lambda candidate: candidate[0].lastmod or "", reverse=True)
+    batch = candidates[: max(1, settings.sitemap_max_new_per_poll)]
+    limit = asyncio.Semaphore(max(1, settings.sitemap_concurrency))
+    batcher = ItemBatcher(on_batch, settings.ingest_upsert_batch_size)
+
+    async def _fetch(entry: SitemapEntry) -> None:
+        async with limit:
+            try:
+                item = await fetch_page_item(entry.loc, selectors, wait)
+            except Exception as exc:  # noqa: BLE001
+                # Left out of the cursor so the next poll retries it.
+                logger.warning("Sitemap URL fetch failed for %s: %s", entry.loc, exc)
+                return
+        if entry.loc in known and entry.lastmod:
+            # A changed page is stored as a new snapshot rather than overwriting the old one.
+            item.external_id = f"{entry.loc}@{entry.lastmod}"
+        item.published_at = _parse_lastmod(entry.lastmod)
+        item.http_meta["sitemap_lastmod"] = entry.lastmod
+        known[entry.loc] = entry.lastmod or ""
+        await batcher.add(item)
+
+    await asyncio.gather(*(_fetch(entry) for entry, _ in batch))
+    await batcher.flush()
+    # A child sitemap is only marked current once every candidate it listed has been stored;
+    # otherwise its unchanged lastmod would hide the leftovers from the next poll.
+    incomplete = {parent for entry, parent in candidates if known.get(entry.loc) != (entry.lastmod or "")}
+    for child, lastmod in child_lastmods.items():
+        if child not in incomplete:
+            known_sitemaps[child] = lastmod
+    tracked = sorted(known.items(), key=lambda pair: pair[1], reverse=True)[: settings.sitemap_max_tracked_urls]
+    return batcher.items, {
+        **cursor_json,
+        "lastmod": dict(tracked),
+        "sitemaps": known_sitemaps,
+        "sitemap_candidates": len(candidates),
+        "sitemap_failures": len(batch) - batcher.count,
+    }
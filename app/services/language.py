@@ -0,0 +1,107 @@
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Literal
+
+from app.core.config import get_settings
+from app.models.entities import Source, SourceMethod
+from app.services.language_profiles import SEED_TEXTS
+
+UNDETERMINED = "und"
+PROFILE_SIZE = 300
+SAMPLE_CHARS = 4000
+MIN_LETTERS = 40
+MIN_SCRIPT_LETTERS = 10
+# Relative gap between the closest and second-closest profile needed to trust a trigram match.
+# Short English scientific titles land within a few percent of Dutch or Italian; real
+# German, French, Spanish, Italian, Portuguese and Dutch sentences clear it comfortably.
+MIN_MARGIN = 0.15
+
+LanguageAction = Literal["triage", "defer", "skip"]
+
+# Non-Latin scripts identify the language (or its most likely one) without a profile.
+SCRIPT_LANGUAGES = (
+    ("CJK", "zh"),
+    ("HIRAGANA", "ja"),
+    ("KATAKANA", "ja"),
+    ("HANGUL", "ko"),
+    ("CYRILLIC", "ru"),
+    ("GREEK", "el"),
+    ("ARABIC", "ar"),
+    ("HEBREW", "he"),
+    ("DEVANAGARI", "hi"),
+    ("THAI", "th"),
+)
+NON_LETTERS = re.compile(r"[^\w]+|[\d_]+")
+
+
+def _trigrams(text: str) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    for word in NON_LETTERS.sub(" ", text.lower()).split():
+        padded = f" {word} "
+        counts.update(padded[index : index + 3] for index in range(len(padded) - 2))
+    return counts
+
+
+def _ranks(counts: Counter[str]) -> dict[str, int]:
+    return {gram: rank for rank, (gram, _) in enumerate(counts.most_common(PROFILE_SIZE))}
+
+
+@lru_cache(maxsize=1)
+def _profiles() -> dict[str, dict[str, int]]:
+    return {language: _ranks(_trigrams(text)) for language, text in SEED_TEXTS.items()}
+
+
+def _script_language(letters: list[str]) -> str | None:
+    scripts: Counter[str] = Counter()
+    for char in letters:
+        name = unicodedata.name(char, "")
+        for script, language in SCRIPT_LANGUAGES:
+            if name.startswith(script):
+                scripts[language] += 1
+                break
+    if not scripts:
+        return None
+    language, count = scripts.most_common(1)[0]
+    # Kana mixed with kanji is Japanese even when kanji dominate.
+    if language == "zh" and scripts.get("ja", 0) * 10 >= count:
+        language, count = "ja", count + scripts["ja"]
+    return language if count * 2 >= len(letters) else None
+
+
+def detect_language(text: str | None) -> str:
+    sample = (text or "")[:SAMPLE_CHARS]
+    letters = [char for char in sample if char.isalpha()]
+    if len(letters) < MIN_SCRIPT_LETTERS:
+        return UNDETERMINED
+    by_script = _script_language(letters)
+    if by_script:
+        return by_script
+    if len(letters) < MIN_LETTERS:
+        return UNDETERMINED
+
+    ranks = _ranks(_trigrams(sample))
+    # Cavnar-Trenkle out-of-place distance: a trigram missing from a profile costs the maximum.
+    distances = {
+        language: sum(abs(rank - profile.get(gram, PROFILE_SIZE)) for gram, rank in ranks.items())
+        for language, profile in _profiles().items()
+    }
+    best, runner_up = sorted(distances, key=lambda language: distances[language])[:2]
+    if distances[runner_up] - distances[best] < MIN_MARGIN * distances[best]:
+        return UNDETERMINED
+    return best
+
+
+def language_action(source: Source | None, language: str) -> LanguageAction:
+    if language == UNDETERMINED or (source is not None and source.method == SourceMethod.manual):
+        return "triage"
+    settings = get_settings()
+    config = (source.config_json if source is not None else None) or {}
+    covered = [str(item).lower() for item in config.get("languages") or []] or settings.covered_language_list
+    if language in covered:
+        return "triage"
+    policy = config.get("language_policy") or settings.uncovered_language_policy
+    if policy == "skip":
+        return "skip"
+    return "defer" if policy == "defer" else "triage"
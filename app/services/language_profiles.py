@@ -0,0 +1,95 @@
+# Seed prose for the Latin-script trigram profiles in app/services/language.py. Mixed general and
+# biomedical register, matching what the sources publish.
+SEED_TEXTS = {
+    "en": (
+        "The study followed older adults for ten years and found that those who exercised regularly "
+        "had a lower risk of heart disease and lived longer than those who did not. Researchers said "
+        "the results should be confirmed in a larger trial, but they are consistent with what we know "
+        "about the effects of physical activity on the body. In this article we explain what the new "
+        "findings mean for people who want to stay healthy as they age, and which questions remain "
+        "open. The authors also measured blood markers of inflammation and found that they were "
+        "higher in the group with the worst sleep. There is no evidence yet that a drug can slow "
+        "human aging, although several compounds have extended the lifespan of mice and worms. "
+        "If you are thinking about changing your diet, talk to your doctor first, because what works "
+        "for one person may not work for another. We will update this page when the full paper is "
+        "published and when other groups have had the chance to look at the data."
+    ),
+    "de": (
+        "Die Studie begleitete ältere Erwachsene über zehn Jahre und zeigte, dass diejenigen, die "
+        "regelmäßig Sport trieben, ein geringeres Risiko für Herzkrankheiten hatten und länger lebten "
+        "als die anderen. Die Forscher sagten, dass die Ergebnisse in einer größeren Studie bestätigt "
+        "werden müssen, aber sie stimmen mit dem überein, was wir über die Wirkung von Bewegung auf "
+        "den Körper wissen. In diesem Artikel erklären wir, was die neuen Erkenntnisse für Menschen "
+        "bedeuten, die im Alter gesund bleiben wollen, und welche Fragen noch offen sind. Die Autoren "
+        "haben auch Entzündungswerte im Blut gemessen und festgestellt, dass sie in der Gruppe mit dem "
+        "schlechtesten Schlaf höher waren. Es gibt noch keinen Beweis dafür, dass ein Medikament das "
+        "Altern des Menschen verlangsamen kann, obwohl mehrere Wirkstoffe die Lebensdauer von Mäusen "
+        "und Würmern verlängert haben. Wenn Sie Ihre Ernährung ändern möchten, sprechen Sie zuerst "
+        "mit Ihrem Arzt, denn was für eine Person funktioniert, muss nicht für jeden gelten."
+    ),
+    "fr": (
+        "L'étude a suivi des adultes âgés pendant dix ans et a montré que ceux qui faisaient "
+        "régulièrement de l'exercice avaient un risque plus faible de maladie cardiaque et vivaient "
+        "plus longtemps que les autres. Les chercheurs ont déclaré que les résultats doivent être "
+        "confirmés par un essai plus large, mais ils sont cohérents avec ce que nous savons des effets "
+        "de l'activité physique sur le corps. Dans cet article, nous expliquons ce que ces nouvelles "
+        "données signifient pour les personnes qui veulent rester en bonne santé en vieillissant, et "
+        "quelles questions restent ouvertes. Les auteurs ont aussi mesuré des marqueurs "
+        "d'inflammation dans le sang et ont constaté qu'ils étaient plus élevés dans le groupe qui "
+        "dormait le moins bien. Il n'existe pas encore de preuve qu'un médicament puisse ralentir le "
+        "vieillissement humain, même si plusieurs molécules ont prolongé la durée de vie des souris "
+        "et des vers. Si vous pensez changer votre alimentation, parlez-en d'abord à votre médecin."
+    ),
+    "es": (
+        "El estudio siguió a adultos mayores durante diez años y encontró que quienes hacían "
+        "ejercicio con regularidad tenían un menor riesgo de enfermedad cardíaca y vivían más que los "
+        "demás. Los investigadores dijeron que los resultados deben confirmarse en un ensayo más "
+        "grande, pero que son coherentes con lo que sabemos sobre los efectos de la actividad física "
+        "en el cuerpo. En este artículo explicamos qué significan los nuevos hallazgos para las "
+        "personas que quieren mantenerse sanas a medida que envejecen, y qué preguntas siguen "
+        "abiertas. Los autores también midieron marcadores de inflamación en la sangre y comprobaron "
+        "que eran más altos en el grupo que dormía peor. Todavía no hay pruebas de que un "
+        "medicamento pueda frenar el envejecimiento humano, aunque varios compuestos han alargado la "
+        "vida de ratones y gusanos. Si está pensando en cambiar su dieta, hable primero con su "
+        "médico, porque lo que funciona para una persona puede no funcionar para otra."
+    ),
+    "it": (
+        "Lo studio ha seguito adulti anziani per dieci anni e ha scoperto che chi faceva esercizio "
+        "regolarmente aveva un rischio minore di malattie cardiache e viveva più a lungo degli altri. "
+        "I ricercatori hanno detto che i risultati devono essere confermati da una sperimentazione più "
+        "ampia, ma sono coerenti con quello che sappiamo sugli effetti dell'attività fisica sul "
+        "corpo. In questo articolo spieghiamo che cosa significano i nuovi dati per le persone che "
+        "vogliono restare in salute con l'età, e quali domande restano aperte. Gli autori hanno anche "
+        "misurato i marcatori dell'infiammazione nel sangue e hanno visto che erano più alti nel "
+        "gruppo che dormiva peggio. Non ci sono ancora prove che un farmaco possa rallentare "
+        "l'invecchiamento umano, anche se diverse molecole hanno allungato la vita di topi e vermi. "
+        "Se state pensando di cambiare la vostra dieta, parlatene prima con il vostro medico, perché "
+        "quello che funziona per una persona potrebbe non funzionare per un'altra."
+    ),
+    "pt": (
+        "O estudo acompanhou adultos mais velhos durante dez anos e descobriu que aqueles que faziam "
+        "exercício com regularidade tinham um risco menor de doença cardíaca e viviam mais do que os "
+        "outros. Os pesquisadores disseram que os resultados precisam ser confirmados num ensaio "
+        "maior, mas que são coerentes com o que sabemos sobre os efeitos da atividade física no "
+        "corpo. Neste artigo explicamos o que as novas descobertas significam para as pessoas que "
+        "querem se manter saudáveis à medida que envelhecem, e quais perguntas continuam em aberto. "
+        "Os autores também mediram marcadores de inflamação no sangue e verificaram que eram mais "
+        "altos no grupo que dormia pior. Ainda não há provas de que um medicamento consiga retardar o "
+        "envelhecimento humano, embora vários compostos tenham prolongado a vida de ratos e vermes. "
+        "Se você está pensando em mudar a sua alimentação, converse primeiro com o seu médico, porque "
+        "o que funciona para uma pessoa pode não funcionar para outra."
+    ),
+    "nl": (
+        "Het onderzoek volgde oudere volwassenen gedurende tien jaar en vond dat mensen die "
+        "regelmatig sportten een lager risico op hartziekten hadden en langer leefden dan de anderen. "
+        "De onderzoekers zeiden dat de resultaten in een grotere studie moeten worden bevestigd, maar "
+        "dat ze overeenkomen met wat we weten over de effecten van lichaamsbeweging op het lichaam. "
+        "In dit artikel leggen we uit wat de nieuwe bevindingen betekenen voor mensen die gezond "
+        "willen blijven als ze ouder worden, en welke vragen nog open staan. De auteurs hebben ook "
+        "ontstekingswaarden in het bloed gemeten en zagen dat die hoger waren in de groep die het "
+        "slechtst sliep. Er is nog geen bewijs dat een medicijn de veroudering van de mens kan "
+        "vertragen, hoewel verschillende stoffen de levensduur van muizen en wormen hebben verlengd. "
+        "Als u overweegt uw voeding aan te passen, praat dan eerst met uw arts, want wat voor de ene "
+        "persoon werkt, werkt niet altijd voor een ander."
+    ),
+}
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+
+from app.core.config import get_settings
+from app.services.relevance import LEXICON, relevance_features
+
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[]?[A-Z0-9])")
+# Doses, effect sizes and statistics carry most of what analysis and verification check.
+NUMERIC = re.compile(
+    r"\b\d+(?:[.,]\d+)?\s*(?:%|mg/kg|mg/dl|mg|mcg|µg|ug|g|kg|ml|iu|mmol|nmol|years?|months?|weeks?|days?)(?!\w)"
+    r"|\b(?:p\s*[<=>]\s*0?\.\d+|(?:hr|or|rr)\s*[=:]?\s*\d+(?:\.\d+)?|n\s*=\s*\d+)",
+    re.IGNORECASE,
+)
+SECTION_CUES = re.compile(r"\b(?:abstract|conclusions?|results?|findings|we found|in summary)\b", re.IGNORECASE)
+GAP_MARKER = "[...]"
+LEAD_SENTENCES = 5
+
+
+@dataclass
+class PreparedInput:
+    text: str
+    original_tokens: int
+    prepared_tokens: int
+
+    @property
+    def compression_ratio(self) -> float:
+        if self.original_tokens <= 0:
+            return 1.0
+        return round(self.prepared_tokens / self.original_tokens, 4)
+
+    def as_meta(self) -> dict:
+        return {
+            "input_tokens_estimated": self.original_tokens,
+            "prepared_tokens_estimated": self.prepared_tokens,
+            "compression_ratio": self.compression_ratio,
+        }
+
+
+def estimate_tokens(text: str | None) -> int:
+    if not text:
+        return 0
+    # BPE tokenizers average ~4 characters per token on English prose, more on short-word text.
+    return max(math.ceil(len(text) / 4), math.ceil(len(text.split()) * 4 / 3))
+
+
+def stage_budget(stage: str) -> int:
+    settings = get_settings()
+    budgets = {
+        "triage": settings.llm_triage_input_tokens,
+        "analysis": settings.llm_analysis_input_tokens,
+        "verification": settings.llm_verification_input_tokens,
+    }
+    return budgets.get(stage, settings.llm_analysis_input_tokens)
+
+
+def _sentence_score(index: int, sentence: str) -> float:
+    score = max(0.0, (LEAD_SENTENCES - index) / LEAD_SENTENCES) * 3
+    features = relevance_features(None, sentence)
+    score += sum(LEXICON[term] * value for term, value in features.items() if LEXICON[term] > 0)
+    score += 2.0 * min(3, len(NUMERIC.findall(sentence)))
+    if SECTION_CUES.search(sentence):
+        score += 1.5
+    return score
+
+
+def _truncate(text: str, budget: int) -> str:
+    chars = budget * 4
+    return text if len(text) <= chars else text[:chars].rsplit(" ", 1)[0]
+
+
+def prepare_input(stage: str, text: str, title: str | None = None) -> PreparedInput:
+    original = estimate_tokens(text)
+    budget = stage_budget(stage)
+    if original <= budget:
+        return PreparedInput(text=text, original_tokens=original, prepared_tokens=original)
+
+    header = f"{title.strip()}\n\n" if title and title.strip() and not text.startswith(title.strip()) else ""
+    remaining = budget - estimate_tokens(header)
+    sentences = [sentence for sentence in SENTENCE_END.split(text) if sentence.strip()]
+    ranked = sorted(range(len(sentences)), key=lambda index: (-_sentence_score(index, sentences[index]), index))
+    chosen: set[int] = set()
+    for index in ranked:
+        cost = estimate_tokens(sentences[index]) + 1
+        if cost <= remaining:
+            chosen.add(index)
+            remaining -= cost
+        if remaining <= 0:
+            break
+
+    parts: list[str] = []
+    previous = -1
+    for index in sorted(chosen):
+        if index != previous + 1:
+            parts.append(GAP_MARKER)
+        parts.append(sentences[index])
+        previous = index
+    if previous != len(sentences) - 1:
+        parts.append(GAP_MARKER)
+    body = " ".join(parts) if chosen else _truncate(text, max(1, remaining))
+    prepared = header + body
+    return PreparedInput(text=prepared, original_tokens=original, prepared_tokens=estimate_tokens(prepared))
@@ -5,8 +5,9 @@ from typing import Any
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from app.core.config import get_settings
-from app.core.observability import LLM_LATENCY
+from app.core.observability import LLM_INPUT_TOKENS_SAVED, LLM_LATENCY
 from app.schemas.common import AnalysisOutput, TriageOutput, VerificationOutput
+from app.services.llm.budget import prepare_input
 from app.services.llm.prompts import (
     ANALYSIS_PROMPT,
     ANALYSIS_PROMPT_VERSION,
@@ -161,17 +162,21 @@ async def _call_candidate(stage: str, candidate: ModelSelection, prompt: str, te
     }
 
 
-async def _run_stage(stage: str, prompt: str, prompt_version: str, text: str, parser):
+async def _run_stage(stage: str, prompt: str, prompt_version: str, text: str, parser, title: str | None = None):
+    prepared = prepare_input(stage, text, title)
+    if prepared.prepared_tokens < prepared.original_tokens:
+        LLM_INPUT_TOKENS_SAVED.labels(stage).inc(prepared.original_tokens - prepared.prepared_tokens)
     errors: list[str] = []
     for candidate in stage_candidates(stage):
         try:
-            payload = await _call_candidate(stage, candidate, prompt, text)
+            payload = await _call_candidate(stage, candidate, prompt, prepared.text)
             output = parser.model_validate(payload["raw"])
             LLM_LATENCY.labels(stage, payload["provider"], payload["model"]).observe(
                 (payload.get("latency_ms") or 0) / 1000
             )
             payload["prompt_version"] = prompt_version
             payload["prompt_checksum"] = prompt_checksum(prompt_version)
+            payload.update(prepared.as_meta())
             return output, payload
         except LLMSchemaError as exc:
             errors.append(f"{candidate.provider}:{candidate.model}:schema:{exc}")
@@ -183,17 +188,17 @@ async def _run_stage(stage: str, prompt: str, prompt_version: str, text: str, pa
     raise RuntimeError(f"No model candidate succeeded for {stage}: {' | '.join(errors)}")
 
 
-async def run_triage(text: str) -> tuple[TriageOutput, dict]:
-    return await _run_stage("triage", TRIAGE_PROMPT, TRIAGE_PROMPT_VERSION, text, TriageOutput)
+async def run_triage(text: str, title: str | None = None) -> tuple[TriageOutput, dict]:
+    return await _run_stage("triage", TRIAGE_PROMPT, TRIAGE_PROMPT_VERSION, text, TriageOutput, title)
 
 
-async def run_analysis(text: str) -> tuple[AnalysisOutput, dict]:
+async def run_analysis(text: str, title: str | None = None) -> tuple[AnalysisOutput, dict]:
     return await _run_stage(
-        "analysis", ANALYSIS_PROMPT, ANALYSIS_PROMPT_VERSION, text, AnalysisOutput
+        "analysis", ANALYSIS_PROMPT, ANALYSIS_PROMPT_VERSION, text, AnalysisOutput, title
     )
 
 
-async def run_verification(text: str) -> tuple[VerificationOutput, dict]:
+async def run_verification(text: str, title: str | None = None) -> tuple[VerificationOutput, dict]:
     return await _run_stage(
-        "verification", VERIFICATION_PROMPT, VERIFICATION_PROMPT_VERSION, text, VerificationOutput
+        "verification", VERIFICATION_PROMPT, VERIFICATION_PROMPT_VERSION, text, VerificationOutput, title
     )
@@ -17,46 +17,183 @@ from app.models.entities import (
     Source,
 )
 from app.schemas.common import AnalysisOutput, LLMRunIn, VerificationOutput
+from app.services.blobstore import store_raw_payloads
+from app.services.language import detect_language
 from app.state_machine.document_status import enforce_transition
 from app.utils.hashing import sha256_text
+from app.utils.urls import canonicalize_url
 
 
-def upsert_raw_document(db: Session, source: Source, item: dict) -> RawDocument:
-    existing = (
-        db.query(RawDocument)
-        .filter(RawDocument.source_id == source.id, RawDocument.external_id == item["external_id"])
-        .one_or_none()
-    )
-    content_hash = sha256_text((item.get("raw_text") or "") + (item.get("url") or ""))
-    if existing:
-        return existing
-
+def _new_raw_document(source: Source, item: dict) -> RawDocument:
     raw_doc = RawDocument(
         source_id=source.id,
         external_id=item["external_id"],
         url=item["url"],
-        raw_text=item.get("raw_text"),
-        raw_html=item.get("raw_html"),
         http_meta_json=item.get("http_meta") or {},
-        content_hash=content_hash,
+        content_hash=sha256_text((item.get("raw_text") or "") + (item.get("url") or "")),
     )
-    db.add(raw_doc)
-    db.flush()
+    store_raw_payloads(raw_doc, item.get("raw_text"), item.get("raw_html"))
+    return raw_doc
 
-    doc = Document(
+
+def _new_document(raw_doc: RawDocument, item: dict) -> Document:
+    canonical_url = canonicalize_url(item.get("canonical_url") or item["url"])
+    normalized_text = " ".join((item.get("raw_text") or "").split())
+    return Document(
         raw_document_id=raw_doc.id,
-        canonical_url=item["url"],
+        canonical_url=canonical_url,
+        canonical_url_hash=sha256_text(canonical_url),
         title=item.get("title"),
         published_at=item.get("published_at"),
-        normalized_text=" ".join((item.get("raw_text") or "").split()),
+        normalized_text=normalized_text,
+        language=detect_language(f"{item.get('title') or ''} {normalized_text}"),
         status=DocumentStatus.ingested,
     )
-    db.add(doc)
+
+
+def upsert_raw_document(db: Session, source: Source, item: dict) -> RawDocument:
+    existing = (
+        db.query(RawDocument)
+        .filter(RawDocument.source_id == source.id, RawDocument.external_id == item["external_id"])
+        .one_or_none()
+    )
+    if existing:
+        return existing
+
+    raw_doc = _new_raw_document(source, item)
+    db.add(raw_doc)
+    db.flush()
+
+    document = _new_document(raw_doc, item)
+    db.add(document)
     db.flush()
+    link_canonical_duplicates(db, [document])
     _upsert_metrics(db, "ingested_count")
     return raw_doc
 
 
+def link_canonical_duplicates(db: Session, documents: list[Document]) -> None:
+    hashes = {document.canonical_url_hash for document in documents if document.canonical_url_hash}
+    if not hashes:
+        return
+    rows = (
+        db.query(Document.canonical_url_hash, RawDocument.source_id, func.min(Document.id))
+        .join(RawDocument, RawDocument.id == Document.raw_document_id)
+        .filter(Document.canonical_url_hash.in_(hashes))
+        .group_by(Document.canonical_url_hash, RawDocument.source_id)
+        .all()
+    )
+    first_by_source: dict[str | None, dict[int, int]] = {}
+    for canonical_hash, source_id, first_id in rows:
+        first_by_source.setdefault(canonical_hash, {})[source_id] = first_id
+    source_ids = dict(
+        db.query(Document.id, RawDocument.source_id)
+        .join(RawDocument, RawDocument.id == Document.raw_document_id)
+        .filter(Document.id.in_([document.id for document in documents]))
+        .all()
+    )
+
+    def first_elsewhere(document: Document) -> int | None:
+        # A source re-publishing its own URL (sitemap lastmod snapshots, edited posts) is an update,
+        # not a duplicate; only an earlier document from another source counts.
+        candidates = [
+            first_id
+            for source_id, first_id in first_by_source.get(document.canonical_url_hash, {}).items()
+            if source_id != source_ids.get(document.id) and first_id < document.id
+        ]
+        return min(candidates, default=None)
+
+    links = [
+        DocumentDuplicate(
+            document_id=document.id,
+            duplicate_of_document_id=original_id,
+            similarity_score=1.0,
+            method="canonical_url",
+        )
+        for document in documents
+        if (original_id := first_elsewhere(document)) is not None
+    ]
+    if links:
+        # Sessions do not autoflush; content-hash dedup must see these pairs before adding its own.
+        db.add_all(links)
+        db.flush()
+
+
+def canonical_duplicate_of(db: Session, document: Document) -> int | None:
+    row = (
+        db.query(DocumentDuplicate.duplicate_of_document_id)
+        .filter(DocumentDuplicate.document_id == document.id, DocumentDuplicate.method == "canonical_url")
+        .first()
+    )
+    return row[0] if row else None
+
+
+def bulk_upsert_raw_documents(db: Session, entries: list[tuple[Source, dict]]) -> list[tuple[Document, bool]]:
+    keys = [(source.id, item["external_id"]) for source, item in entries]
+    existing_raw_ids: dict[tuple[int, str], int] = {}
+    if keys:
+        rows = (
+            db.query(RawDocument.id, RawDocument.source_id, RawDocument.external_id)
+            .filter(
+                RawDocument.source_id.in_({source_id for source_id, _ in keys}),
+                RawDocument.external_id.in_({external_id for _, external_id in keys}),
+            )
+            .all()
+        )
+        existing_raw_ids = {(row.source_id, row.external_id): row.id for row in rows}
+
+    new_raw: dict[tuple[int, str], tuple[RawDocument, dict]] = {}
+    for key, (source, item) in zip(keys, entries, strict=True):
+        if key not in existing_raw_ids and key not in new_raw:
+            new_raw[key] = (_new_raw_document(source, item), item)
+    db.add_all([raw_doc for raw_doc, _ in new_raw.values()])
+    db.flush()
+    new_docs = {key: _new_document(raw_doc, item) for key, (raw_doc, item) in new_raw.items()}
+    db.add_all(list(new_docs.values()))
+    db.flush()
+    if new_docs:
+        link_canonical_duplicates(db, list(new_docs.values()))
+        _upsert_metrics(db, "ingested_count", len(new_docs))
+
+    existing_docs: dict[int, Document] = {}
+    if existing_raw_ids:
+        documents = db.query(Document).filter(Document.raw_document_id.in_(existing_raw_ids.values())).all()
+        existing_docs = {document.raw_document_id: document for document in documents}
+
+    results: list[tuple[Document, bool]] = []
+    reported: set[tuple[int, str]] = set()
+    for key in keys:
+        if key in new_docs:
+            results.append((new_docs[key], key not in reported))
+        else:
+            results.append((existing_docs[existing_raw_ids[key]], False))
+        reported.add(key)
+    return results
+
+
+def recent_external_ids(db: Session, source_id: int, limit: int) -> set[str]:
+    rows = (
+        db.query(RawDocument.external_id)
+        .filter(RawDocument.source_id == source_id)
+        .order_by(RawDocument.fetched_at.desc(), RawDocument.id.desc())
+        .limit(limit)
+        .all()
+    )
+    return {row.external_id for row in rows}
+
+
+def _duplicate_linked(db: Session, document_id: int, duplicate_of_id: int) -> bool:
+    return (
+        db.query(DocumentDuplicate.id)
+        .filter(
+            DocumentDuplicate.document_id == document_id,
+            DocumentDuplicate.duplicate_of_document_id == duplicate_of_id,
+        )
+        .first()
+        is not None
+    )
+
+
 def run_dedup_for_document(db: Session, document: Document) -> None:
     if not document.normalized_text:
         return
@@ -69,7 +206,7 @@ def run_dedup_for_document(db: Session, document: Document) -> None:
         .limit(1)
         .all()
     )
-    if candidates:
+    if candidates and not _duplicate_linked(db, document.id, candidates[0].id):
         db.add(
             DocumentDuplicate(
                 document_id=document.id,
@@ -91,6 +228,9 @@ def store_llm_run(db: Session, run_in: LLMRunIn) -> None:
             prompt_version=run_in.prompt_version,
             input_tokens=run_in.input_tokens,
             output_tokens=run_in.output_tokens,
+            input_tokens_estimated=run_in.input_tokens_estimated,
+            prepared_tokens_estimated=run_in.prepared_tokens_estimated,
+            compression_ratio=run_in.compression_ratio,
             latency_ms=run_in.latency_ms,
             cost_usd=run_in.cost_usd,
             raw_response_json=run_in.raw_response_json,
@@ -183,7 +323,7 @@ def apply_verification(db: Session, document: Document, verification: Verificati
         _upsert_metrics(db, "rejected_count")
 
 
-def _upsert_metrics(db: Session, field: str) -> None:
+def _upsert_metrics(db: Session, field: str, amount: int = 1) -> None:
     today = date.today()
     metrics = db.query(PipelineMetricDaily).filter(PipelineMetricDaily.metric_date == today).one_or_none()
     if not metrics:
@@ -199,7 +339,7 @@ def _upsert_metrics(db: Session, field: str) -> None:
         db.add(metrics)
         db.flush()
     current_value = getattr(metrics, field)
-    setattr(metrics, field, current_value + 1)
+    setattr(metrics, field, current_value + amount)
 
 
 def bump_metric(db: Session, field: str) -> None:
@@ -1,6 +1,5 @@
-import httpx
-
 from app.core.config import get_settings
+from app.core.http import get_http_client
 
 
 async def publish_draft(html: str, title: str = "LongevAI Weekly Brief") -> dict:
@@ -19,8 +18,7 @@ async def publish_draft(html: str, title: str = "LongevAI Weekly Brief") -> dict
         "status": "draft",
         "html": html,
     }
-    async with httpx.AsyncClient(timeout=20) as client:
-        response = await client.post(url, headers=headers, json=payload)
+    response = await get_http_client("publish").post(url, headers=headers, json=payload)
     if response.status_code >= 400:
         return {"status": "error", "error": response.text}
     body = response.json()
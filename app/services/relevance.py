@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import json
+import math
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Literal
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.entities import Document, EvalSample, Source, SourceMethod
+
+PrefilterDecision = Literal["reject", "shadow_reject", "triage", "fast_track"]
+
+# Weighted longevity vocabulary; negative terms mark event listings, job posts and promotions.
+# Phrases are matched on consecutive tokens.
+LEXICON: dict[str, float] = {
+    "longevity": 3.0,
+    "aging": 2.0,
+    "ageing": 2.0,
+    "anti aging": 1.5,
+    "age related": 2.0,
+    "healthy aging": 1.5,
+    "geroscience": 3.0,
+    "gerontology": 2.0,
+    "lifespan": 2.5,
+    "healthspan": 3.0,
+    "life expectancy": 1.5,
+    "senescence": 2.5,
+    "senescent": 2.5,
+    "senolytic": 3.0,
+    "senolytics": 3.0,
+    "inflammaging": 3.0,
+    "rapamycin": 2.5,
+    "mtor": 2.0,
+    "metformin": 1.5,
+    "nad": 1.5,
+    "nmn": 2.0,
+    "sirtuin": 2.0,
+    "sirtuins": 2.0,
+    "epigenetic clock": 3.0,
+    "epigenetic age": 3.0,
+    "biological age": 3.0,
+    "telomere": 2.0,
+    "telomeres": 2.0,
+    "autophagy": 2.0,
+    "caloric restriction": 2.5,
+    "calorie restriction": 2.5,
+    "dietary restriction": 2.0,
+    "fasting": 1.0,
+    "mitochondrial": 1.0,
+    "reprogramming": 1.5,
+    "rejuvenation": 1.5,
+    "yamanaka": 2.5,
+    "sarcopenia": 2.0,
+    "frailty": 2.0,
+    "dementia": 1.0,
+    "alzheimer": 1.0,
+    "older adults": 1.5,
+    "elderly": 1.0,
+    "mortality": 1.0,
+    "all cause mortality": 1.5,
+    "biomarker": 1.0,
+    "biomarkers": 1.0,
+    "clinical trial": 1.0,
+    "randomized": 1.0,
+    "mice": 0.5,
+    "cohort": 0.5,
+    "webinar": -3.0,
+    "register now": -3.0,
+    "registration": -1.5,
+    "tickets": -2.0,
+    "conference": -1.0,
+    "summit": -1.5,
+    "call for papers": -2.5,
+    "save the date": -3.0,
+    "hiring": -3.0,
+    "vacancy": -3.0,
+    "jobs": -2.0,
+    "apply now": -3.0,
+    "salary": -2.5,
+    "careers": -2.0,
+    "internship": -2.5,
+    "phd position": -2.0,
+    "we are looking for": -2.0,
+    "sponsored": -2.0,
+    "discount": -2.5,
+    "coupon": -3.0,
+    "promo code": -3.0,
+    "buy now": -3.0,
+    "limited time": -2.0,
+}
+# Without any lexicon hit a document scores sigmoid(-3) ~ 0.05; one title mention of "aging" ~ 0.5.
+LEXICON_BIAS = -3.0
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+AVERAGE_DOC_TOKENS = 250
+TITLE_WEIGHT = 2
+TOKEN = re.compile(r"[a-z0-9]+")
+MAX_PHRASE_TOKENS = max(len(term.split()) for term in LEXICON)
+
+
+def _tokens(text: str | None) -> list[str]:
+    return TOKEN.findall((text or "").lower())
+
+
+def _term_counts(tokens: list[str]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for size in range(1, MAX_PHRASE_TOKENS + 1):
+        for index in range(len(tokens) - size + 1):
+            term = " ".join(tokens[index : index + size])
+            if term in LEXICON:
+                counts[term] = counts.get(term, 0) + 1
+    return counts
+
+
+def relevance_features(title: str | None, text: str | None) -> dict[str, float]:
+    title_tokens, body_tokens = _tokens(title), _tokens(text)
+    length = len(body_tokens) + TITLE_WEIGHT * len(title_tokens)
+    counts = _term_counts(body_tokens)
+    for term, count in _term_counts(title_tokens).items():
+        counts[term] = counts.get(term, 0) + TITLE_WEIGHT * count
+    # BM25 term-frequency saturation: repeats help less and long pages do not win on volume.
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * length / AVERAGE_DOC_TOKENS)
+    return {term: count * (BM25_K1 + 1) / (count + norm) for term, count in counts.items()}
+
+
+def _sigmoid(value: float) -> float:
+    if value < -60:
+        return 0.0
+    return 1 / (1 + math.exp(-value))
+
+
+@dataclass
+class RelevanceModel:
+    weights: dict[str, float] = field(default_factory=lambda: dict(LEXICON))
+    bias: float = LEXICON_BIAS
+    samples: int = 0
+
+    def score_features(self, features: dict[str, float]) -> float:
+        return _sigmoid(self.bias + sum(self.weights.get(term, 0.0) * value for term, value in features.items()))
+
+    def score(self, title: str | None, text: str | None) -> float:
+        return self.score_features(relevance_features(title, text))
+
+    def as_dict(self) -> dict:
+        return {"weights": self.weights, "bias": self.bias, "samples": self.samples}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RelevanceModel:
+        return cls(
+            weights={str(term): float(weight) for term, weight in data["weights"].items()},
+            bias=float(data["bias"]),
+            samples=int(data.get("samples", 0)),
+        )
+
+
+def train_model(
+    samples: list[tuple[str | None, str | None, bool]],
+    epochs: int = 200,
+    learning_rate: float = 0.1,
+    l2: float = 0.01,
+) -> RelevanceModel:
+    # Logistic regression over the lexicon features, starting from the hand weights and pulled
+    # back towards them, so a few dozen labels adjust the lexicon instead of replacing it.
+    model = RelevanceModel(samples=len(samples))
+    rows = [(relevance_features(title, text), 1.0 if label else 0.0) for title, text, label in samples]
+    if not rows:
+        return model
+    for _ in range(epochs):
+        gradient: dict[str, float] = dict.fromkeys(model.weights, 0.0)
+        bias_gradient = 0.0
+        for features, label in rows:
+            error = model.score_features(features) - label
+            bias_gradient += error
+            for term, value in features.items():
+                gradient[term] += error * value
+        for term, weight in model.weights.items():
+            prior = LEXICON[term]
+            model.weights[term] = weight - learning_rate * (gradient[term] / len(rows) + l2 * (weight - prior))
+        model.bias -= learning_rate * bias_gradient / len(rows)
+    return model
+
+
+def save_model(model: RelevanceModel, path: str) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(model.as_dict(), indent=2, sort_keys=True))
+
+
+@lru_cache(maxsize=4)
+def load_model(path: str) -> RelevanceModel:
+    if not path or not Path(path).exists():
+        return RelevanceModel()
+    return RelevanceModel.from_dict(json.loads(Path(path).read_text()))
+
+
+def reject_evidence(features: dict[str, float], weights: dict[str, float]) -> bool:
+    # A low score alone only means the lexicon is silent; rejecting needs an off-topic signal
+    # (job post, event, promotion) and no on-topic term to outweigh it.
+    hits = [weights.get(term, 0.0) for term in features]
+    return any(weight < 0 for weight in hits) and not any(weight > 0 for weight in hits)
+
+
+def prefilter_decision(source: Source | None, score: float, features: dict[str, float]) -> PrefilterDecision:
+    settings = get_settings()
+    if score > settings.relevance_fast_track_above:
+        return "fast_track"
+    # Editors chose manual items themselves; they are never rejected unseen.
+    if score >= settings.relevance_reject_below or (source is not None and source.method == SourceMethod.manual):
+        return "triage"
+    if not reject_evidence(features, load_model(settings.relevance_model_path).weights):
+        return "triage"
+    return "reject" if settings.relevance_reject_enforced else "shadow_reject"
+
+
+def prefilter_precision(db: Session) -> dict:
+    decisions: dict[str, dict] = {
+        decision: {"documents": 0, "labelled": 0, "labelled_relevant": 0, "precision": None}
+        for decision in ("reject", "shadow_reject", "triage", "fast_track")
+    }
+    for decision, count in (
+        db.query(Document.relevance_decision, func.count(Document.id))
+        .filter(Document.relevance_decision.is_not(None))
+        .group_by(Document.relevance_decision)
+    ):
+        if decision in decisions:
+            decisions[decision]["documents"] = count
+    labelled = (
+        db.query(Document.relevance_decision, EvalSample.label_relevant, func.count(EvalSample.id))
+        .join(EvalSample, EvalSample.document_id == Document.id)
+        .filter(Document.relevance_decision.is_not(None))
+        .group_by(Document.relevance_decision, EvalSample.label_relevant)
+    )
+    for decision, label, count in labelled:
+        if decision not in decisions:
+            continue
+        decisions[decision]["labelled"] += count
+        if label:
+            decisions[decision]["labelled_relevant"] += count
+    for decision, stats in decisions.items():
+        if decision == "triage" or not stats["labelled"]:
+            continue
+        # A reject is correct when the label says irrelevant, a fast-track when it says relevant.
+        correct = stats["labelled_relevant"]
+        if decision in {"reject", "shadow_reject"}:
+            correct = stats["labelled"] - correct
+        stats["precision"] = round(correct / stats["labelled"], 4)
+    return {
+        "decisions": decisions,
+        "llm_calls_saved": decisions["reject"]["documents"] + decisions["fast_track"]["documents"],
+    }
@@ -0,0 +1,93 @@
+import heapq
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+
+from app.core.config import get_settings
+from app.core.time import as_utc, now_utc
+from app.models.entities import CircuitState, Source, SourceRun, SourceRunStatus
+from app.utils.hashing import sha256_text
+
+# Runs skipped for these reasons never contacted the source, so they say nothing about its change rate.
+NON_POLL_SKIP_REASONS = {"cooldown_active", "circuit_open"}
+
+
+def cooldown_seconds(source: Source) -> int:
+    return int((source.config_json or {}).get("cooldown_seconds", 0) or 0)
+
+
+def cooldown_until(source: Source) -> datetime | None:
+    cooldown = cooldown_seconds(source)
+    if not source.last_success_at or cooldown <= 0:
+        return None
+    return as_utc(source.last_success_at) + timedelta(seconds=cooldown)
+
+
+def poll_interval_min(source: Source) -> int:
+    return source.effective_poll_interval_min or source.poll_interval_min
+
+
+def is_poll_run(run: SourceRun) -> bool:
+    if run.status == SourceRunStatus.success:
+        return True
+    return run.status == SourceRunStatus.skipped and run.error not in NON_POLL_SKIP_REASONS
+
+
+def adaptive_poll_interval(source: Source, runs: Sequence[SourceRun]) -> int | None:
+    settings = get_settings()
+    if not settings.adaptive_polling_enabled:
+        return None
+    polls = sorted((run for run in runs if is_poll_run(run)), key=lambda run: as_utc(run.started_at))
+    polls = polls[-settings.adaptive_poll_history_runs :]
+    if len(polls) < settings.adaptive_poll_min_runs:
+        return None
+
+    config = source.config_json or {}
+    lower = int(config.get("min_poll_interval_min") or settings.adaptive_poll_min_interval_min)
+    upper = max(lower, int(config.get("max_poll_interval_min") or settings.adaptive_poll_max_interval_min))
+    current = poll_interval_min(source)
+    # The oldest run's items accumulated during the interval before it, so count that interval too.
+    span_min = (as_utc(polls[-1].started_at) - as_utc(polls[0].started_at)).total_seconds() / 60 + current
+    items = sum(run.items_ingested for run in polls)
+    if items:
+        target = settings.adaptive_poll_target_items * span_min / items
+    else:
+        target = current * settings.adaptive_poll_backoff_factor
+    # Tighten straight away so bursts are not missed, but widen at most 2x per run.
+    target = min(target, current * 2)
+    return int(min(upper, max(lower, round(target))))
+
+
+def _jitter(source: Source, interval: timedelta) -> timedelta:
+    # Stable per source so equal intervals spread out instead of firing on the same tick.
+    settings = get_settings()
+    fraction = int(sha256_text(f"source:{source.id}")[:8], 16) / 0xFFFFFFFF
+    spread = min(
+        interval.total_seconds() * settings.scheduler_jitter_ratio,
+        float(settings.scheduler_max_jitter_seconds),
+    )
+    return timedelta(seconds=spread * fraction)
+
+
+def next_due_at(source: Source) -> datetime | None:
+    if not source.last_scraped_at:
+        return None
+    interval = timedelta(minutes=poll_interval_min(source))
+    due = as_utc(source.last_scraped_at) + interval + _jitter(source, interval)
+    cooldown_end = cooldown_until(source)
+    if cooldown_end and cooldown_end > due:
+        due = cooldown_end
+    if source.circuit_state == CircuitState.open and source.circuit_open_until:
+        due = max(due, as_utc(source.circuit_open_until))
+    return due
+
+
+def due_sources(sources: Iterable[Source], now: datetime | None = None) -> list[Source]:
+    now = now or now_utc()
+    queue: list[tuple[datetime, int, Source]] = []
+    for source in sources:
+        heapq.heappush(queue, (next_due_at(source) or now, source.id, source))
+
+    due: list[Source] = []
+    while queue and queue[0][0] <= now:
+        due.append(heapq.heappop(queue)[2])
+    return due
@@ -15,15 +15,21 @@ celery_app.conf.task_eager_propagates = True
 
 celery_app.conf.task_routes = {
     "app.tasks.jobs.ingest_sources": {"queue": "ingest"},
+    "app.tasks.jobs.dispatch_due_sources": {"queue": "ingest"},
+    "app.tasks.jobs.enrich_pending_fulltext": {"queue": "ingest"},
     "app.tasks.jobs.triage_document": {"queue": "llm"},
     "app.tasks.jobs.analyze_document": {"queue": "llm"},
     "app.tasks.jobs.verify_document": {"queue": "llm"},
     "app.tasks.jobs.cleanup_idempotency": {"queue": "default"},
 }
 celery_app.conf.beat_schedule = {
-    "poll-sources-every-30-min": {
-        "task": "app.tasks.jobs.ingest_sources",
-        "schedule": crontab(minute="*/30"),
+    "dispatch-due-sources-every-minute": {
+        "task": "app.tasks.jobs.dispatch_due_sources",
+        "schedule": crontab(minute="*"),
+    },
+    "enrich-pending-fulltext-every-five-minutes": {
+        "task": "app.tasks.jobs.enrich_pending_fulltext",
+        "schedule": crontab(minute="*/5"),
     },
     "cleanup-idempotency-daily": {
         "task": "app.tasks.jobs.cleanup_idempotency",
@@ -1,14 +1,24 @@
-import asyncio
 from datetime import timedelta
+from time import perf_counter
 
+from celery import Signature
+from celery.result import AsyncResult
 from celery.utils.log import get_task_logger
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.core.observability import TASK_COUNT
+from app.core.observability import (
+    INGEST_FETCH_LATENCY,
+    LLM_CALLS_AVOIDED,
+    PMC_FULLTEXT_ENRICHMENTS,
+    TASK_COUNT,
+    TRIAGE_DEFERRED,
+)
 from app.core.time import now_utc
 from app.db.session import get_session_maker
 from app.models.entities import (
+    CircuitState,
     Document,
     DocumentStatus,
     JobDeadLetter,
@@ -20,11 +30,26 @@ from app.models.entities import (
     SourceMethod,
 )
 from app.schemas.common import LLMRunIn
+from app.services.blobstore import get_text, put_text
+from app.services.circuit_breaker import CIRCUIT_OPEN_ERROR, begin_attempt, record_failure, record_success
 from app.services.idempotency import cleanup_expired_keys
-from app.services.ingestion.html import fetch_html_items
+from app.services.ingestion.browser import WaitStrategy
+from app.services.ingestion.download import download_budget
+from app.services.ingestion.common import IngestedItem
+from app.services.ingestion.engine import EmitBatch, ItemBatch, SourceFetch, SourceFetchResult, SourceFetchStream
+from app.services.ingestion.html import fetch_html_items, fetch_html_listing
 from app.services.ingestion.manual import create_manual_item
-from app.services.ingestion.pubmed import fetch_pubmed_items
-from app.services.ingestion.rss import fetch_rss_items
+from app.services.ingestion.pmc import (
+    FULLTEXT_FETCHING,
+    FULLTEXT_PENDING,
+    FulltextResult,
+    FulltextTarget,
+    enrich_fulltext,
+)
+from app.services.ingestion.pubmed import DEFAULT_PUBMED_QUERY, fetch_pubmed_incremental
+from app.services.ingestion.rss import estimate_parse_savings, fetch_rss_items
+from app.services.ingestion.sitemap import fetch_sitemap_items
+from app.services.language import language_action
 from app.services.llm.client import run_analysis, run_triage, run_verification
 from app.services.llm.prompts import (
     ANALYSIS_PROMPT_VERSION,
@@ -33,14 +58,19 @@ from app.services.llm.prompts import (
 )
 from app.services.pipeline import (
     apply_verification,
+    bulk_upsert_raw_documents,
     bump_metric,
+    canonical_duplicate_of,
+    recent_external_ids,
     run_dedup_for_document,
     save_analysis,
     store_llm_run,
-    upsert_raw_document,
 )
+from app.services.relevance import load_model, prefilter_decision, relevance_features
+from app.services.scheduler import adaptive_poll_interval, cooldown_until, due_sources
 from app.state_machine.document_status import enforce_transition
 from app.tasks.celery_app import celery_app
+from app.tasks.runtime import consume_async, run_async
 
 logger = get_task_logger(__name__)
 
@@ -71,18 +101,25 @@ def cleanup_idempotency() -> dict:
 
 
 @celery_app.task(name="app.tasks.jobs.ingest_sources")
-def ingest_sources(source_id: int | None = None, trigger: str = "scheduled") -> dict:
+def ingest_sources(
+    source_id: int | None = None,
+    trigger: str = "scheduled",
+    source_ids: list[int] | None = None,
+) -> dict:
     db = _db()
+    settings = get_settings()
     try:
         sources_query = db.query(Source).filter(Source.active.is_(True))
         if source_id:
             sources_query = sources_query.filter(Source.id == source_id)
+        if source_ids is not None:
+            sources_query = sources_query.filter(Source.id.in_(source_ids))
         sources = sources_query.all()
 
-        ingested = 0
+        due: list[tuple[Source, SourceRun]] = []
         for source in sources:
             source.last_scraped_at = now_utc()
-            cooldown_sec = int((source.config_json or {}).get("cooldown_seconds", 0) or 0)
+            cooldown_end = cooldown_until(source)
             source_run = SourceRun(
                 source_id=source.id,
                 trigger_type=trigger,
@@ -93,89 +130,299 @@ def ingest_sources(source_id: int | None = None, trigger: str = "scheduled") ->
             )
             db.add(source_run)
             db.flush()
-            if source.last_success_at and cooldown_sec > 0:
-                if source.last_success_at + timedelta(seconds=cooldown_sec) > now_utc():
-                    source_run.status = SourceRunStatus.skipped
-                    source_run.error = "cooldown_active"
-                    source_run.finished_at = now_utc()
-                    db.commit()
-                    continue
+            if cooldown_end and cooldown_end > now_utc():
+                source_run.status = SourceRunStatus.skipped
+                source_run.error = "cooldown_active"
+                source_run.finished_at = now_utc()
+                continue
+            # Operator-triggered runs act as a half-open probe instead of waiting out the backoff.
+            source_run.circuit_state = begin_attempt(source, force=trigger == "manual")
+            if source_run.circuit_state == CircuitState.open:
+                source_run.status = SourceRunStatus.skipped
+                source_run.error = CIRCUIT_OPEN_ERROR
+                source_run.finished_at = now_utc()
+                continue
+            due.append((source, source_run))
+        db.commit()
+
+        due_sources = [source for source, _ in due]
+        cursors = _load_cursor_states(db, [source.id for source in due_sources])
+        known_ids = {
+            source.id: recent_external_ids(db, source.id, settings.rss_seen_id_limit)
+            for source in due_sources
+            if source.method == SourceMethod.rss
+        }
+        stream = SourceFetchStream(
+            due_sources,
+            lambda source, emit: _fetch_for_source(source, cursors.get(source.id), known_ids.get(source.id), emit),
+            max_concurrency=settings.ingest_max_concurrency,
+            per_host_concurrency=settings.ingest_per_host_concurrency,
+            queue_size=settings.ingest_stream_queue_size,
+        )
+        runs = {source.id: (source, source_run) for source, source_run in due}
+        batch_errors: dict[int, Exception] = {}
+        ingested = 0
+        store_seconds = 0.0
+
+        def handle(event: ItemBatch | SourceFetchResult) -> None:
+            nonlocal ingested, store_seconds
+            source, source_run = runs[event.source_id]
+            if isinstance(event, ItemBatch):
+                if event.source_id in batch_errors:
+                    return
+                started = perf_counter()
+                try:
+                    ingested += _store_item_batch(db, source, source_run, event.items)
+                except Exception as exc:  # noqa: BLE001
+                    db.rollback()
+                    batch_errors[event.source_id] = exc
+                finally:
+                    store_seconds += perf_counter() - started
+                return
 
+            INGEST_FETCH_LATENCY.labels(source.method.value).observe(event.elapsed_seconds)
             try:
-                items = asyncio.run(_fetch_for_source(db, source))
-                source_run.items_discovered = len(items)
-                queued_doc_ids: list[int] = []
-                for item in items:
-                    raw = upsert_raw_document(db, source, item.model_dump())
-                    doc = db.query(Document).filter(Document.raw_document_id == raw.id).one()
-                    run_dedup_for_document(db, doc)
-                    queued_doc_ids.append(doc.id)
-                    source_run.items_ingested += 1
-                    ingested += 1
-                source.last_success_at = now_utc()
-                source.failure_count = 0
-                source.last_error = None
-                source_run.status = SourceRunStatus.success
-                source_run.finished_at = now_utc()
-                db.commit()
-                for queued_doc_id in queued_doc_ids:
-                    triage_document.delay(queued_doc_id)
+                error = batch_errors.pop(event.source_id, None) or event.error
+                if error is not None:
+                    raise error
+                _finish_source_run(db, source, source_run, event.fetch or SourceFetch())
                 TASK_COUNT.labels("ingest_sources", "success").inc()
             except Exception as exc:  # noqa: BLE001
                 db.rollback()
-                source.failure_count += 1
+                record_failure(source)
                 source.last_error = str(exc)
-                db.add(source)
-                db.add(
-                    SourceRun(
-                        source_id=source.id,
-                        trigger_type=trigger,
-                        status=SourceRunStatus.failure,
-                        started_at=now_utc(),
-                        finished_at=now_utc(),
-                        items_discovered=0,
-                        items_ingested=0,
-                        error=str(exc),
-                    )
-                )
+                # Batches committed before the failure stay; the cursor is not advanced, so the
+                # next run refetches them and the (source, external_id) upsert skips repeats.
+                source_run.status = SourceRunStatus.failure
+                source_run.items_skipped = 0
+                source_run.parse_ms_saved = None
+                source_run.error = str(exc)
+                source_run.finished_at = now_utc()
                 db.commit()
                 _dead_letter(db, "ingest_sources", {"source_id": source.id}, exc, source_id=source.id)
                 TASK_COUNT.labels("ingest_sources", "failure").inc()
-        return {"ingested": ingested}
+
+        # The session is only touched from one handler thread at a time, never concurrently.
+        consume_async(stream, handle)
+
+        summary = stream.summary
+        summary.store_seconds = store_seconds
+        logger.info(
+            "Ingestion run fetched %s sources in %.2fs wall clock (%.2fs summed, %.1fx speedup, %.2fs storing)",
+            summary.sources,
+            summary.wall_clock_seconds,
+            summary.source_seconds_total,
+            summary.speedup,
+            summary.store_seconds,
+        )
+        return {"ingested": ingested, "run_summary": summary.as_dict()}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="app.tasks.jobs.dispatch_due_sources")
+def dispatch_due_sources() -> dict:
+    db = _db()
+    try:
+        sources = db.query(Source).filter(Source.active.is_(True)).all()
+        due = due_sources(sources)
+        if not due:
+            return {"dispatched": 0}
+        due_ids = [source.id for source in due]
+        for source in due:
+            # Claim the slot now so the next tick does not re-dispatch while the run is queued.
+            source.last_scraped_at = now_utc()
+        db.commit()
+        ingest_sources.delay(None, "scheduled", due_ids)
+        TASK_COUNT.labels("dispatch_due_sources", "success").inc()
+        return {"dispatched": len(due_ids), "source_ids": due_ids}
     finally:
         db.close()
 
 
-async def _fetch_for_source(db: Session, source: Source):
+def _load_cursor_states(db: Session, source_ids: list[int]) -> dict[int, dict]:
+    if not source_ids:
+        return {}
+    cursors = db.query(SourceCursor).filter(SourceCursor.source_id.in_(source_ids)).all()
+    return {
+        cursor.source_id: {
+            "etag": cursor.etag,
+            "last_modified": cursor.last_modified,
+            "cursor_json": dict(cursor.cursor_json or {}),
+        }
+        for cursor in cursors
+    }
+
+
+def _recent_source_runs(db: Session, source_id: int, limit: int) -> list[SourceRun]:
+    return (
+        db.query(SourceRun)
+        .filter(SourceRun.source_id == source_id, SourceRun.finished_at.is_not(None))
+        .order_by(SourceRun.started_at.desc(), SourceRun.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def _save_cursor_state(db: Session, source_id: int, state: dict) -> None:
+    cursor = db.query(SourceCursor).filter(SourceCursor.source_id == source_id).one_or_none()
+    if not cursor:
+        cursor = SourceCursor(source_id=source_id)
+        db.add(cursor)
+    cursor.etag = state.get("etag")
+    cursor.last_modified = state.get("last_modified")
+    cursor.cursor_json = state.get("cursor_json") or {}
+
+
+def _store_item_batch(db: Session, source: Source, source_run: SourceRun, items: list[IngestedItem]) -> int:
+    results = bulk_upsert_raw_documents(db, [(source, item.model_dump()) for item in items])
+    created = [document for document, is_new in results if is_new]
+    for document in created:
+        run_dedup_for_document(db, document)
+    source_run.items_discovered += len(items)
+    source_run.items_ingested += len(created)
+    db.commit()
+    # Existing documents are already past triage; only new ones are enqueued, as soon as they land.
+    for document in created:
+        enqueue_triage(source, document)
+    return len(created)
+
+
+def triage_signature(source: Source, document: Document) -> Signature:
+    if language_action(source, document.language) == "defer":
+        # Lower-priority messages are consumed after everything else waiting on the llm queue.
+        TRIAGE_DEFERRED.labels(document.language).inc()
+        return triage_document.signature((document.id,), priority=get_settings().deferred_triage_priority)
+    return triage_document.s(document.id)
+
+
+def enqueue_triage(source: Source, document: Document) -> AsyncResult:
+    return triage_signature(source, document).apply_async()
+
+
+def _finish_source_run(db: Session, source: Source, source_run: SourceRun, fetched: SourceFetch) -> None:
+    settings = get_settings()
+    source_run.items_skipped = fetched.stats.get("items_skipped", 0)
+    source_run.parse_ms_saved = fetched.stats.get("parse_ms_saved")
+    source_run.items_discovered += source_run.items_skipped
+    source_run.bytes_downloaded = fetched.bytes_downloaded
+    if fetched.cursor is not None:
+        _save_cursor_state(db, source.id, fetched.cursor)
+    source.last_success_at = now_utc()
+    source.last_error = None
+    record_success(source)
+    source_run.status = SourceRunStatus.success
+    if fetched.skip_reason and not source_run.items_ingested:
+        source_run.status = SourceRunStatus.skipped
+        source_run.error = fetched.skip_reason
+    source_run.finished_at = now_utc()
+    source.effective_poll_interval_min = adaptive_poll_interval(
+        source, _recent_source_runs(db, source.id, settings.adaptive_poll_history_runs * 2)
+    )
+    db.commit()
+
+
+async def _fetch_for_source(
+    source: Source,
+    cursor: dict | None = None,
+    known_ids: set[str] | None = None,
+    emit: EmitBatch | None = None,
+) -> SourceFetch:
+    max_bytes = (source.config_json or {}).get("max_download_bytes")
+    with download_budget(source.name, max_bytes) as budget:
+        fetched = await _fetch_source_items(source, cursor or {}, known_ids, emit)
+        if emit is not None:
+            batch_size = max(1, get_settings().ingest_upsert_batch_size)
+            for start in range(0, len(fetched.items), batch_size):
+                await emit(fetched.items[start : start + batch_size])
+            fetched.items = []
+    fetched.bytes_downloaded = budget.bytes_downloaded
+    return fetched
+
+
+async def _fetch_source_items(
+    source: Source, cursor: dict, known_ids: set[str] | None, emit: EmitBatch | None = None
+) -> SourceFetch:
     config = source.config_json or {}
     if source.method == SourceMethod.rss:
-        cursor = db.query(SourceCursor).filter(SourceCursor.source_id == source.id).one_or_none()
-        etag = cursor.etag if cursor else None
-        last_modified = cursor.last_modified if cursor else None
-        items, headers = await fetch_rss_items(config["url"], etag=etag, last_modified=last_modified)
-        if not cursor:
-            cursor = SourceCursor(source_id=source.id)
-            db.add(cursor)
-        cursor.etag = headers.get("etag")
-        cursor.last_modified = headers.get("last_modified")
-        return items
+        items, headers = await fetch_rss_items(
+            config["url"],
+            etag=cursor.get("etag"),
+            last_modified=cursor.get("last_modified"),
+            known_ids=known_ids,
+        )
+        cursor_json = dict(cursor.get("cursor_json") or {})
+        return SourceFetch(
+            items=items,
+            cursor={
+                "etag": headers.get("etag"),
+                "last_modified": headers.get("last_modified"),
+                "cursor_json": cursor_json,
+            },
+            stats=estimate_parse_savings(headers, cursor_json),
+            skip_reason=headers.get("skip_reason"),
+        )
     if source.method == SourceMethod.pubmed:
-        query = config.get("pubmed_query") or '(longevity OR "health span" OR aging) AND ("last 7 days"[PDat])'
-        return await fetch_pubmed_items(query=query)
+        query = config.get("pubmed_query") or DEFAULT_PUBMED_QUERY
+        items, pubmed_cursor = await fetch_pubmed_incremental(query, cursor.get("cursor_json") or {}, on_batch=emit)
+        return SourceFetch(items=items, cursor={**cursor, "cursor_json": pubmed_cursor})
     if source.method == SourceMethod.html:
         selectors = config.get("selectors") or []
-        return await fetch_html_items(config["url"], selectors=selectors)
+        wait = WaitStrategy.from_config(config)
+        if config.get("mode") == "listing":
+            items, listing_cursor = await fetch_html_listing(
+                config["url"],
+                selectors=selectors,
+                cursor_json=cursor.get("cursor_json") or {},
+                article_selectors=config.get("article_selectors") or [],
+                link_pattern=config.get("link_pattern"),
+                wait=wait,
+                on_batch=emit,
+            )
+            return SourceFetch(items=items, cursor={**cursor, "cursor_json": listing_cursor})
+        cursor_json = dict(cursor.get("cursor_json") or {})
+        items, validators = await fetch_html_items(
+            config["url"],
+            selectors=selectors,
+            wait=wait,
+            etag=cursor.get("etag"),
+            last_modified=cursor.get("last_modified"),
+            fingerprint=cursor_json.get("fingerprint"),
+        )
+        cursor_json["fingerprint"] = validators.get("fingerprint")
+        return SourceFetch(
+            items=items,
+            cursor={
+                "etag": validators.get("etag"),
+                "last_modified": validators.get("last_modified"),
+                "cursor_json": cursor_json,
+            },
+            skip_reason=validators.get("skip_reason"),
+        )
+    if source.method == SourceMethod.sitemap:
+        items, sitemap_cursor = await fetch_sitemap_items(
+            config["url"],
+            cursor_json=cursor.get("cursor_json") or {},
+            selectors=config.get("selectors") or [],
+            link_pattern=config.get("link_pattern"),
+            max_age_days=config.get("max_age_days"),
+            wait=WaitStrategy.from_config(config),
+            on_batch=emit,
+        )
+        return SourceFetch(items=items, cursor={**cursor, "cursor_json": sitemap_cursor})
     if source.method == SourceMethod.manual:
         if config.get("manual_text") and config.get("url"):
-            return [
-                create_manual_item(
-                    url=config["url"],
-                    text=config["manual_text"],
-                    title=config.get("title"),
-                    operator=config.get("operator", "editor"),
-                )
-            ]
-    return []
+            return SourceFetch(
+                items=[
+                    create_manual_item(
+                        url=config["url"],
+                        text=config["manual_text"],
+                        title=config.get("title"),
+                        operator=config.get("operator", "editor"),
+                    )
+                ]
+            )
+    return SourceFetch()
 
 
 @celery_app.task(name="app.tasks.jobs.triage_document")
@@ -183,7 +430,46 @@ def triage_document(document_id: int) -> dict:
     db = _db()
     try:
         doc = db.query(Document).filter(Document.id == document_id).one()
-        triage, raw = asyncio.run(run_triage(doc.normalized_text))
+        duplicate_of = canonical_duplicate_of(db, doc)
+        if duplicate_of is not None and doc.status == DocumentStatus.ingested:
+            # Same article already reached through another URL or source; skip the LLM spend.
+            enforce_transition(doc.status, DocumentStatus.rejected)
+            doc.status = DocumentStatus.rejected
+            bump_metric(db, "rejected_count")
+            db.commit()
+            TASK_COUNT.labels("triage_document", "duplicate").inc()
+            LLM_CALLS_AVOIDED.labels("duplicate").inc()
+            return {"is_relevant": False, "duplicate_of": duplicate_of}
+        if doc.status == DocumentStatus.ingested and (
+            language_action(doc.raw_document.source, doc.language) == "skip"
+        ):
+            enforce_transition(doc.status, DocumentStatus.rejected)
+            doc.status = DocumentStatus.rejected
+            bump_metric(db, "rejected_count")
+            db.commit()
+            TASK_COUNT.labels("triage_document", "language").inc()
+            LLM_CALLS_AVOIDED.labels("language").inc()
+            return {"is_relevant": False, "language": doc.language}
+        if doc.status == DocumentStatus.ingested and get_settings().relevance_prefilter_enabled:
+            features = relevance_features(doc.title, doc.normalized_text)
+            doc.relevance_score = load_model(get_settings().relevance_model_path).score_features(features)
+            doc.relevance_decision = prefilter_decision(doc.raw_document.source, doc.relevance_score, features)
+            # shadow_reject is recorded for precision review and still goes to LLM triage.
+            if doc.relevance_decision in {"reject", "fast_track"}:
+                relevant = doc.relevance_decision == "fast_track"
+                target = DocumentStatus.triaged if relevant else DocumentStatus.rejected
+                enforce_transition(doc.status, target)
+                doc.status = target
+                bump_metric(db, "triaged_count" if relevant else "rejected_count")
+                if relevant and _needs_fulltext(doc):
+                    doc.fulltext_status = FULLTEXT_PENDING
+                db.commit()
+                if relevant:
+                    _enqueue_analysis(doc)
+                TASK_COUNT.labels("triage_document", doc.relevance_decision).inc()
+                LLM_CALLS_AVOIDED.labels(f"prefilter_{doc.relevance_decision}").inc()
+                return {"is_relevant": relevant, "relevance_score": doc.relevance_score}
+        triage, raw = run_async(run_triage(doc.normalized_text, doc.title))
         store_llm_run(
             db,
             LLMRunIn(
@@ -194,6 +480,9 @@ def triage_document(document_id: int) -> dict:
                 prompt_version=TRIAGE_PROMPT_VERSION,
                 input_tokens=raw.get("input_tokens"),
                 output_tokens=raw.get("output_tokens"),
+                input_tokens_estimated=raw.get("input_tokens_estimated"),
+                prepared_tokens_estimated=raw.get("prepared_tokens_estimated"),
+                compression_ratio=raw.get("compression_ratio"),
                 latency_ms=raw.get("latency_ms"),
                 cost_usd=raw.get("cost_usd"),
                 raw_response_json=raw,
@@ -205,13 +494,15 @@ def triage_document(document_id: int) -> dict:
             doc.status = DocumentStatus.triaged
             bump_metric(db, "triaged_count")
             enqueue_analysis = True
+            if _needs_fulltext(doc):
+                doc.fulltext_status = FULLTEXT_PENDING
         else:
             enforce_transition(doc.status, DocumentStatus.rejected)
             doc.status = DocumentStatus.rejected
             bump_metric(db, "rejected_count")
         db.commit()
         if enqueue_analysis:
-            analyze_document.delay(doc.id)
+            _enqueue_analysis(doc)
         TASK_COUNT.labels("triage_document", "success").inc()
         return {"is_relevant": triage.is_relevant}
     except Exception as exc:  # noqa: BLE001
@@ -223,12 +514,125 @@ def triage_document(document_id: int) -> dict:
         db.close()
 
 
+def _needs_fulltext(doc: Document) -> bool:
+    # Only triage-positive PubMed items spend bandwidth on full text.
+    return (
+        get_settings().pmc_enrichment_enabled
+        and doc.fulltext_status is None
+        and doc.raw_document.source.method == SourceMethod.pubmed
+    )
+
+
+def _enqueue_analysis(doc: Document) -> None:
+    if doc.fulltext_status == FULLTEXT_PENDING:
+        # Delayed so documents triaged in the same burst share one PMID -> PMCID lookup.
+        enrich_pending_fulltext.apply_async(countdown=get_settings().pmc_enrich_delay_seconds)
+        return
+    analyze_document.delay(doc.id)
+
+
+def _analysis_text(doc: Document) -> str:
+    fulltext = get_text(doc.fulltext_ref) if doc.fulltext_ref else None
+    return f"{doc.normalized_text}\n\n{fulltext}" if fulltext else doc.normalized_text
+
+
+def _claim_fulltext_batch(db: Session) -> list[FulltextTarget]:
+    settings = get_settings()
+    # A worker that died mid-fetch leaves rows in "fetching"; they are claimable again after the lease.
+    lease_expired = now_utc() - timedelta(minutes=settings.pmc_fetch_lease_minutes)
+    docs = (
+        db.query(Document)
+        .filter(
+            or_(
+                Document.fulltext_status == FULLTEXT_PENDING,
+                and_(Document.fulltext_status == FULLTEXT_FETCHING, Document.updated_at < lease_expired),
+            )
+        )
+        .order_by(Document.id)
+        .limit(max(1, settings.pmc_enrich_batch_size))
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    targets = []
+    for doc in docs:
+        doc.fulltext_status = FULLTEXT_FETCHING
+        doc.fulltext_attempts += 1
+        meta = doc.raw_document.http_meta_json or {}
+        targets.append(
+            FulltextTarget(document_id=doc.id, pmid=meta.get("pmid"), doi=meta.get("doi"), pmcid=meta.get("pmcid"))
+        )
+    # Committing releases the row locks; the network calls below run outside any transaction.
+    db.commit()
+    return targets
+
+
+@celery_app.task(name="app.tasks.jobs.enrich_pending_fulltext")
+def enrich_pending_fulltext() -> dict:
+    settings = get_settings()
+    db = _db()
+    claimed: list[int] = []
+    try:
+        targets = _claim_fulltext_batch(db)
+        claimed = [target.document_id for target in targets]
+        if not targets:
+            return {"documents": 0}
+        results = run_async(enrich_fulltext(targets))
+        docs = db.query(Document).filter(Document.id.in_(claimed)).order_by(Document.id).all()
+        counts: dict[str, int] = {}
+        ready = []
+        for doc in docs:
+            result = results.get(doc.id) or FulltextResult(status="failed")
+            status = result.status
+            if status == "failed" and doc.fulltext_attempts < max(1, settings.pmc_fulltext_max_attempts):
+                # Picked up again by the next scheduled run; analysis waits for the retry.
+                status = "retry"
+                doc.fulltext_status = FULLTEXT_PENDING
+            else:
+                doc.fulltext_status = status
+                ready.append(doc)
+            doc.pmcid = result.pmcid or doc.pmcid
+            if result.text:
+                doc.fulltext_ref, _ = put_text(result.text)
+            counts[status] = counts.get(status, 0) + 1
+            PMC_FULLTEXT_ENRICHMENTS.labels(status, "cache" if result.cached else "fetch").inc()
+        db.commit()
+        # Analysis goes ahead on the abstract alone when no open-access text was found.
+        for doc in ready:
+            analyze_document.delay(doc.id)
+        TASK_COUNT.labels("enrich_pending_fulltext", "success").inc()
+        return {"documents": len(docs), **counts}
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        exhausted: list[int] = []
+        if claimed:
+            # Batch-level failures (e.g. the PMCID lookup) count against the attempts taken at claim
+            # time too, so a persistent outage cannot requeue the same rows forever.
+            stuck = db.query(Document).filter(
+                Document.id.in_(claimed), Document.fulltext_status == FULLTEXT_FETCHING
+            )
+            for doc in stuck.all():
+                if doc.fulltext_attempts < max(1, settings.pmc_fulltext_max_attempts):
+                    doc.fulltext_status = FULLTEXT_PENDING
+                else:
+                    doc.fulltext_status = "failed"
+                    exhausted.append(doc.id)
+                    PMC_FULLTEXT_ENRICHMENTS.labels("failed", "fetch").inc()
+            db.commit()
+        _dead_letter(db, "enrich_pending_fulltext", {}, exc)
+        TASK_COUNT.labels("enrich_pending_fulltext", "failure").inc()
+        for document_id in exhausted:
+            analyze_document.delay(document_id)
+        raise
+    finally:
+        db.close()
+
+
 @celery_app.task(name="app.tasks.jobs.analyze_document")
 def analyze_document(document_id: int) -> dict:
     db = _db()
     try:
         doc = db.query(Document).filter(Document.id == document_id).one()
-        analysis, raw = asyncio.run(run_analysis(doc.normalized_text))
+        analysis, raw = run_async(run_analysis(_analysis_text(doc), doc.title))
         store_llm_run(
             db,
             LLMRunIn(
@@ -239,6 +643,9 @@ def analyze_document(document_id: int) -> dict:
                 prompt_version=ANALYSIS_PROMPT_VERSION,
                 input_tokens=raw.get("input_tokens"),
                 output_tokens=raw.get("output_tokens"),
+                input_tokens_estimated=raw.get("input_tokens_estimated"),
+                prepared_tokens_estimated=raw.get("prepared_tokens_estimated"),
+                compression_ratio=raw.get("compression_ratio"),
                 latency_ms=raw.get("latency_ms"),
                 cost_usd=raw.get("cost_usd"),
                 raw_response_json=raw,
@@ -263,7 +670,7 @@ def verify_document(document_id: int) -> dict:
     db = _db()
     try:
         doc = db.query(Document).filter(Document.id == document_id).one()
-        verification, raw = asyncio.run(run_verification(doc.normalized_text))
+        verification, raw = run_async(run_verification(_analysis_text(doc), doc.title))
         store_llm_run(
             db,
             LLMRunIn(
@@ -274,6 +681,9 @@ def verify_document(document_id: int) -> dict:
                 prompt_version=VERIFICATION_PROMPT_VERSION,
                 input_tokens=raw.get("input_tokens"),
                 output_tokens=raw.get("output_tokens"),
+                input_tokens_estimated=raw.get("input_tokens_estimated"),
+                prepared_tokens_estimated=raw.get("prepared_tokens_estimated"),
+                compression_ratio=raw.get("compression_ratio"),
                 latency_ms=raw.get("latency_ms"),
                 cost_usd=raw.get("cost_usd"),
                 raw_response_json=raw,
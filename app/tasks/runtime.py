@@ -0,0 +1,72 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterable, Callable, Coroutine
+from typing import Any
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from app.core.http import close_http_clients
+from app.services.ingestion.browser import close_browser_pool
+from app.services.ingestion.executor import reset_executors, shutdown_executors
+from app.utils.ratelimit import close_rate_limiter
+
+_local = threading.local()
+
+
+def _worker_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _local.loop = loop
+    return loop
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    # Tasks share one long-lived loop per worker thread so pooled HTTP clients keep
+    # their connections alive across task executions.
+    return _worker_loop().run_until_complete(coro)
+
+
+async def _consume[T](iterable: AsyncIterable[T], handle: Callable[[T], None]) -> None:
+    iterator = aiter(iterable)
+    try:
+        async for item in iterator:
+            # Blocking work runs in a worker thread so the loop keeps driving in-flight fetches
+            # and their timeouts meanwhile.
+            await asyncio.to_thread(handle, item)
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def consume_async[T](iterable: AsyncIterable[T], handle: Callable[[T], None]) -> None:
+    # Each handler call gets its own thread-local loop if it needs run_async (eager tasks).
+    run_async(_consume(iterable, handle))
+
+
+def shutdown_worker_loop() -> None:
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(close_http_clients())
+        loop.run_until_complete(close_rate_limiter())
+        loop.run_until_complete(close_browser_pool())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+        _local.loop = None
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**_: Any) -> None:
+    # A loop inherited through fork belongs to the parent process.
+    _local.loop = None
+    reset_executors()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**_: Any) -> None:
+    shutdown_worker_loop()
+    shutdown_executors(wait=False)
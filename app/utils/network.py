@@ -1,8 +1,15 @@
+import asyncio
 import ipaddress
 import socket
+from collections.abc import Iterable
+from dataclasses import dataclass
+from time import monotonic
 from urllib.parse import urlparse
 
+import httpcore
+
 from app.core.config import get_settings
+from app.core.observability import DNS_CACHE_LOOKUPS
 
 
 class HostNotAllowedError(ValueError):
@@ -13,32 +20,144 @@ class UnsafeUrlError(ValueError):
     pass
 
 
+@dataclass
+class _DnsVerdict:
+    addresses: list[str]
+    expires_at: float
+
+
+_DNS_CACHE: dict[str, _DnsVerdict] = {}
+
+
+def _is_unsafe_ip(ip: str) -> bool:
+    parsed = ipaddress.ip_address(ip.split("%", 1)[0])
+    return parsed.is_private or parsed.is_loopback or parsed.is_link_local or parsed.is_reserved
+
+
+def _safe_addresses(infos: Iterable[tuple]) -> list[str]:
+    addresses: list[str] = []
+    for info in infos:
+        ip = info[4][0]
+        if _is_unsafe_ip(ip):
+            return []
+        if ip not in addresses:
+            addresses.append(ip)
+    return addresses
+
+
 def _is_private_host(host: str) -> bool:
     try:
         infos = socket.getaddrinfo(host, None)
     except socket.gaierror:
         return True
-    for info in infos:
-        ip = info[4][0]
-        parsed = ipaddress.ip_address(ip)
-        if parsed.is_private or parsed.is_loopback or parsed.is_link_local or parsed.is_reserved:
-            return True
-    return False
+    return not _safe_addresses(infos)
 
 
-def assert_allowed_url(url: str) -> None:
+def _cache_verdict(host: str, addresses: list[str]) -> None:
     settings = get_settings()
+    ttl = settings.dns_cache_ttl_seconds if addresses else settings.dns_negative_cache_ttl_seconds
+    if host not in _DNS_CACHE and len(_DNS_CACHE) >= settings.dns_cache_max_entries:
+        _DNS_CACHE.pop(next(iter(_DNS_CACHE)))
+    _DNS_CACHE[host] = _DnsVerdict(addresses=addresses, expires_at=monotonic() + ttl)
+
+
+async def resolve_safe_addresses(host: str) -> list[str]:
+    host = host.lower()
+    verdict = _DNS_CACHE.get(host)
+    if verdict and verdict.expires_at > monotonic():
+        DNS_CACHE_LOOKUPS.labels("hit").inc()
+        addresses = verdict.addresses
+    else:
+        DNS_CACHE_LOOKUPS.labels("miss").inc()
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        except socket.gaierror:
+            infos = []
+        addresses = _safe_addresses(infos)
+        _cache_verdict(host, addresses)
+    if not addresses:
+        raise UnsafeUrlError("Resolved host is private or unsafe")
+    return addresses
+
+
+def clear_dns_cache() -> None:
+    _DNS_CACHE.clear()
+
+
+def _validated_host(url: str) -> str:
     parsed = urlparse(url)
     if parsed.scheme not in {"http", "https"}:
         raise UnsafeUrlError("Only http/https URLs are supported")
     host = (parsed.hostname or "").lower()
     if not host:
         raise UnsafeUrlError("URL host is missing")
-    if _is_private_host(host):
-        raise UnsafeUrlError("Resolved host is private or unsafe")
+    return host
 
-    allowlist = settings.allowed_fetch_host_list
+
+def _check_allowlist(host: str) -> None:
+    allowlist = get_settings().allowed_fetch_host_list
     if not allowlist:
         return
     if host not in allowlist:
         raise HostNotAllowedError(f"Host not in allowlist: {host}")
+
+
+def assert_allowed_url(url: str) -> None:
+    host = _validated_host(url)
+    if _is_private_host(host):
+        raise UnsafeUrlError("Resolved host is private or unsafe")
+    _check_allowlist(host)
+
+
+async def assert_allowed_url_async(url: str) -> list[str]:
+    host = _validated_host(url)
+    if get_settings().http_cassette_mode == "replay":
+        # Replayed responses never touch the network, and recorded hosts already passed this check.
+        _check_allowlist(host)
+        return []
+    addresses = await resolve_safe_addresses(host)
+    _check_allowlist(host)
+    return addresses
+
+
+# Connects only to addresses that passed the safety check, so the DNS answer cannot change
+# between validation and connect (DNS rebinding). TLS SNI/verification still use the hostname.
+class PinnedDNSBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, backend: httpcore.AsyncNetworkBackend) -> None:
+        self._backend = backend
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        last_error: Exception | None = None
+        for address in await resolve_safe_addresses(host):
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_error = exc
+        assert last_error is not None
+        raise last_error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
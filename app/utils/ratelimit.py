@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from time import monotonic
+from typing import Protocol
+
+from redis import asyncio as redis_asyncio
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+NCBI_HOST = "eutils.ncbi.nlm.nih.gov"
+KEY_PREFIX = "longevai:ratelimit:"
+DEGRADED_RETRY_SECONDS = 30.0
+
+# Reserves one token and returns how long the caller must wait for it. Tokens may go
+# negative, which queues callers fairly across workers. Uses the Redis clock so worker
+# clock skew does not matter.
+TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+tokens = tokens - 1
+local wait = 0
+if tokens < 0 then
+  wait = -tokens / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class TokenBucketBackend(Protocol):
+    async def reserve(self, key: str, rate: float, capacity: float) -> float: ...
+
+    async def aclose(self) -> None: ...
+
+
+class InMemoryTokenBucket:
+    def __init__(self) -> None:
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    async def reserve(self, key: str, rate: float, capacity: float) -> float:
+        now = monotonic()
+        tokens, ts = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + max(0.0, now - ts) * rate) - 1
+        self._buckets[key] = (tokens, now)
+        return -tokens / rate if tokens < 0 else 0.0
+
+    async def aclose(self) -> None:
+        return None
+
+
+class RedisTokenBucket:
+    def __init__(self, client: redis_asyncio.Redis) -> None:
+        self._client = client
+        self._script = client.register_script(TOKEN_BUCKET_LUA)
+
+    async def reserve(self, key: str, rate: float, capacity: float) -> float:
+        wait = await self._script(keys=[key], args=[rate, capacity])
+        return float(wait)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def host_rate_limits() -> dict[str, float]:
+    settings = get_settings()
+    ncbi_default = 10.0 if settings.ncbi_api_key else 3.0
+    limits = {NCBI_HOST: settings.ncbi_rate_limit_per_second or ncbi_default}
+    for entry in settings.rate_limits.split(","):
+        host, _, rate = entry.partition("=")
+        if host.strip() and rate.strip():
+            limits[host.strip().lower()] = float(rate)
+    return limits
+
+
+def bucket_capacity(host: str, rate: float) -> float:
+    # A full bucket plus one second of refill allows capacity + rate requests in that second,
+    # so hosts with a hard per-second cap (NCBI: 3/s, 10/s with a key) never get a burst.
+    if host.lower() == NCBI_HOST:
+        return 1.0
+    return max(1.0, rate * get_settings().rate_limit_burst_seconds)
+
+
+class RateLimiter:
+    def __init__(self, backend: TokenBucketBackend, fallback: TokenBucketBackend | None = None) -> None:
+        self._backend = backend
+        self._fallback = fallback or InMemoryTokenBucket()
+        self._limits = host_rate_limits()
+        self._degraded_until = 0.0
+
+    async def acquire(self, host: str) -> float:
+        rate = self._limits.get(host.lower())
+        if not rate:
+            return 0.0
+        capacity = bucket_capacity(host, rate)
+        key = f"{KEY_PREFIX}{host.lower()}"
+        if monotonic() < self._degraded_until:
+            wait = await self._fallback.reserve(key, rate, capacity)
+        else:
+            try:
+                wait = await self._backend.reserve(key, rate, capacity)
+            except RedisError as exc:
+                # Keep fetching under a per-process quota rather than failing the source.
+                logger.warning("Redis rate limiter unavailable, using in-process bucket: %s", exc)
+                self._degraded_until = monotonic() + DEGRADED_RETRY_SECONDS
+                wait = await self._fallback.reserve(key, rate, capacity)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    async def aclose(self) -> None:
+        await self._backend.aclose()
+
+
+_limiters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RateLimiter] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _build_backend() -> TokenBucketBackend:
+    settings = get_settings()
+    if settings.rate_limit_backend == "redis":
+        return RedisTokenBucket(redis_asyncio.from_url(settings.redis_url, socket_connect_timeout=2))
+    return InMemoryTokenBucket()
+
+
+def get_rate_limiter() -> RateLimiter:
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = RateLimiter(_build_backend())
+        _limiters[loop] = limiter
+    return limiter
+
+
+async def close_rate_limiter() -> None:
+    limiter = _limiters.pop(asyncio.get_running_loop(), None)
+    if limiter is not None:
+        await limiter.aclose()
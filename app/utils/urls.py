@@ -0,0 +1,121 @@
+import posixpath
+import re
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from app.utils.hashing import sha256_text
+
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "yclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "mkt_tok",
+    "_hsenc",
+    "_hsmi",
+    "cmpid",
+    "ocid",
+    "ref",
+    "ref_src",
+    "spm",
+    "sr_share",
+    "s_kwcid",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_", "__hs")
+
+# Wrapper URLs that carry the destination in a query parameter.
+REDIRECT_PARAMS = {
+    "www.google.com": ("/url", ("q", "url")),
+    "google.com": ("/url", ("q", "url")),
+    "l.facebook.com": ("/l.php", ("u",)),
+    "lm.facebook.com": ("/l.php", ("u",)),
+    "out.reddit.com": ("", ("url",)),
+    "medium.com": ("/r/", ("url",)),
+    "l.messenger.com": ("/l.php", ("u",)),
+}
+HOST_ALIASES = {
+    "dx.doi.org": "doi.org",
+    "m.youtube.com": "youtube.com",
+}
+LEGACY_PUBMED = re.compile(r"^/pubmed/(\d+)/?$")
+# youtu.be/<id> is the share form of youtube.com/watch?v=<id>.
+SHORT_YOUTUBE = re.compile(r"^/([A-Za-z0-9_-]+)$")
+LINK_TAG = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+ATTR = re.compile(r"""([a-zA-Z-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+HEAD_END = re.compile(r"</head\s*>|<body\b", re.IGNORECASE)
+
+
+def _unwrap_redirect(host: str, path: str, query: str) -> str | None:
+    rule = REDIRECT_PARAMS.get(host)
+    if not rule or not path.startswith(rule[0]):
+        return None
+    params = dict(parse_qsl(query))
+    for name in rule[1]:
+        target = params.get(name)
+        if target and target.startswith(("http://", "https://")):
+            return target
+    return None
+
+
+def _is_tracking(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    url = url.strip()
+    for _ in range(3):
+        parts = urlsplit(url)
+        target = _unwrap_redirect((parts.hostname or "").lower(), parts.path, parts.query)
+        if not target:
+            break
+        url = target
+
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in {"http", "https"} or not parts.hostname:
+        return url
+    host = parts.hostname.lower().rstrip(".").removeprefix("www.")
+    host = HOST_ALIASES.get(host, host)
+    port = parts.port
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    path = posixpath.normpath(path) if path != "/" else path
+    if host == "ncbi.nlm.nih.gov" and (match := LEGACY_PUBMED.match(path)):
+        netloc, path = "pubmed.ncbi.nlm.nih.gov", f"/{match.group(1)}"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    if host == "youtu.be" and (match := SHORT_YOUTUBE.match(path)):
+        netloc, path = "youtube.com", "/watch"
+        params.append(("v", match.group(1)))
+    query = urlencode(sorted((name, value) for name, value in params if not _is_tracking(name)))
+    # http and https variants of the same page collapse onto one key.
+    return urlunsplit(("https", netloc, path, query, ""))
+
+
+def url_hash(url: str) -> str:
+    return sha256_text(canonicalize_url(url))
+
+
+def canonical_link(html: str | None, base_url: str) -> str | None:
+    if not html:
+        return None
+    head_end = HEAD_END.search(html)
+    head = html[: head_end.start()] if head_end else html[:65536]
+    for tag in LINK_TAG.findall(head):
+        attrs = {name.lower(): quoted or single or bare for name, quoted, single, bare in ATTR.findall(tag)}
+        if "canonical" not in attrs.get("rel", "").lower().split() or not attrs.get("href"):
+            continue
+        href = urljoin(base_url, attrs["href"].strip())
+        if urlsplit(href).scheme not in {"http", "https"}:
+            return None
+        # A canonical pointing at the site root from a deeper page is a template bug, not a real alias.
+        if urlsplit(href).path in {"", "/"} and urlsplit(base_url).path not in {"", "/"}:
+            return None
+        return href
+    return None
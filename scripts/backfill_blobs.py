@@ -0,0 +1,60 @@
+import argparse
+
+from sqlalchemy import or_
+from sqlalchemy.orm import undefer
+
+from app.db.session import get_session_maker
+from app.models.entities import RawDocument
+from app.services.blobstore import store_raw_payloads
+
+
+def backfill(batch_size: int = 500, dry_run: bool = False) -> dict[str, int]:
+    db = get_session_maker()()
+    stats = {"rows": 0, "bytes_moved": 0}
+    last_id = 0
+    try:
+        while True:
+            rows = (
+                db.query(RawDocument)
+                .options(undefer(RawDocument.raw_text), undefer(RawDocument.raw_html))
+                .filter(
+                    RawDocument.id > last_id,
+                    RawDocument.raw_text_ref.is_(None),
+                    RawDocument.raw_html_ref.is_(None),
+                    or_(RawDocument.raw_text.is_not(None), RawDocument.raw_html.is_not(None)),
+                )
+                .order_by(RawDocument.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            for raw in rows:
+                last_id = raw.id
+                stats["rows"] += 1
+                if dry_run:
+                    stats["bytes_moved"] += len((raw.raw_text or "").encode()) + len((raw.raw_html or "").encode())
+                    continue
+                store_raw_payloads(raw, raw.raw_text, raw.raw_html)
+                stats["bytes_moved"] += (raw.raw_text_size or 0) + (raw.raw_html_size or 0)
+            if dry_run:
+                db.rollback()
+            else:
+                db.commit()
+        return stats
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Move inline raw_text/raw_html payloads into the blob store")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="Count rows and bytes without moving them")
+    args = parser.parse_args()
+
+    stats = backfill(batch_size=args.batch_size, dry_run=args.dry_run)
+    print(f"Backfill completed: {stats}")
+
+
+if __name__ == "__main__":
+    main()
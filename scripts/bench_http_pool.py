@@ -0,0 +1,74 @@
+import argparse
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+
+import httpx
+
+from app.core.http import build_transport
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        body = b"<rss><channel><title>bench</title></channel></rss>"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        return
+
+
+async def _per_request_clients(url: str, requests: int) -> None:
+    for _ in range(requests):
+        async with httpx.AsyncClient(timeout=20) as client:
+            (await client.get(url)).raise_for_status()
+
+
+async def _shared_client(url: str, requests: int) -> None:
+    # Same pooled transport as get_http_client(), minus DNS pinning, which rejects loopback.
+    async with httpx.AsyncClient(transport=build_transport(), timeout=20) as client:
+        for _ in range(requests):
+            (await client.get(url)).raise_for_status()
+
+
+def _measure(server: _CountingServer, label: str, run) -> None:
+    server.connections = 0
+    started = perf_counter()
+    asyncio.run(run)
+    elapsed = perf_counter() - started
+    print(f"{label:<22} connections={server.connections:<5} elapsed={elapsed * 1000:.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-request and pooled HTTP clients")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    server = _CountingServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/feed"
+    try:
+        _measure(server, "per-request client", _per_request_clients(url, args.requests))
+        _measure(server, "shared pooled client", _shared_client(url, args.requests))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import asyncio
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.http import build_transport
+from app.services.ingestion.executor import cpu_executor_kind, run_cpu_bound, shutdown_executors
+from app.services.ingestion.rss import _parse_feed
+
+PARAGRAPH = "<p>Rapamycin extended median lifespan in <b>aged mice</b> by 12%.</p>" * 40
+
+
+def _feed(entries: int) -> bytes:
+    items = "".join(
+        f"<item><guid>e{i}</guid><link>https://example.com/{i}</link><title>Entry {i}</title>"
+        f"<description><![CDATA[{PARAGRAPH}]]></description></item>"
+        for i in range(entries)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>bench</title>{items}</channel></rss>'.encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b""
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format: str, *args) -> None:
+        return
+
+
+async def _loop_lag(stop: asyncio.Event, samples: list[float]) -> None:
+    while not stop.is_set():
+        started = perf_counter()
+        await asyncio.sleep(0.005)
+        samples.append(perf_counter() - started - 0.005)
+
+
+async def _ingest(base_url: str, feeds: int) -> tuple[int, float]:
+    # Same fetch/parse split as fetch_rss_items, minus the URL guard, which rejects loopback.
+    async with httpx.AsyncClient(transport=build_transport(), timeout=60) as client:
+
+        async def _one(index: int) -> int:
+            response = await client.get(f"{base_url}/feed/{index}")
+            entries, _, _ = await run_cpu_bound(_parse_feed, response.text, set())
+            return len(entries)
+
+        stop = asyncio.Event()
+        samples: list[float] = []
+        probe = asyncio.create_task(_loop_lag(stop, samples))
+        counts = await asyncio.gather(*(_one(index) for index in range(feeds)))
+        stop.set()
+        await probe
+        return sum(counts), max(samples, default=0.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare parse executors for concurrent RSS ingestion")
+    parser.add_argument("--feeds", type=int, default=16)
+    parser.add_argument("--entries", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--modes", default="inline,thread,process")
+    args = parser.parse_args()
+
+    _Handler.body = _feed(args.entries)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ["INGEST_PARSE_WORKERS"] = str(args.workers)
+    try:
+        for mode in args.modes.split(","):
+            os.environ["INGEST_PARSE_EXECUTOR"] = mode
+            get_settings.cache_clear()
+            # Warm the pool so worker start-up is not counted.
+            asyncio.run(run_cpu_bound(_parse_feed, _feed(1).decode(), set()))
+            started = perf_counter()
+            items, max_lag = asyncio.run(_ingest(base_url, args.feeds))
+            elapsed = perf_counter() - started
+            # A Celery prefork child resolves "process" to "thread"; this prints what actually ran.
+            print(
+                f"{mode:<8} ran={cpu_executor_kind():<8} feeds={args.feeds} items={items} elapsed={elapsed * 1000:.0f}ms "
+                f"items/s={items / elapsed:.0f} max_loop_lag={max_lag * 1000:.1f}ms"
+            )
+            shutdown_executors()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
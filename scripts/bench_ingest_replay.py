@@ -0,0 +1,97 @@
+import argparse
+import os
+import statistics
+from time import perf_counter
+
+
+def _p95(values: list[float]) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=20, method="inclusive")[-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark _fetch_for_source plus upsert against a recorded HTTP cassette"
+    )
+    parser.add_argument("--cassette", default="data/cassettes/ingest.jsonl.zst")
+    parser.add_argument("--record", action="store_true", help="Fetch live and (re)record the cassette")
+    parser.add_argument("--source", action="append", default=[], help="Source name (repeatable); default all active")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Multiplier on recorded latency")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Extra fixed latency per request")
+    args = parser.parse_args()
+
+    # Settings are cached, so the cassette mode has to be in the environment before first use.
+    os.environ["HTTP_CASSETTE_MODE"] = "record" if args.record else "replay"
+    os.environ["HTTP_CASSETTE_PATH"] = args.cassette
+    os.environ["HTTP_CASSETTE_LATENCY_SCALE"] = str(args.latency_scale)
+    os.environ["HTTP_CASSETTE_LATENCY_MS"] = str(args.latency_ms)
+
+    from app.core.cassette import get_cassette
+    from app.core.config import get_settings
+    from app.db.session import get_session_maker
+    from app.models.entities import Source, SourceMethod
+    from app.services.pipeline import upsert_raw_document
+    from app.tasks.jobs import _fetch_for_source
+    from app.tasks.runtime import run_async, shutdown_worker_loop
+
+    get_settings.cache_clear()
+    db = get_session_maker()()
+    query = db.query(Source).filter(Source.active.is_(True), Source.method != SourceMethod.manual)
+    if args.source:
+        query = query.filter(Source.name.in_(args.source))
+    sources = query.order_by(Source.name).all()
+    cassette = get_cassette(args.cassette)
+    runs = 1 if args.record else args.runs
+
+    timings: dict[str, list[float]] = {source.name: [] for source in sources}
+    items: dict[str, int] = dict.fromkeys(timings, 0)
+    errors: dict[str, str] = {}
+    total_started = perf_counter()
+    try:
+        for _ in range(runs):
+            cassette.rewind()
+            for source in sources:
+                started = perf_counter()
+                try:
+                    # Fresh cursors keep every run identical; conditional GETs would change what is replayed.
+                    fetched = run_async(_fetch_for_source(source, {}, set()))
+                    for item in fetched.items:
+                        upsert_raw_document(db, source, item.model_dump())
+                    db.flush()
+                except Exception as exc:  # noqa: BLE001
+                    errors[source.name] = str(exc)
+                    db.rollback()
+                    continue
+                finally:
+                    timings[source.name].append(perf_counter() - started)
+                items[source.name] += len(fetched.items)
+                # Measure the upsert without leaving benchmark rows behind.
+                db.rollback()
+    finally:
+        shutdown_worker_loop()
+        db.close()
+    total_seconds = perf_counter() - total_started
+
+    print(f"{'source':40} {'items':>7} {'items/s':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, values in timings.items():
+        if name in errors:
+            print(f"{name[:40]:40} error: {errors[name][:60]}")
+            continue
+        seconds = sum(values)
+        rate = items[name] / seconds if seconds else 0.0
+        print(
+            f"{name[:40]:40} {items[name]:>7} {rate:>9.1f} "
+            f"{statistics.median(values) * 1000:>9.1f} {_p95(values) * 1000:>9.1f}"
+        )
+    total_items = sum(items.values())
+    print(
+        f"{runs} run(s), {len(sources)} sources, {total_items} items in {total_seconds:.2f}s "
+        f"({total_items / total_seconds if total_seconds else 0.0:.1f} items/s); "
+        f"cassette {args.cassette} holds {len(cassette)} responses"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from time import perf_counter
+
+from app.services.ingestion.pubmed import PubmedArticleStream, _article_to_item
+
+ARTICLE = (
+    "<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+    "<ArticleTitle>Rapamycin and healthy aging cohort {pmid}</ArticleTitle>"
+    "<Abstract><AbstractText>{abstract}</AbstractText></Abstract></Article></MedlineCitation>"
+    "<PubmedData><ArticleIdList><ArticleId IdType=\"doi\">10.1234/bench.{pmid}</ArticleId>"
+    "</ArticleIdList></PubmedData></PubmedArticle>"
+)
+ABSTRACT = "Longevity intervention improved healthspan markers in aged mice. " * 30
+
+
+def write_fixture(path: Path, articles: int) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("<?xml version=\"1.0\"?><PubmedArticleSet>")
+        for pmid in range(1, articles + 1):
+            handle.write(ARTICLE.format(pmid=pmid, abstract=ABSTRACT))
+        handle.write("</PubmedArticleSet>")
+
+
+def _parse_tree(path: Path) -> int:
+    root = ET.fromstring(path.read_text(encoding="utf-8"))
+    return len([item for item in map(_article_to_item, root.findall(".//PubmedArticle")) if item])
+
+
+def _parse_stream(path: Path, chunk_size: int = 64 * 1024) -> int:
+    stream = PubmedArticleStream()
+    count = 0
+    with path.open("rb") as handle:
+        while chunk := handle.read(chunk_size):
+            count += len(stream.feed(chunk))
+    return count + len(stream.close())
+
+
+def run_mode(mode: str, path: Path) -> None:
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = perf_counter()
+    count = _parse_tree(path) if mode == "tree" else _parse_stream(path)
+    elapsed = perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        f"{mode:<7} articles={count:<7} elapsed={elapsed:.2f}s "
+        f"throughput={count / elapsed:,.0f}/s rss_growth={(peak_kb - baseline_kb) / 1024:.1f}MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare full-tree and streaming PubMed parsing")
+    parser.add_argument("--articles", type=int, default=20000)
+    parser.add_argument("--fixture", type=Path, default=None)
+    parser.add_argument("--mode", choices=["tree", "stream"], default=None)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.fixture)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture = args.fixture or Path(tmp) / "pubmed_fixture.xml"
+        if not fixture.exists():
+            write_fixture(fixture, args.articles)
+        print(f"fixture={fixture} size={fixture.stat().st_size / 1024 / 1024:.1f}MiB")
+        for mode in ("tree", "stream"):
+            # Separate processes so each mode reports its own peak RSS.
+            subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--fixture", str(fixture)], check=True
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -38,7 +38,7 @@ SOURCE_CATALOG = [
         "poll_interval_min": 60,
         "trust_tier": "scientific",
         "config_json": {
-            "pubmed_query": '(longevity OR "health span" OR aging) AND ("last 7 days"[PDat])',
+            "pubmed_query": '(longevity OR "health span" OR aging)',
             "cooldown_seconds": 3600,
             "onboarding_status": "ready",
             "onboarding_notes": "Core scientific feed for weekly novelty scanning.",
@@ -71,14 +71,15 @@ SOURCE_CATALOG = [
     },
     {
         "name": "Huberman Lab",
-        "method": SourceMethod.manual,
+        "method": SourceMethod.sitemap,
         "active": False,
         "poll_interval_min": 1440,
         "trust_tier": "influencer",
         "config_json": {
-            "url": "https://www.hubermanlab.com/",
+            "url": "https://www.hubermanlab.com/sitemap.xml",
+            "link_pattern": "/(episode|newsletter)/",
             "onboarding_status": "scaffold",
-            "onboarding_notes": "No stable RSS endpoint confirmed; use manual ingest or implement sitemap-based monitor.",
+            "onboarding_notes": "No stable RSS endpoint; sitemap monitor configured, verify link_pattern before activating.",
         },
     },
     {
@@ -100,10 +101,13 @@ SOURCE_CATALOG = [
         "trust_tier": "institution",
         "config_json": {
             "url": "https://eriba.umcg.nl/future-events/news/",
-            "selectors": ["article", "h2", ".entry-content p"],
+            "mode": "listing",
+            "selectors": ["article h2 a", "article a"],
+            "article_selectors": ["article", "h1", ".entry-content p"],
+            "link_pattern": "/news/",
             "cooldown_seconds": 7200,
             "onboarding_status": "scaffold",
-            "onboarding_notes": "Domain is reachable; needs collection-diff monitor for multi-article detection.",
+            "onboarding_notes": "Listing monitor configured; verify link selectors against the live page before activating.",
         },
     },
     {
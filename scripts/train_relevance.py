@@ -0,0 +1,69 @@
+import argparse
+
+from app.core.config import get_settings
+from app.db.session import get_session_maker
+from app.models.entities import Document, EvalSample
+from app.services.relevance import (
+    RelevanceModel,
+    reject_evidence,
+    relevance_features,
+    save_model,
+    train_model,
+)
+
+
+def load_samples() -> list[tuple[str | None, str | None, bool]]:
+    db = get_session_maker()()
+    try:
+        rows = (
+            db.query(Document.title, Document.normalized_text, EvalSample.label_relevant)
+            .join(EvalSample, EvalSample.document_id == Document.id)
+            .order_by(EvalSample.id)
+            .all()
+        )
+        return [(title, text, bool(label)) for title, text, label in rows]
+    finally:
+        db.close()
+
+
+def evaluate(model: RelevanceModel, samples: list[tuple[str | None, str | None, bool]]) -> dict:
+    settings = get_settings()
+    stats = {"rejected": 0, "rejected_relevant": 0, "fast_tracked": 0, "fast_tracked_relevant": 0}
+    for title, text, label in samples:
+        features = relevance_features(title, text)
+        score = model.score_features(features)
+        if score < settings.relevance_reject_below and reject_evidence(features, model.weights):
+            stats["rejected"] += 1
+            stats["rejected_relevant"] += int(label)
+        elif score > settings.relevance_fast_track_above:
+            stats["fast_tracked"] += 1
+            stats["fast_tracked_relevant"] += int(label)
+    if stats["rejected"]:
+        stats["reject_precision"] = round(1 - stats["rejected_relevant"] / stats["rejected"], 4)
+    if stats["fast_tracked"]:
+        stats["fast_track_precision"] = round(stats["fast_tracked_relevant"] / stats["fast_tracked"], 4)
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fit the relevance prefilter weights on eval_samples labels")
+    parser.add_argument("--output", default=get_settings().relevance_model_path or "data/relevance_model.json")
+    parser.add_argument("--epochs", type=int, default=200)
+    parser.add_argument("--holdout-every", type=int, default=5, help="Every Nth sample is held out for evaluation")
+    parser.add_argument("--dry-run", action="store_true", help="Evaluate without writing the model")
+    args = parser.parse_args()
+
+    samples = load_samples()
+    holdout = samples[:: args.holdout_every] if args.holdout_every > 1 else []
+    training = [sample for index, sample in enumerate(samples) if args.holdout_every <= 1 or index % args.holdout_every]
+    model = train_model(training, epochs=args.epochs)
+    print(f"Samples: {len(samples)} (training {len(training)}, holdout {len(holdout)})")
+    print(f"Lexicon holdout: {evaluate(RelevanceModel(), holdout)}")
+    print(f"Trained holdout: {evaluate(model, holdout)}")
+    if not args.dry_run:
+        save_model(train_model(samples, epochs=args.epochs), args.output)
+        print(f"Model written to {args.output}; set RELEVANCE_MODEL_PATH to use it")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ from fastapi.testclient import TestClient
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_test_db_url():
+def setup_test_db_url(tmp_path_factory):
     test_db = Path("./test.db")
     if test_db.exists():
         test_db.unlink()
@@ -17,6 +17,9 @@ def setup_test_db_url():
     os.environ["ENV"] = "test"
     os.environ["API_AUTH_ENABLED"] = "false"
     os.environ["CELERY_EAGER_MODE"] = "true"
+    os.environ["RATE_LIMIT_BACKEND"] = "memory"
+    os.environ["INGEST_PARSE_EXECUTOR"] = "inline"
+    os.environ["BLOB_STORE_PATH"] = str(tmp_path_factory.mktemp("blobs"))
 
     from app.core.config import get_settings
     from app.db.session import reset_session_for_tests
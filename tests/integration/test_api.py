@@ -133,6 +133,10 @@ def test_raw_document_explorer_endpoints(client):
     detail = detail_resp.json()["data"]
     assert "raw_text" in detail
     assert "llm_runs" in detail
+    manual_item = next(item for item in items if item["url"] == payload["url"])
+    manual_detail = client.get(f"/v1/raw-documents/{manual_item['id']}").json()["data"]
+    assert manual_detail["raw_text"] == payload["text"]
+    assert manual_detail["raw_text_size"] == len(payload["text"])
 
 
 def test_insight_detail_includes_prompt_text(client):
@@ -158,3 +162,315 @@ def test_insight_detail_includes_prompt_text(client):
     llm_runs = detail.json()["data"]["llm_runs"]
     assert len(llm_runs) >= 1
     assert "prompt_text" in llm_runs[0]
+
+
+def test_manual_ingest_batch(client):
+    headers = {"Idempotency-Key": "manual-ingest-batch"}
+    items = [
+        {
+            "source_name": "Manual Batch Source",
+            "url": f"https://example.com/manual-batch-{index}",
+            "title": f"Batch item {index}",
+            "text": "Longevity trial with aging biomarkers and protocol details.",
+            "operator": "editor",
+        }
+        for index in range(3)
+    ]
+    payload = {"items": [*items, items[0]]}
+    resp = client.post("/v1/manual-ingest/batch", json=payload, headers=headers)
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["created"] == 3
+    assert data["existing"] == 1
+    assert data["triage_group_id"]
+    assert [item["status"] for item in data["items"]] == ["created", "created", "created", "existing"]
+    assert data["items"][3]["document_id"] == data["items"][0]["document_id"]
+
+    replay = client.post("/v1/manual-ingest/batch", json=payload, headers=headers)
+    assert replay.json()["data"] == data
+
+    again = client.post(
+        "/v1/manual-ingest/batch", json={"items": items[:1]}, headers={"Idempotency-Key": "manual-ingest-batch-2"}
+    )
+    assert again.json()["data"]["items"][0]["status"] == "existing"
+    assert again.json()["data"]["triage_group_id"] is None
+
+
+def test_canonical_url_repeats_skip_triage(client):
+    first = {
+        "source_name": "Canonical Source A",
+        "url": "https://example.com/news/rapamycin-trial?utm_source=rss",
+        "title": "Rapamycin trial",
+        "text": "Rapamycin trial in older adults with aging biomarkers.",
+        "operator": "editor",
+    }
+    repeat = {**first, "source_name": "Canonical Source B", "url": "http://www.example.com/news/rapamycin-trial/"}
+    first_resp = client.post("/v1/manual-ingest", json=first, headers={"Idempotency-Key": "canonical-a"})
+    repeat_resp = client.post("/v1/manual-ingest", json=repeat, headers={"Idempotency-Key": "canonical-b"})
+    assert first_resp.status_code == 200
+    assert repeat_resp.status_code == 200
+
+    items = client.get("/v1/raw-documents?limit=200&offset=0").json()["data"]
+    by_url = {item["url"]: item for item in items}
+    original = client.get(f"/v1/raw-documents/{by_url[first['url']]['id']}").json()["data"]
+    duplicate = client.get(f"/v1/raw-documents/{by_url[repeat['url']]['id']}").json()["data"]
+    assert original["canonical_url"] == duplicate["canonical_url"] == "https://example.com/news/rapamycin-trial"
+    assert duplicate["status"] == "rejected"
+    assert duplicate["llm_runs"] == []
+    assert len(original["llm_runs"]) >= 1
+
+
+def test_manual_ingest_records_detected_language(client):
+    payload = {
+        "source_name": "Language Source",
+        "url": "https://example.com/de/rapamycin",
+        "title": "Rapamycin und Alterung",
+        "text": "Forscher haben herausgefunden, dass Rapamycin die Lebensdauer von Mäusen verlängert.",
+        "operator": "editor",
+    }
+    resp = client.post("/v1/manual-ingest", json=payload, headers={"Idempotency-Key": "language-de"})
+    assert resp.status_code == 200
+
+    items = client.get("/v1/raw-documents?limit=200&offset=0").json()["data"]
+    raw_id = next(item["id"] for item in items if item["url"] == payload["url"])
+    detail = client.get(f"/v1/raw-documents/{raw_id}").json()["data"]
+    assert detail["language"] == "de"
+    # Editors chose this item, so the uncovered-language policy does not apply to manual ingest.
+    assert len(detail["llm_runs"]) >= 1
+    assert detail["llm_runs"][0]["compression_ratio"] == 1.0
+
+
+def test_prefilter_rejects_off_topic_feed_items(client, monkeypatch):
+    from app.core.config import get_settings
+    from app.db.session import get_session_maker
+    from app.models.entities import Document, EvalSample, LLMRun, Source, SourceMethod
+    from app.services.pipeline import upsert_raw_document
+    from app.tasks.jobs import triage_document
+
+    monkeypatch.setenv("RELEVANCE_REJECT_ENFORCED", "true")
+    get_settings.cache_clear()
+    db = get_session_maker()()
+    try:
+        source = Source(name="Prefilter Feed", method=SourceMethod.rss, config_json={"url": "https://jobs.example.com/rss"})
+        db.add(source)
+        db.flush()
+        raw = upsert_raw_document(
+            db,
+            source,
+            {
+                "external_id": "job-1",
+                "url": "https://jobs.example.com/postdoc",
+                "title": "Postdoc vacancy",
+                "raw_text": "We are hiring! Apply now for a PhD position with a competitive salary.",
+            },
+        )
+        db.commit()
+        document = db.query(Document).filter(Document.raw_document_id == raw.id).one()
+        assert triage_document.delay(document.id).get()["is_relevant"] is False
+
+        db.expire_all()
+        assert document.status.value == "rejected"
+        assert document.relevance_decision == "reject"
+        assert db.query(LLMRun).filter(LLMRun.document_id == document.id).count() == 0
+        db.add(EvalSample(document_id=document.id, label_relevant=False))
+        db.commit()
+    finally:
+        db.close()
+        monkeypatch.delenv("RELEVANCE_REJECT_ENFORCED")
+        get_settings.cache_clear()
+
+    data = client.get("/v1/metrics/prefilter").json()["data"]
+    assert data["decisions"]["reject"]["documents"] >= 1
+    assert data["decisions"]["reject"]["precision"] == 1.0
+    assert data["llm_calls_saved"] >= 1
+
+
+def test_pubmed_fulltext_enrichment_feeds_analysis(client, tmp_path, monkeypatch):
+    import httpx
+    import respx
+
+    from app.core.config import get_settings
+    from app.db.session import get_session_maker
+    from app.models.entities import Document, LLMRun, LLMStage, Source, SourceMethod
+    from app.services.ingestion.pubmed import EUTILS
+    from app.services.pipeline import upsert_raw_document
+    from app.tasks.jobs import _analysis_text, triage_document
+
+    monkeypatch.setenv("PMC_ENRICHMENT_ENABLED", "true")
+    monkeypatch.setenv("PMC_CACHE_PATH", str(tmp_path))
+    get_settings.cache_clear()
+    jats = (
+        "<pmc-articleset><article><body><sec sec-type='results'><title>Results</title>"
+        "<p>Rapamycin at 14 mg/kg extended median lifespan by 23%.</p></sec></body></article></pmc-articleset>"
+    )
+    db = get_session_maker()()
+    try:
+        source = Source(name="Fulltext PubMed", method=SourceMethod.pubmed, config_json={"pubmed_query": "aging"})
+        db.add(source)
+        db.flush()
+        raw = upsert_raw_document(
+            db,
+            source,
+            {
+                "external_id": "pmid:900",
+                "url": "https://pubmed.ncbi.nlm.nih.gov/900/",
+                "title": "Rapamycin and longevity in aged mice",
+                "raw_text": "Rapamycin extended lifespan in aging mice.",
+                "http_meta": {"provider": "pubmed", "pmid": "900", "doi": None, "pmcid": "PMC900"},
+            },
+        )
+        db.commit()
+        document = db.query(Document).filter(Document.raw_document_id == raw.id).one()
+        with respx.mock:
+            efetch = respx.get(f"{EUTILS}/efetch.fcgi", params={"db": "pmc"}).mock(
+                return_value=httpx.Response(200, text=jats, headers={"content-type": "text/xml"})
+            )
+            triage_document.delay(document.id)
+        assert efetch.call_count == 1
+
+        db.expire_all()
+        assert document.fulltext_status == "enriched"
+        assert document.pmcid == "PMC900"
+        assert "## Results\nRapamycin at 14 mg/kg" in _analysis_text(document)
+        stages = {run.stage for run in db.query(LLMRun).filter(LLMRun.document_id == document.id)}
+        assert LLMStage.analysis in stages
+    finally:
+        db.close()
+        monkeypatch.delenv("PMC_ENRICHMENT_ENABLED")
+        monkeypatch.delenv("PMC_CACHE_PATH")
+        get_settings.cache_clear()
+
+
+def test_failed_fulltext_fetch_is_retried_before_analysis(client, tmp_path, monkeypatch):
+    from app.core.config import get_settings
+    from app.db.session import get_session_maker
+    from app.models.entities import Document, LLMRun, LLMStage, Source, SourceMethod
+    from app.services.ingestion import pmc
+    from app.services.pipeline import upsert_raw_document
+    from app.tasks.jobs import enrich_pending_fulltext, triage_document
+
+    monkeypatch.setenv("PMC_ENRICHMENT_ENABLED", "true")
+    monkeypatch.setenv("PMC_CACHE_PATH", str(tmp_path))
+    monkeypatch.setenv("PMC_FULLTEXT_MAX_ATTEMPTS", "2")
+    get_settings.cache_clear()
+    db = get_session_maker()()
+    try:
+        source = Source(name="Flaky PMC PubMed", method=SourceMethod.pubmed, config_json={"pubmed_query": "aging"})
+        db.add(source)
+        db.flush()
+        raw = upsert_raw_document(
+            db,
+            source,
+            {
+                "external_id": "pmid:901",
+                "url": "https://pubmed.ncbi.nlm.nih.gov/901/",
+                "title": "Senolytics and healthspan in aged mice",
+                "raw_text": "Senolytics extended healthspan in aging mice.",
+                "http_meta": {"provider": "pubmed", "pmid": "901", "doi": None, "pmcid": "PMC901"},
+            },
+        )
+        db.commit()
+        document = db.query(Document).filter(Document.raw_document_id == raw.id).one()
+
+        def analysis_runs() -> int:
+            return (
+                db.query(LLMRun)
+                .filter(LLMRun.document_id == document.id, LLMRun.stage == LLMStage.analysis)
+                .count()
+            )
+
+        fetched: list[str] = []
+
+        async def unavailable(pmcid: str) -> str | None:
+            fetched.append(pmcid)
+            raise ConnectionError("PMC down")
+
+        monkeypatch.setattr(pmc, "fetch_pmc_sections", unavailable)
+        triage_document.delay(document.id)
+        db.expire_all()
+        # The first failure is requeued, not sent to analysis.
+        assert document.fulltext_status == "pending"
+        assert document.fulltext_attempts == 1
+        assert analysis_runs() == 0
+
+        assert enrich_pending_fulltext.delay().get()["failed"] == 1
+        assert fetched == ["PMC901", "PMC901"]
+
+        db.expire_all()
+        assert document.fulltext_status == "failed"
+        assert document.fulltext_attempts == 2
+        assert analysis_runs() == 1
+    finally:
+        db.close()
+        monkeypatch.delenv("PMC_ENRICHMENT_ENABLED")
+        monkeypatch.delenv("PMC_CACHE_PATH")
+        monkeypatch.delenv("PMC_FULLTEXT_MAX_ATTEMPTS")
+        get_settings.cache_clear()
+
+
+def test_persistent_pmcid_lookup_failure_stops_retrying(client, tmp_path, monkeypatch):
+    import pytest
+
+    from app.core.config import get_settings
+    from app.db.session import get_session_maker
+    from app.models.entities import Document, DocumentStatus, LLMRun, LLMStage, Source, SourceMethod
+    from app.services.ingestion import pmc
+    from app.services.pipeline import upsert_raw_document
+    from app.tasks.jobs import enrich_pending_fulltext
+
+    monkeypatch.setenv("PMC_ENRICHMENT_ENABLED", "true")
+    monkeypatch.setenv("PMC_CACHE_PATH", str(tmp_path))
+    monkeypatch.setenv("PMC_FULLTEXT_MAX_ATTEMPTS", "2")
+    get_settings.cache_clear()
+    db = get_session_maker()()
+    try:
+        source = Source(name="Elink Down PubMed", method=SourceMethod.pubmed, config_json={"pubmed_query": "aging"})
+        db.add(source)
+        db.flush()
+        raw = upsert_raw_document(
+            db,
+            source,
+            {
+                "external_id": "pmid:902",
+                "url": "https://pubmed.ncbi.nlm.nih.gov/902/",
+                "title": "Caloric restriction and aging in primates",
+                "raw_text": "Caloric restriction delayed aging in primates.",
+                "http_meta": {"provider": "pubmed", "pmid": "902", "doi": None, "pmcid": None},
+            },
+        )
+        document = db.query(Document).filter(Document.raw_document_id == raw.id).one()
+        # State left behind by a positive triage that queued the document for full text.
+        document.status = DocumentStatus.triaged
+        document.fulltext_status = "pending"
+        db.commit()
+
+        lookups: list[list[str]] = []
+
+        async def elink_down(pmids: list[str]) -> dict[str, str]:
+            lookups.append(pmids)
+            raise ConnectionError("elink down")
+
+        monkeypatch.setattr(pmc, "map_pmids_to_pmcids", elink_down)
+        with pytest.raises(ConnectionError):
+            enrich_pending_fulltext.delay()
+        db.expire_all()
+        assert document.fulltext_status == "pending"
+        assert document.fulltext_attempts == 1
+
+        with pytest.raises(ConnectionError):
+            enrich_pending_fulltext.delay()
+        db.expire_all()
+        assert document.fulltext_status == "failed"
+        assert document.fulltext_attempts == 2
+        analysis_runs = db.query(LLMRun).filter(LLMRun.document_id == document.id, LLMRun.stage == LLMStage.analysis)
+        assert analysis_runs.count() == 1
+
+        # Nothing is left to claim, so the outage no longer triggers lookups.
+        assert enrich_pending_fulltext.delay().get() == {"documents": 0}
+        assert lookups == [["902"], ["902"]]
+    finally:
+        db.close()
+        monkeypatch.delenv("PMC_ENRICHMENT_ENABLED")
+        monkeypatch.delenv("PMC_CACHE_PATH")
+        monkeypatch.delenv("PMC_FULLTEXT_MAX_ATTEMPTS")
+        get_settings.cache_clear()
@@ -0,0 +1,40 @@
+from app.db.session import get_session_maker
+from app.models.entities import RawDocument, Source, SourceMethod
+from app.services.blobstore import load_raw_html, load_raw_text
+from scripts.backfill_blobs import backfill
+
+
+def test_backfill_moves_inline_payloads_to_blob_store(client):
+    db = get_session_maker()()
+    try:
+        source = Source(name="Backfill Source", method=SourceMethod.manual, config_json={})
+        db.add(source)
+        db.flush()
+        raw = RawDocument(
+            source_id=source.id,
+            external_id="legacy-1",
+            url="https://example.com/legacy",
+            raw_text="Legacy inline text",
+            raw_html="<p>Legacy inline text</p>",
+            content_hash="legacy",
+        )
+        db.add(raw)
+        db.commit()
+        raw_id = raw.id
+    finally:
+        db.close()
+
+    stats = backfill(batch_size=10)
+
+    db = get_session_maker()()
+    try:
+        moved = db.get(RawDocument, raw_id)
+        assert moved is not None
+        assert stats["rows"] >= 1
+        assert moved.raw_text is None
+        assert moved.raw_text_ref is not None
+        assert moved.raw_html_size == len("<p>Legacy inline text</p>")
+        assert load_raw_text(moved) == "Legacy inline text"
+        assert load_raw_html(moved) == "<p>Legacy inline text</p>"
+    finally:
+        db.close()
@@ -0,0 +1,44 @@
+from app.db.session import get_session_maker
+from app.models.entities import Document, DocumentDuplicate, DocumentStatus, Source, SourceMethod
+from app.services.pipeline import bulk_upsert_raw_documents
+
+LOC = "https://institute.example.org/research/rapamycin-aging"
+
+
+def _snapshot(lastmod: str, text: str) -> dict:
+    return {
+        "external_id": f"{LOC}@{lastmod}",
+        "url": LOC,
+        "title": "Rapamycin and aging in mice",
+        "raw_text": text,
+        "raw_html": f"<p>{text}</p>",
+    }
+
+
+def test_sitemap_page_update_is_triaged_not_deduplicated(client):
+    from app.tasks.jobs import triage_document
+
+    db = get_session_maker()()
+    try:
+        source = Source(name="Sitemap Updates Source", method=SourceMethod.sitemap, config_json={"url": LOC})
+        db.add(source)
+        db.flush()
+        first = _snapshot("2026-10-01", "Rapamycin extended lifespan in aging mice.")
+        update = _snapshot("2026-10-15", "Rapamycin extended lifespan in aging mice; new biomarker results added.")
+        [(original, _)] = bulk_upsert_raw_documents(db, [(source, first)])
+        [(updated, _)] = bulk_upsert_raw_documents(db, [(source, update)])
+        db.commit()
+        original_id, updated_id = original.id, updated.id
+    finally:
+        db.close()
+
+    triage_document(original_id)
+    result = triage_document(updated_id)
+
+    db = get_session_maker()()
+    try:
+        assert "duplicate_of" not in result
+        assert db.query(DocumentDuplicate).filter(DocumentDuplicate.document_id == updated_id).count() == 0
+        assert db.get(Document, updated_id).status != DocumentStatus.rejected
+    finally:
+        db.close()
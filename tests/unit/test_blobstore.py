@@ -0,0 +1,23 @@
+import pytest
+
+from app.services.blobstore import BlobNotFoundError, LocalBlobStore
+
+
+def test_blobs_are_content_addressed_and_compressed(tmp_path):
+    store = LocalBlobStore(tmp_path)
+    payload = ("<p>Senolytic cocktails cleared senescent cells in aged mice.</p>" * 200).encode()
+
+    first = store.put(payload)
+    second = store.put(payload)
+
+    assert first == second
+    blobs = list(tmp_path.rglob("*.zst"))
+    assert len(blobs) == 1
+    assert blobs[0].stat().st_size < len(payload) / 10
+    assert store.get(first) == payload
+
+
+def test_missing_blob_raises(tmp_path):
+    store = LocalBlobStore(tmp_path)
+    with pytest.raises(BlobNotFoundError):
+        store.get("0" * 64)
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
+
+from app.services.ingestion.browser import BrowserPool, WaitStrategy
+
+PAGE = b"""<html><body><img src="/pixel.png"><div id="app"></div>
+<script>setTimeout(() => {
+  document.getElementById("app").innerHTML = "<article id='story'>Rendered senolytics story</article>";
+}, 50);</script></body></html>"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits: ClassVar[dict[str, int]] = {}
+
+    def do_GET(self) -> None:
+        self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        body, content_type = (PAGE, "text/html") if self.path == "/page.html" else (b"\x89PNG", "image/png")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        return
+
+
+def test_wait_strategy_from_source_config():
+    wait = WaitStrategy.from_config(
+        {"dynamic_wait_until": "networkidle", "dynamic_wait_selector": "#story", "dynamic_timeout_ms": 5000}
+    )
+    assert wait == WaitStrategy(wait_until="networkidle", selector="#story", timeout_ms=5000)
+    assert WaitStrategy.from_config({}) == WaitStrategy()
+    with pytest.raises(ValueError):
+        WaitStrategy.from_config({"dynamic_wait_until": "forever"})
+
+
+def test_pool_reuses_contexts_and_blocks_images():
+    pytest.importorskip("playwright")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/page.html"
+    _Handler.hits = {}
+
+    async def _run() -> list[str]:
+        pool = BrowserPool(max_contexts=1, max_uses=2, blocked_resources={"image", "font", "media"})
+        try:
+            try:
+                await pool._ensure_browser()
+            except Exception as exc:  # noqa: BLE001
+                pytest.skip(f"Chromium not available: {exc}")
+            wait = WaitStrategy(selector="#story", timeout_ms=10000)
+            pages = [await pool.fetch(url, wait) for _ in range(3)]
+            assert pool.launches == 1
+            assert pool.contexts_created == 2
+            return pages
+        finally:
+            await pool.aclose()
+
+    try:
+        pages = asyncio.run(_run())
+    finally:
+        server.shutdown()
+
+    assert all("Rendered senolytics story" in page for page in pages)
+    assert _Handler.hits.get("/page.html") == 3
+    assert "/pixel.png" not in _Handler.hits
@@ -0,0 +1,143 @@
+import asyncio
+import gzip
+from datetime import datetime, timedelta
+from itertools import count
+
+import httpx
+import pytest
+import zstandard
+
+from app.core.cassette import Cassette, CassetteMissError, CassetteTransport, get_cassette
+from app.core.config import get_settings
+from app.core.http import close_http_clients
+from app.services.ingestion import download, pubmed
+from app.services.ingestion.rss import fetch_rss_items
+
+FEED = (
+    b'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>'
+    b"<item><guid>a1</guid><link>https://feeds.example.com/a1</link><title>Aging clocks</title>"
+    b"<description>Epigenetic clocks in centenarians.</description></item></channel></rss>"
+)
+
+
+def _record(path) -> None:
+    calls = count(1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/feed":
+            headers = {"Content-Type": "application/rss+xml", "Content-Encoding": "gzip"}
+            return httpx.Response(200, headers=headers, content=gzip.compress(FEED))
+        return httpx.Response(200, text=f"call {next(calls)}")
+
+    async def scenario() -> None:
+        transport = CassetteTransport(Cassette(path), "record", transport=httpx.MockTransport(handler))
+        async with httpx.AsyncClient(transport=transport) as client:
+            assert (await client.get("https://feeds.example.com/feed")).content == FEED
+            assert (await client.get("https://feeds.example.com/n")).text == "call 1"
+            assert (await client.get("https://feeds.example.com/n")).text == "call 2"
+
+    asyncio.run(scenario())
+
+
+def test_cassette_replays_recorded_responses_in_order(tmp_path):
+    path = tmp_path / "ingest.jsonl.zst"
+    _record(path)
+    cassette = Cassette(path)
+    assert len(cassette) == 3
+
+    async def scenario() -> None:
+        transport = CassetteTransport(cassette, "replay", latency_ms=20)
+        async with httpx.AsyncClient(transport=transport) as client:
+            feed = await client.get("https://feeds.example.com/feed")
+            assert feed.content == FEED
+            assert feed.headers["content-encoding"] == "gzip"
+            texts = [(await client.get("https://feeds.example.com/n")).text for _ in range(3)]
+            assert texts == ["call 1", "call 2", "call 2"]
+            with pytest.raises(CassetteMissError):
+                await client.get("https://feeds.example.com/missing")
+
+    loop = asyncio.new_event_loop()
+    try:
+        started = loop.time()
+        loop.run_until_complete(scenario())
+        assert loop.time() - started >= 0.08
+    finally:
+        loop.close()
+
+
+def test_cassette_keys_drop_credentials(tmp_path):
+    path = tmp_path / "ingest.jsonl.zst"
+    search = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?db=pubmed&term=aging"
+
+    async def scenario() -> None:
+        handler = httpx.MockTransport(lambda request: httpx.Response(200, text="hits"))
+        recorder = CassetteTransport(Cassette(path), "record", transport=handler)
+        async with httpx.AsyncClient(transport=recorder) as client:
+            await client.get(f"{search}&api_key=secret-key&email=ops@example.com&tool=longevai")
+        async with httpx.AsyncClient(transport=CassetteTransport(Cassette(path), "replay")) as client:
+            assert (await client.get(f"{search}&api_key=other-key")).text == "hits"
+
+    asyncio.run(scenario())
+    archive = zstandard.ZstdDecompressor().decompress(path.read_bytes(), max_output_size=1 << 20)
+    assert b"secret-key" not in archive
+    assert b"ops@example.com" not in archive
+
+
+def test_pubmed_cassette_replays_on_a_later_day(tmp_path, monkeypatch):
+    path = tmp_path / "ingest.jsonl.zst"
+    articles = (
+        "<PubmedArticleSet><PubmedArticle><MedlineCitation><PMID>7</PMID><Article>"
+        "<ArticleTitle>Aging study</ArticleTitle></Article></MedlineCitation></PubmedArticle></PubmedArticleSet>"
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("esearch.fcgi"):
+            result = {"count": "1", "idlist": ["7"], "webenv": "W", "querykey": "1"}
+            return httpx.Response(200, json={"esearchresult": result})
+        return httpx.Response(200, text=articles, headers={"content-type": "text/xml"})
+
+    def fetch_on(day: datetime, transport: CassetteTransport) -> list[str]:
+        client = httpx.AsyncClient(transport=transport)
+        monkeypatch.setattr(pubmed, "now_utc", lambda: day)
+        monkeypatch.setattr(pubmed, "get_http_client", lambda *args: client)
+        monkeypatch.setattr(download, "get_http_client", lambda *args: client)
+
+        async def scenario() -> list[str]:
+            try:
+                items, _ = await pubmed.fetch_pubmed_incremental("aging", {})
+                return [item.external_id for item in items]
+            finally:
+                await client.aclose()
+
+        return asyncio.run(scenario())
+
+    recorded_on = datetime(2026, 10, 1)
+    recorder = CassetteTransport(Cassette(path), "record", transport=httpx.MockTransport(handler))
+    assert fetch_on(recorded_on, recorder) == ["pmid:7"]
+    replayer = CassetteTransport(Cassette(path), "replay")
+    assert fetch_on(recorded_on + timedelta(days=5), replayer) == ["pmid:7"]
+
+
+def test_ingest_client_replays_without_network(tmp_path, monkeypatch):
+    path = tmp_path / "ingest.jsonl.zst"
+    _record(path)
+    monkeypatch.setenv("HTTP_CASSETTE_MODE", "replay")
+    monkeypatch.setenv("HTTP_CASSETTE_PATH", str(path))
+    monkeypatch.setenv("HTTP_CASSETTE_LATENCY_SCALE", "0")
+    get_settings.cache_clear()
+    get_cassette.cache_clear()
+
+    async def scenario() -> list:
+        try:
+            items, _ = await fetch_rss_items("https://feeds.example.com/feed")
+            return items
+        finally:
+            await close_http_clients()
+
+    try:
+        items = asyncio.run(scenario())
+    finally:
+        monkeypatch.undo()
+        get_settings.cache_clear()
+        get_cassette.cache_clear()
+    assert [item.external_id for item in items] == ["a1"]
@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+from app.core.time import now_utc
+from app.models.entities import CircuitState, Source, SourceMethod
+from app.services.circuit_breaker import (
+    begin_attempt,
+    circuit_backoff,
+    record_failure,
+    record_success,
+)
+from app.services.scheduler import next_due_at
+
+
+def _source() -> Source:
+    return Source(
+        id=1,
+        name="flaky",
+        method=SourceMethod.rss,
+        config_json={},
+        poll_interval_min=60,
+        failure_count=0,
+        circuit_state=CircuitState.closed,
+    )
+
+
+def test_breaker_opens_after_threshold_and_backs_off_exponentially():
+    source = _source()
+    now = now_utc()
+    for _ in range(2):
+        record_failure(source, now)
+    assert source.circuit_state == CircuitState.closed
+    assert begin_attempt(source, now) == CircuitState.closed
+
+    record_failure(source, now)
+    assert source.circuit_state == CircuitState.open
+    assert source.circuit_open_until == now + timedelta(minutes=5)
+    assert begin_attempt(source, now) == CircuitState.open
+    assert circuit_backoff(5) == timedelta(minutes=20)
+    assert circuit_backoff(40) == timedelta(days=1)
+
+
+def test_half_open_probe_closes_or_reopens_breaker():
+    source = _source()
+    now = now_utc()
+    for _ in range(3):
+        record_failure(source, now)
+
+    later = now + timedelta(minutes=6)
+    assert begin_attempt(source, later) == CircuitState.half_open
+    assert source.circuit_state == CircuitState.half_open
+    record_failure(source, later)
+    assert source.circuit_state == CircuitState.open
+    assert source.circuit_open_until == later + timedelta(minutes=10)
+
+    assert begin_attempt(source, later, force=True) == CircuitState.half_open
+    record_success(source)
+    assert source.circuit_state == CircuitState.closed
+    assert source.failure_count == 0
+    assert source.circuit_open_until is None
+
+
+def test_open_breaker_delays_next_due():
+    source = _source()
+    source.last_scraped_at = now_utc().replace(tzinfo=None)
+    for _ in range(6):
+        record_failure(source)
+    due = next_due_at(source)
+    assert due is not None
+    assert due - now_utc() > timedelta(minutes=35)
@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from app.services.ingestion.download import (
+    HTML_CONTENT_TYPES,
+    DownloadTooLarge,
+    UnexpectedContentType,
+    download_budget,
+    download_text,
+)
+
+URL = "https://lab.example.org/page"
+
+
+async def _download(max_bytes: int = 1024) -> tuple[str, int]:
+    with download_budget("lab", max_bytes) as budget:
+        result = await download_text(URL, HTML_CONTENT_TYPES)
+    return result.text, budget.bytes_downloaded
+
+
+@respx.mock
+def test_download_decodes_incrementally_and_counts_bytes():
+    body = "Ästhetik of ageing ✓".encode()
+    respx.get(URL).mock(
+        return_value=httpx.Response(200, content=body, headers={"Content-Type": "text/html; charset=utf-8"})
+    )
+
+    text, downloaded = asyncio.run(_download())
+
+    assert text == "Ästhetik of ageing ✓"
+    assert downloaded == len(body)
+
+
+@respx.mock
+def test_download_rejects_content_type_before_reading_body():
+    respx.get(URL).mock(
+        return_value=httpx.Response(200, content=b"%PDF-1.7", headers={"Content-Type": "application/pdf"})
+    )
+
+    with pytest.raises(UnexpectedContentType, match="application/pdf"):
+        asyncio.run(_download())
+
+
+@respx.mock
+def test_download_aborts_when_stream_exceeds_cap():
+    async def _chunks():
+        for _ in range(10):
+            yield b"x" * 512
+
+    respx.get(URL).mock(
+        return_value=httpx.Response(200, stream=_chunks(), headers={"Content-Type": "text/html"})
+    )
+
+    with pytest.raises(DownloadTooLarge, match="exceeded 2048 bytes"):
+        asyncio.run(_download(max_bytes=2048))
+
+
+@respx.mock
+def test_download_rejects_declared_length_over_cap():
+    respx.get(URL).mock(
+        return_value=httpx.Response(200, content=b"y" * 4096, headers={"Content-Type": "text/html"})
+    )
+
+    with pytest.raises(DownloadTooLarge, match="declares 4096 bytes"):
+        asyncio.run(_download(max_bytes=1024))
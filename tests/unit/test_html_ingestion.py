@@ -0,0 +1,180 @@
+import asyncio
+
+import httpx
+import respx
+
+from app.core.config import get_settings
+from app.services.ingestion import html
+from app.services.ingestion.html import (
+    _extract_links,
+    fetch_html_items,
+    fetch_html_listing,
+    html_fingerprint,
+)
+
+LISTING_URL = "https://institute.example.org/news/"
+LISTING = """<html><body><nav><a href="/about/">About</a></nav>
+<article><h2><a href="/news/senolytics/">Senolytics trial</a></h2></article>
+<article><h2><a href="/news/nad#comments">NAD+ update</a></h2></article>
+<article><h2><a href="https://institute.example.org/news/rapamycin/">Rapamycin dosing</a></h2></article>
+</body></html>"""
+ARTICLE = "<html><body><article><p>{body}</p></article></body></html>"
+PAGE_URL = "https://institute.example.org/research/"
+
+
+async def _allow(url: str) -> list[str]:
+    return []
+
+
+def test_extract_links_resolves_and_filters():
+    links = _extract_links(LISTING, LISTING_URL, ["article h2 a"], link_pattern="/news/")
+
+    assert links == [
+        ("https://institute.example.org/news/senolytics/", "Senolytics trial"),
+        ("https://institute.example.org/news/nad", "NAD+ update"),
+        ("https://institute.example.org/news/rapamycin/", "Rapamycin dosing"),
+    ]
+
+
+@respx.mock
+def test_listing_fetches_only_new_articles(monkeypatch):
+    monkeypatch.setattr(html, "assert_allowed_url_async", _allow)
+    respx.get(LISTING_URL).mock(return_value=httpx.Response(200, text=LISTING))
+    senolytics = respx.get("https://institute.example.org/news/senolytics/")
+    nad_page = (
+        '<html><head><link rel="canonical" href="/news/nad-precursors/"></head>'
+        "<body><article><p>NAD+ precursors were tested.</p></article></body></html>"
+    )
+    nad = respx.get("https://institute.example.org/news/nad").mock(return_value=httpx.Response(200, text=nad_page))
+    respx.get("https://institute.example.org/news/rapamycin/").mock(return_value=httpx.Response(503))
+
+    cursor_json = {"seen_links": ["https://institute.example.org/news/senolytics/"]}
+    items, next_cursor = asyncio.run(
+        fetch_html_listing(LISTING_URL, ["article h2 a"], cursor_json, article_selectors=["article"])
+    )
+
+    assert not senolytics.called
+    assert nad.call_count == 1
+    assert [item.external_id for item in items] == ["https://institute.example.org/news/nad"]
+    assert items[0].title == "NAD+ update"
+    assert items[0].canonical_url == "https://institute.example.org/news/nad-precursors/"
+    assert "NAD+ precursors" in (items[0].raw_text or "")
+    # The failed article stays unseen so the next poll retries it.
+    assert next_cursor["seen_links"] == [
+        "https://institute.example.org/news/nad",
+        "https://institute.example.org/news/senolytics/",
+    ]
+    assert next_cursor["failed_links"] == {"https://institute.example.org/news/rapamycin/": 1}
+    assert next_cursor["listing_new_links"] == 2
+    assert next_cursor["listing_failures"] == 1
+
+
+@respx.mock
+def test_listing_retries_failed_links_behind_new_ones_then_gives_up(monkeypatch):
+    monkeypatch.setattr(html, "assert_allowed_url_async", _allow)
+    monkeypatch.setenv("HTML_LISTING_MAX_NEW_PER_POLL", "1")
+    monkeypatch.setenv("HTML_LISTING_MAX_ATTEMPTS", "2")
+    get_settings.cache_clear()
+    respx.get(LISTING_URL).mock(return_value=httpx.Response(200, text=LISTING))
+    senolytics = respx.get("https://institute.example.org/news/senolytics/").mock(
+        return_value=httpx.Response(503)
+    )
+    respx.get("https://institute.example.org/news/nad").mock(
+        return_value=httpx.Response(200, text=ARTICLE.format(body="NAD+ precursors were tested."))
+    )
+    respx.get("https://institute.example.org/news/rapamycin/").mock(
+        return_value=httpx.Response(200, text=ARTICLE.format(body="Rapamycin dosing schedules."))
+    )
+
+    def poll(cursor_json: dict) -> tuple[list[str], dict]:
+        items, next_cursor = asyncio.run(
+            fetch_html_listing(LISTING_URL, ["article h2 a"], cursor_json, article_selectors=["article"])
+        )
+        return [item.external_id for item in items], next_cursor
+
+    try:
+        polled, cursor_json = poll({})
+        assert polled == []
+        assert cursor_json["failed_links"] == {"https://institute.example.org/news/senolytics/": 1}
+        polled, cursor_json = poll(cursor_json)
+        assert polled == ["https://institute.example.org/news/nad"]
+        polled, cursor_json = poll(cursor_json)
+        assert polled == ["https://institute.example.org/news/rapamycin/"]
+        polled, cursor_json = poll(cursor_json)
+        assert polled == []
+        assert senolytics.call_count == 2
+        assert cursor_json["failed_links"] == {}
+        assert cursor_json["listing_abandoned"] == 1
+        assert "https://institute.example.org/news/senolytics/" in cursor_json["seen_links"]
+    finally:
+        get_settings.cache_clear()
+
+
+def test_fingerprint_ignores_scripts_and_whitespace():
+    first = "<html><script>var nonce='a1';</script><p>Klotho  levels</p><!-- served 10:01 --></html>"
+    second = "<html><script>var nonce='b2';</script><p>Klotho levels</p>\n<!-- served 10:02 --></html>"
+
+    assert html_fingerprint(first) == html_fingerprint(second)
+    assert html_fingerprint(first) != html_fingerprint("<p>Klotho levels rose</p>")
+
+
+@respx.mock
+def test_html_page_sends_validators_and_reports_not_modified(monkeypatch):
+    monkeypatch.setattr(html, "assert_allowed_url_async", _allow)
+    route = respx.get(PAGE_URL).mock(return_value=httpx.Response(304))
+
+    items, validators = asyncio.run(fetch_html_items(PAGE_URL, etag='"v1"', fingerprint="abc"))
+
+    assert items == []
+    assert validators["skip_reason"] == "not_modified"
+    assert validators["fingerprint"] == "abc"
+    assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+
+
+@respx.mock
+def test_html_page_skips_extraction_when_fingerprint_matches(monkeypatch):
+    monkeypatch.setattr(html, "assert_allowed_url_async", _allow)
+    page = ARTICLE.format(body="Epigenetic clocks were recalibrated.")
+    respx.get(PAGE_URL).mock(return_value=httpx.Response(200, text=page, headers={"ETag": '"v2"'}))
+
+    def _fail_extract(*args):
+        raise AssertionError("extraction should be skipped")
+
+    monkeypatch.setattr(html, "_extract_text", _fail_extract)
+    items, validators = asyncio.run(fetch_html_items(PAGE_URL, fingerprint=html_fingerprint(page)))
+
+    assert items == []
+    assert validators == {
+        "etag": '"v2"',
+        "last_modified": None,
+        "fingerprint": html_fingerprint(page),
+        "skip_reason": "content_unchanged",
+    }
+
+
+@respx.mock
+def test_listing_emits_articles_in_batches(monkeypatch):
+    monkeypatch.setattr(html, "assert_allowed_url_async", _allow)
+    monkeypatch.setenv("INGEST_UPSERT_BATCH_SIZE", "2")
+    get_settings.cache_clear()
+    respx.get(LISTING_URL).mock(return_value=httpx.Response(200, text=LISTING))
+    for slug in ("senolytics/", "nad", "rapamycin/"):
+        respx.get(f"https://institute.example.org/news/{slug}").mock(
+            return_value=httpx.Response(200, text=ARTICLE.format(body=f"Article {slug}"))
+        )
+    batches: list[list[str]] = []
+
+    async def on_batch(items) -> None:
+        batches.append([item.external_id for item in items])
+
+    try:
+        items, next_cursor = asyncio.run(
+            fetch_html_listing(LISTING_URL, ["article h2 a"], {}, article_selectors=["article"], on_batch=on_batch)
+        )
+    finally:
+        get_settings.cache_clear()
+
+    assert items == []
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert len(next_cursor["seen_links"]) == 3
+    assert next_cursor["listing_failures"] == 0
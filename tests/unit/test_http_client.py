@@ -0,0 +1,41 @@
+import asyncio
+
+import httpx
+
+from app.core.http import HostLimitedTransport, close_http_clients, get_http_client
+
+
+def test_client_is_shared_per_loop_and_closed_on_shutdown():
+    async def scenario() -> None:
+        first = get_http_client()
+        assert get_http_client() is first
+        assert get_http_client("publish") is not first
+        await close_http_clients()
+        assert first.is_closed
+        assert get_http_client() is not first
+        await close_http_clients()
+
+    asyncio.run(scenario())
+
+
+def test_host_limited_transport_caps_concurrency_per_host():
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        return httpx.Response(200, text="ok")
+
+    async def scenario() -> None:
+        transport = HostLimitedTransport(httpx.MockTransport(handler), per_host=2)
+        async with httpx.AsyncClient(transport=transport) as client:
+            urls = [f"https://host{i % 2}.example.com/{i}" for i in range(10)]
+            responses = await asyncio.gather(*(client.get(url) for url in urls))
+        assert all(response.status_code == 200 for response in responses)
+
+    asyncio.run(scenario())
+    assert peak == {"host0.example.com": 2, "host1.example.com": 2}
@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+from app.models.entities import Source, SourceMethod
+from app.services.ingestion.common import IngestedItem
+from app.services.ingestion.engine import (
+    ItemBatch,
+    SourceFetch,
+    SourceFetchResult,
+    SourceFetchStream,
+    source_host,
+)
+
+
+def _source(source_id: int, url: str) -> Source:
+    return Source(id=source_id, name=f"s{source_id}", method=SourceMethod.rss, config_json={"url": url})
+
+
+def _run_stream(sources, fetch, max_concurrency: int, per_host_concurrency: int):
+    async def scenario() -> tuple[list[SourceFetchResult], SourceFetchStream]:
+        stream = SourceFetchStream(
+            sources,
+            fetch,
+            max_concurrency=max_concurrency,
+            per_host_concurrency=per_host_concurrency,
+            queue_size=len(sources),
+        )
+        results = [event async for event in stream if isinstance(event, SourceFetchResult)]
+        return sorted(results, key=lambda result: result.source_id), stream
+
+    results, stream = asyncio.run(scenario())
+    return results, stream.summary
+
+
+def test_fetches_run_concurrently_with_limits():
+    sources = [_source(i, f"https://feed{i % 2}.example.com/rss") for i in range(6)]
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def fetch(source: Source, emit) -> SourceFetch:
+        host = source_host(source) or ""
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.05)
+        active[host] -= 1
+        return SourceFetch()
+
+    results, summary = _run_stream(sources, fetch, max_concurrency=4, per_host_concurrency=2)
+
+    assert [result.source_id for result in results] == list(range(6))
+    assert max(peak.values()) <= 2
+    assert summary.sources == 6
+    assert summary.source_seconds_total > summary.wall_clock_seconds
+    assert summary.speedup > 1.5
+
+
+def test_fetch_errors_are_captured_per_source():
+    async def fetch(source: Source, emit) -> SourceFetch:
+        if source.id == 2:
+            raise RuntimeError("boom")
+        return SourceFetch()
+
+    sources = [_source(1, "https://a.example.com"), _source(2, "https://b.example.com")]
+    results, summary = _run_stream(sources, fetch, max_concurrency=2, per_host_concurrency=1)
+
+    assert results[0].error is None
+    assert isinstance(results[1].error, RuntimeError)
+    assert summary.failures == 1
+
+
+def test_source_host_for_pubmed():
+    source = Source(id=1, name="pm", method=SourceMethod.pubmed, config_json={})
+    assert source_host(source) == "eutils.ncbi.nlm.nih.gov"
+
+
+def test_stream_yields_batches_before_slow_sources_finish():
+    async def fetch(source: Source, emit) -> SourceFetch:
+        if source.id == 1:
+            for start in range(0, 6, 2):
+                await emit([IngestedItem(external_id=f"{start + i}", url="https://a.example.com") for i in range(2)])
+            return SourceFetch()
+        await asyncio.sleep(0.2)
+        raise RuntimeError("slow failure")
+
+    async def scenario() -> tuple[list, SourceFetchStream]:
+        stream = SourceFetchStream(
+            [_source(1, "https://a.example.com"), _source(2, "https://b.example.com")],
+            fetch,
+            max_concurrency=2,
+            per_host_concurrency=1,
+            queue_size=1,
+        )
+        return [event async for event in stream], stream
+
+    events, stream = asyncio.run(scenario())
+
+    kinds = [(type(event).__name__, event.source_id) for event in events]
+    assert kinds == [
+        ("ItemBatch", 1),
+        ("ItemBatch", 1),
+        ("ItemBatch", 1),
+        ("SourceFetchResult", 1),
+        ("SourceFetchResult", 2),
+    ]
+    assert sum(len(event.items) for event in events if isinstance(event, ItemBatch)) == 6
+    assert isinstance(events[-1].error, RuntimeError)
+    assert stream.summary.sources == 2
+    assert stream.summary.failures == 1
+
+
+def test_consumer_blocking_does_not_pause_fetches():
+    from app.tasks.runtime import consume_async
+
+    ticks: list[int] = []
+
+    async def fetch() -> None:
+        for tick in range(5):
+            ticks.append(tick)
+            await asyncio.sleep(0.01)
+
+    async def events():
+        task = asyncio.create_task(fetch())
+        yield "batch"
+        await task
+        yield "done"
+
+    seen: list[tuple[str, int]] = []
+
+    def store(event: str) -> None:
+        # Stands in for a blocking database write; the fetch above should keep progressing meanwhile.
+        time.sleep(0.2)
+        seen.append((event, len(ticks)))
+
+    consume_async(events(), store)
+    assert seen == [("batch", 5), ("done", 5)]
@@ -0,0 +1,56 @@
+import asyncio
+import os
+
+import pytest
+
+from app.core.config import get_settings
+from app.services.ingestion import executor
+from app.services.ingestion.rss import _parse_feed
+
+FEED = """<?xml version="1.0"?><rss version="2.0"><channel><item><guid>g1</guid>
+<link>https://example.com/g1</link><description>&lt;b&gt;Hello&lt;/b&gt; world</description></item></channel></rss>"""
+
+
+@pytest.fixture
+def parse_executor(monkeypatch):
+    def _configure(kind: str) -> None:
+        monkeypatch.setenv("INGEST_PARSE_EXECUTOR", kind)
+        get_settings.cache_clear()
+
+    yield _configure
+    executor.shutdown_executors()
+    monkeypatch.setenv("INGEST_PARSE_EXECUTOR", "inline")
+    get_settings.cache_clear()
+
+
+@pytest.mark.parametrize("kind", ["inline", "thread", "process"])
+def test_run_cpu_bound_parses_feed(parse_executor, kind):
+    parse_executor(kind)
+    entries, stats, bozo = asyncio.run(executor.run_cpu_bound(_parse_feed, FEED, set()))
+
+    assert entries[0]["external_id"] == "g1"
+    assert entries[0]["raw_text"] == "Hello world"
+    assert stats["skipped_seen"] == 0
+    assert bozo == 0
+
+
+def test_process_pool_runs_outside_the_caller(parse_executor):
+    parse_executor("process")
+    assert asyncio.run(executor.run_cpu_bound(os.getpid)) != os.getpid()
+
+
+def test_unknown_executor_kind_rejected(parse_executor):
+    parse_executor("fibers")
+    with pytest.raises(ValueError):
+        executor.cpu_executor_kind()
+
+
+def test_process_falls_back_to_threads_in_daemon_workers(parse_executor, monkeypatch, caplog):
+    parse_executor("process")
+    monkeypatch.setattr(executor.multiprocessing.current_process(), "daemon", True)
+    monkeypatch.setattr(executor, "_fallback_warned", False)
+
+    with caplog.at_level("WARNING", logger=executor.__name__):
+        assert executor.cpu_executor_kind() == "thread"
+        assert executor.cpu_executor_kind() == "thread"
+    assert len([record for record in caplog.records if "--pool=threads" in record.message]) == 1
@@ -0,0 +1,72 @@
+from app.core.config import get_settings
+from app.models.entities import Document, Source, SourceMethod
+from app.services.language import detect_language, language_action
+
+
+def test_detects_latin_languages_from_trigrams():
+    samples = {
+        "en": "Metformin and rapamycin extend lifespan in mice, and the authors report improved healthspan.",
+        "de": "Forscher haben herausgefunden, dass Menschen mit mehr Bewegung seltener an Demenz erkranken.",
+        "fr": "Des chercheurs ont découvert que les personnes qui bougent davantage sont moins malades.",
+        "es": "Investigadores descubrieron que las personas que se mueven más tienen menos demencia.",
+        "it": "I ricercatori hanno scoperto che le persone che si muovono di più si ammalano meno.",
+        "pt": "Pesquisadores descobriram que as pessoas que se movimentam mais têm menos demência.",
+        "nl": "Onderzoekers ontdekten dat mensen die meer bewegen minder vaak dementie krijgen.",
+    }
+    assert {language: detect_language(text) for language, text in samples.items()} == {
+        language: language for language in samples
+    }
+
+
+def test_detects_scripts_and_short_text():
+    assert detect_language("Исследователи обнаружили, что люди реже страдают деменцией.") == "ru"
+    assert detect_language("研究者たちは、日常生活でよく体を動かす人は認知症になりにくいことを発見しました。") == "ja"
+    assert detect_language("研究人员发现，日常生活中活动更多的人患痴呆症的几率更低。") == "zh"
+    assert detect_language("Aging news") == "und"
+    assert detect_language(None) == "und"
+
+
+def test_english_scientific_titles_are_never_called_foreign():
+    titles = [
+        "Alpha-ketoglutarate, an endogenous metabolite, extends lifespan and compresses morbidity in aging mice",
+        "Rapamycin fed late in life extends lifespan in genetically heterogeneous mice",
+        "Senolytics improve physical function and increase lifespan in old age",
+        "Reversal of epigenetic aging and immunosenescent trends in humans",
+        (
+            "Transient non-integrative expression of nuclear reprogramming factors promotes multifaceted "
+            "amelioration of aging in human cells"
+        ),
+        "Nicotinamide mononucleotide supplementation in healthy middle-aged adults: a randomized clinical trial",
+        "In vivo partial reprogramming alters age-associated molecular changes during physiological aging in mice",
+        "Young blood plasma exchange reverses markers of aging in old mice",
+        "Klotho protein improves cognition in aged nonhuman primates",
+        "DNA methylation GrimAge strongly predicts lifespan and healthspan",
+    ]
+    rss = Source(name="Journal", method=SourceMethod.rss, config_json={"language_policy": "skip"})
+    for title in titles:
+        assert detect_language(title) in {"en", "und"}, title
+        assert language_action(rss, detect_language(title)) == "triage", title
+
+
+def test_language_action_follows_source_policy():
+    rss = Source(name="Feed", method=SourceMethod.rss, config_json={})
+    assert language_action(rss, "en") == "triage"
+    assert language_action(rss, "de") == "defer"
+    assert language_action(rss, "und") == "triage"
+
+    rss.config_json = {"languages": ["en", "de"], "language_policy": "skip"}
+    assert language_action(rss, "de") == "triage"
+    assert language_action(rss, "fr") == "skip"
+
+    manual = Source(name="Manual", method=SourceMethod.manual, config_json={})
+    assert language_action(manual, "fr") == "triage"
+
+
+def test_triage_signature_defers_uncovered_languages():
+    from app.tasks.jobs import triage_signature
+
+    rss = Source(name="Feed", method=SourceMethod.rss, config_json={"language_policy": "defer"})
+    deferred = triage_signature(rss, Document(id=7, language="de"))
+    assert deferred.args == (7,)
+    assert deferred.options["priority"] == get_settings().deferred_triage_priority
+    assert "priority" not in triage_signature(rss, Document(id=8, language="en")).options
@@ -0,0 +1,33 @@
+from app.services.llm.budget import GAP_MARKER, estimate_tokens, prepare_input
+
+FILLER = "The committee met to discuss the agenda for next year and approved the minutes. " * 200
+LONG_TEXT = (
+    "Abstract. Rapamycin extended lifespan in aging mice. "
+    + FILLER
+    + "Mice received 14 mg/kg rapamycin for 6 months and mortality fell by 23%. "
+    + FILLER
+    + "In conclusion, mTOR inhibition slows aging."
+)
+
+
+def test_short_input_passes_through():
+    prepared = prepare_input("triage", "Rapamycin trial in older adults.", "Rapamycin trial")
+    assert prepared.text == "Rapamycin trial in older adults."
+    assert prepared.compression_ratio == 1.0
+    assert estimate_tokens("") == 0
+
+
+def test_long_input_keeps_informative_spans_within_budget():
+    prepared = prepare_input("triage", LONG_TEXT, "Rapamycin and aging")
+    assert prepared.original_tokens == estimate_tokens(LONG_TEXT)
+    assert prepared.prepared_tokens <= 1500
+    assert prepared.compression_ratio < 0.25
+    assert prepared.text.startswith("Rapamycin and aging\n\nAbstract.")
+    assert "14 mg/kg rapamycin for 6 months" in prepared.text
+    assert "In conclusion, mTOR inhibition slows aging." in prepared.text
+    assert GAP_MARKER in prepared.text
+    assert prepared.as_meta()["compression_ratio"] == prepared.compression_ratio
+
+
+def test_stage_budgets_differ():
+    assert prepare_input("analysis", LONG_TEXT).prepared_tokens > prepare_input("triage", LONG_TEXT).prepared_tokens
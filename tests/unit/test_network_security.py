@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from app.utils.network import UnsafeUrlError, assert_allowed_url
@@ -10,3 +12,36 @@ def test_blocks_unsafe_scheme():
 
 def test_allows_https_domain_when_allowlist_empty():
     assert_allowed_url("https://example.com/article")
+
+
+def test_async_check_caches_negative_verdicts():
+    from app.core.observability import DNS_CACHE_LOOKUPS
+    from app.utils.network import assert_allowed_url_async, clear_dns_cache
+
+    clear_dns_cache()
+    hits_before = DNS_CACHE_LOOKUPS.labels("hit")._value.get()
+    for _ in range(2):
+        with pytest.raises(UnsafeUrlError):
+            asyncio.run(assert_allowed_url_async("http://127.0.0.1/admin"))
+    assert DNS_CACHE_LOOKUPS.labels("hit")._value.get() == hits_before + 1
+
+
+def test_pinned_backend_connects_to_validated_address():
+    from app.utils.network import PinnedDNSBackend, clear_dns_cache
+
+    class RecordingBackend:
+        def __init__(self) -> None:
+            self.hosts: list[str] = []
+
+        async def connect_tcp(self, host, port, **kwargs):
+            self.hosts.append(host)
+            return "stream"
+
+    clear_dns_cache()
+    inner = RecordingBackend()
+    backend = PinnedDNSBackend(inner)  # type: ignore[arg-type]
+    assert asyncio.run(backend.connect_tcp("93.184.215.14", 443)) == "stream"
+    assert inner.hosts == ["93.184.215.14"]
+    with pytest.raises(UnsafeUrlError):
+        asyncio.run(backend.connect_tcp("10.0.0.5", 443))
+    assert inner.hosts == ["93.184.215.14"]
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import timedelta
+
+import httpx
+import respx
+
+from app.core.config import get_settings
+from app.core.time import now_utc
+from app.services.ingestion.pmc import (
+    FulltextCache,
+    FulltextTarget,
+    _cached_result,
+    enrich_fulltext,
+    extract_sections,
+)
+from app.services.ingestion.pubmed import EUTILS
+
+JATS = """<pmc-articleset><article><front><article-meta><title-group>
+<article-title>Rapamycin in aged mice</article-title></title-group></article-meta></front><body>
+<sec sec-type="intro"><title>Introduction</title><p>Background on mTOR.</p></sec>
+<sec sec-type="methods"><title>Materials and Methods</title><p>Mice received 14 mg/kg <italic>rapamycin</italic>.</p></sec>
+<sec><title>Results</title><p>Median lifespan rose by 23%.</p><sec><title>Survival</title><p>HR 0.62.</p></sec></sec>
+</body></article></pmc-articleset>"""
+FRONT_ONLY = "<pmc-articleset><article><front><article-meta/></front></article></pmc-articleset>"
+
+
+def test_extract_sections_keeps_requested_sections():
+    text = extract_sections(JATS, ("results", "methods"))
+    assert text is not None
+    assert "## Materials and Methods\nMice received 14 mg/kg rapamycin." in text
+    assert "Median lifespan rose by 23%.\nHR 0.62." in text
+    assert "Background on mTOR" not in text
+    assert extract_sections(FRONT_ONLY, ("results",)) is None
+    assert extract_sections("<not xml", ("results",)) is None
+
+
+@respx.mock
+def test_enrichment_maps_in_batches_and_caches(tmp_path, monkeypatch):
+    monkeypatch.setenv("PMC_CACHE_PATH", str(tmp_path))
+    get_settings.cache_clear()
+    elink = respx.get(f"{EUTILS}/elink.fcgi").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "linksets": [
+                    {"ids": [1], "linksetdbs": [{"linkname": "pubmed_pmc", "links": [100]}]},
+                    {"ids": [2]},
+                ]
+            },
+        )
+    )
+    efetch = respx.get(f"{EUTILS}/efetch.fcgi", params={"db": "pmc"}).mock(
+        side_effect=lambda request: httpx.Response(
+            200,
+            text=JATS if request.url.params["id"] == "100" else FRONT_ONLY,
+            headers={"content-type": "text/xml"},
+        )
+    )
+    targets = [
+        FulltextTarget(document_id=10, pmid="1", doi="10.1/a"),
+        FulltextTarget(document_id=11, pmid="2"),
+        FulltextTarget(document_id=12, pmid="3", pmcid="PMC300"),
+        FulltextTarget(document_id=13),
+    ]
+    try:
+        results = asyncio.run(enrich_fulltext(targets))
+        assert elink.call_count == 1
+        assert elink.calls.last.request.url.params.get_list("id") == ["1", "2"]
+        assert efetch.call_count == 2
+        assert results[10].status == "enriched" and results[10].pmcid == "PMC100"
+        assert "Median lifespan" in (results[10].text or "")
+        assert results[11].status == "unavailable"
+        assert results[12].status == "unavailable" and results[12].pmcid == "PMC300"
+        assert results[13].status == "unavailable"
+
+        # A later document with the same DOI is served from the disk cache.
+        again = asyncio.run(enrich_fulltext([FulltextTarget(document_id=20, doi="10.1/A"), targets[1]]))
+        assert again[20].cached and again[20].text == results[10].text
+        assert again[11].cached and again[11].status == "unavailable"
+        assert elink.call_count == 1 and efetch.call_count == 2
+    finally:
+        monkeypatch.delenv("PMC_CACHE_PATH")
+        get_settings.cache_clear()
+
+
+def test_cached_pmcid_without_open_access_text_expires(tmp_path):
+    cache = FulltextCache(tmp_path)
+    target = FulltextTarget(document_id=1, pmcid="PMC300")
+    fresh = now_utc().isoformat()
+    cache.put("pmcid:PMC300", {"pmcid": "PMC300", "text": None, "checked_at": fresh})
+    cached = _cached_result(cache, target)
+    assert cached is not None and cached.status == "unavailable" and cached.pmcid == "PMC300"
+
+    stale = (now_utc() - timedelta(days=get_settings().pmc_negative_cache_days + 1)).isoformat()
+    cache.put("pmcid:PMC300", {"pmcid": "PMC300", "text": None, "checked_at": stale})
+    assert _cached_result(cache, target) is None
@@ -1,4 +1,14 @@
-from app.services.ingestion.pubmed import _extract_doi
+import asyncio
+
+import httpx
+import respx
+
+from app.services.ingestion.pubmed import (
+    EUTILS,
+    PubmedArticleStream,
+    _extract_doi,
+    fetch_pubmed_incremental,
+)
 
 
 def test_extract_doi_from_text():
@@ -9,3 +19,119 @@ def test_extract_doi_from_text():
 
 def test_extract_doi_none_when_missing():
     assert _extract_doi("no doi here") is None
+
+
+ARTICLE_SET = """<PubmedArticleSet>{articles}</PubmedArticleSet>"""
+ARTICLE = """<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>
+<ArticleTitle>Aging study {pmid}</ArticleTitle>
+<Abstract><AbstractText>Longevity result {pmid}.</AbstractText></Abstract>
+</Article></MedlineCitation></PubmedArticle>"""
+
+
+def _articles(*pmids: str) -> str:
+    return ARTICLE_SET.format(articles="".join(ARTICLE.format(pmid=pmid) for pmid in pmids))
+
+
+@respx.mock
+def test_incremental_fetch_posts_only_unseen_pmids():
+    search = respx.get(f"{EUTILS}/esearch.fcgi").mock(
+        return_value=httpx.Response(
+            200,
+            json={"esearchresult": {"idlist": ["3", "2", "1"], "webenv": "W1", "querykey": "1"}},
+        )
+    )
+    post = respx.post(f"{EUTILS}/epost.fcgi").mock(
+        return_value=httpx.Response(
+            200, text="<ePostResult><QueryKey>2</QueryKey><WebEnv>W1</WebEnv></ePostResult>"
+        )
+    )
+    efetch = respx.get(f"{EUTILS}/efetch.fcgi").mock(
+        return_value=httpx.Response(200, text=_articles("3"))
+    )
+
+    cursor = {"maxdate": "2026/10/01", "recent_pmids": ["2", "1"]}
+    items, next_cursor = asyncio.run(fetch_pubmed_incremental("aging", cursor))
+
+    assert [item.external_id for item in items] == ["pmid:3"]
+    assert search.calls.last.request.url.params["mindate"] == "2026/10/01"
+    assert search.calls.last.request.url.params["usehistory"] == "y"
+    assert b"id=3" in post.calls.last.request.content
+    assert efetch.calls.last.request.url.params["query_key"] == "2"
+    assert next_cursor["recent_pmids"][:3] == ["3", "2", "1"]
+
+
+@respx.mock
+def test_incremental_fetch_skips_efetch_when_nothing_new():
+    respx.get(f"{EUTILS}/esearch.fcgi").mock(
+        return_value=httpx.Response(
+            200, json={"esearchresult": {"idlist": ["1"], "webenv": "W", "querykey": "1"}}
+        )
+    )
+    efetch = respx.get(f"{EUTILS}/efetch.fcgi")
+
+    items, _ = asyncio.run(fetch_pubmed_incremental("aging", {"recent_pmids": ["1"]}))
+
+    assert items == []
+    assert not efetch.called
+
+
+def _search_pages(pages: list[list[str]], count: int):
+    def respond(request: httpx.Request) -> httpx.Response:
+        retstart = int(request.url.params.get("retstart", 0))
+        offset = 0
+        for page in pages:
+            if offset == retstart:
+                return httpx.Response(
+                    200, json={"esearchresult": {"count": str(count), "idlist": page, "webenv": "W", "querykey": "1"}}
+                )
+            offset += len(page)
+        return httpx.Response(200, json={"esearchresult": {"count": str(count), "idlist": []}})
+
+    return respond
+
+
+@respx.mock
+def test_incremental_fetch_pages_through_full_count():
+    search = respx.get(f"{EUTILS}/esearch.fcgi").mock(side_effect=_search_pages([["5", "4"], ["3", "2"], ["1"]], 5))
+    efetch = respx.get(f"{EUTILS}/efetch.fcgi").mock(
+        return_value=httpx.Response(200, text=_articles("5", "4", "3", "2", "1"))
+    )
+
+    items, next_cursor = asyncio.run(fetch_pubmed_incremental("aging", {"maxdate": "2026/10/01"}))
+
+    assert search.call_count == 3
+    assert [call.request.url.params.get("retstart") for call in search.calls] == [None, "2", "4"]
+    assert len(items) == 5
+    assert efetch.called
+    assert next_cursor["recent_pmids"][:5] == ["5", "4", "3", "2", "1"]
+    assert next_cursor["maxdate"] != "2026/10/01"
+
+
+@respx.mock
+def test_incremental_fetch_keeps_cursor_when_window_incomplete():
+    respx.get(f"{EUTILS}/esearch.fcgi").mock(side_effect=_search_pages([["5", "4"]], 5))
+    respx.get(f"{EUTILS}/efetch.fcgi").mock(return_value=httpx.Response(200, text=_articles("5", "4")))
+
+    items, next_cursor = asyncio.run(fetch_pubmed_incremental("aging", {"maxdate": "2026/10/01"}))
+
+    assert len(items) == 2
+    assert next_cursor["maxdate"] == "2026/10/01"
+    assert next_cursor["mindate"] == "2026/10/01"
+
+
+def test_article_stream_handles_split_chunks_and_releases_articles():
+    payload = _articles("10", "11", "12").encode("utf-8")
+    stream = PubmedArticleStream()
+    items = []
+    for start in range(0, len(payload), 7):
+        items.extend(stream.feed(payload[start : start + 7]))
+    items.extend(stream.close())
+
+    assert [item.http_meta["pmid"] for item in items] == ["10", "11", "12"]
+    assert stream._root is not None and len(stream._root) == 0
+
+
+def test_article_stream_stops_on_malformed_xml():
+    stream = PubmedArticleStream()
+    assert stream.feed(b"<PubmedArticleSet><PubmedArticle></Oops>") == []
+    assert stream.failed
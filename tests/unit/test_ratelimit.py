@@ -0,0 +1,64 @@
+import asyncio
+from time import perf_counter
+
+import pytest
+
+from app.core.config import get_settings
+from app.utils.ratelimit import InMemoryTokenBucket, RateLimiter, RedisTokenBucket, bucket_capacity
+
+
+def test_ncbi_never_exceeds_rate_in_any_second():
+    async def scenario() -> list[float]:
+        limiter = RateLimiter(InMemoryTokenBucket())
+        started = perf_counter()
+        sent = []
+        for _ in range(7):
+            await limiter.acquire("eutils.ncbi.nlm.nih.gov")
+            sent.append(perf_counter() - started)
+        return sent
+
+    # Default NCBI quota without an API key is a hard 3 req/s.
+    sent = asyncio.run(scenario())
+    for start in sent:
+        # Small slack for timer resolution; the spacing is 1/3 s, far above it.
+        assert sum(1 for moment in sent if start <= moment < start + 0.98) <= 3
+    assert sent[-1] >= 1.9
+
+
+def test_bucket_capacity_allows_bursts_only_when_configured(monkeypatch):
+    assert bucket_capacity("eutils.ncbi.nlm.nih.gov", 10.0) == 1.0
+    assert bucket_capacity("example.com", 5.0) == 1.0
+    monkeypatch.setenv("RATE_LIMIT_BURST_SECONDS", "2")
+    get_settings.cache_clear()
+    try:
+        assert bucket_capacity("example.com", 5.0) == 10.0
+        assert bucket_capacity("EUTILS.ncbi.nlm.nih.gov", 10.0) == 1.0
+    finally:
+        monkeypatch.delenv("RATE_LIMIT_BURST_SECONDS")
+        get_settings.cache_clear()
+
+
+def test_unlimited_host_does_not_wait():
+    async def scenario() -> float:
+        return await RateLimiter(InMemoryTokenBucket()).acquire("example.com")
+
+    assert asyncio.run(scenario()) == 0.0
+
+
+def test_redis_bucket_is_shared_between_limiters():
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def scenario() -> list[float]:
+        server = fakeredis.FakeServer()
+        workers = [
+            RedisTokenBucket(fakeredis.FakeAsyncRedis(server=server)) for _ in range(2)
+        ]
+        waits = []
+        for index in range(4):
+            waits.append(await workers[index % 2].reserve("longevai:ratelimit:h", 2.0, 2.0))
+        return waits
+
+    waits = asyncio.run(scenario())
+    assert waits[0] == 0 and waits[1] == 0
+    assert waits[2] == pytest.approx(0.5, abs=0.05)
+    assert waits[3] == pytest.approx(1.0, abs=0.05)
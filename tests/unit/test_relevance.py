@@ -0,0 +1,90 @@
+from app.core.config import get_settings
+from app.models.entities import Source, SourceMethod
+from app.services.relevance import (
+    RelevanceModel,
+    load_model,
+    prefilter_decision,
+    relevance_features,
+    save_model,
+    train_model,
+)
+
+ON_TOPIC = ("Senolytics extend healthspan", "Senolytic drugs cleared senescent cells and extended lifespan in aging mice.")
+JOB_POST = ("Postdoc vacancy", "We are hiring! Apply now for a PhD position with a competitive salary.")
+EVENT = ("Webinar", "Register now for our webinar on aging research. Tickets are limited, save the date.")
+
+
+def test_features_saturate_and_match_phrases():
+    features = relevance_features("Epigenetic clock", "The epigenetic clock of older adults. " * 20)
+    assert {"epigenetic clock", "older adults"} <= set(features)
+    # BM25 saturation keeps 20 repeats below k1 + 1.
+    assert features["epigenetic clock"] < 2.2
+    assert relevance_features(None, "Sunny with light winds.") == {}
+
+
+def test_lexicon_scores_separate_off_topic_items():
+    model = RelevanceModel()
+    assert model.score(*ON_TOPIC) > 0.99
+    assert model.score(*JOB_POST) < 0.02
+    assert model.score(*EVENT) < 0.02
+    # No vocabulary hit at all is left to the LLM rather than rejected.
+    neutral = model.score("Weather", "Sunny tomorrow with light winds.")
+    assert 0.02 < neutral < 0.5
+
+
+def _decide(source: Source, title: str, text: str | None = None):
+    features = relevance_features(title, text)
+    return prefilter_decision(source, RelevanceModel().score_features(features), features)
+
+
+def test_prefilter_decision_thresholds(monkeypatch):
+    feed = Source(name="Feed", method=SourceMethod.rss, config_json={})
+    manual = Source(name="Manual", method=SourceMethod.manual, config_json={})
+    monkeypatch.setenv("RELEVANCE_REJECT_ENFORCED", "true")
+    get_settings.cache_clear()
+    try:
+        assert _decide(feed, *JOB_POST) == "reject"
+        # The webinar is about aging research, so it is left to the LLM.
+        assert _decide(feed, *EVENT) == "triage"
+        assert _decide(manual, *JOB_POST) == "triage"
+        assert _decide(feed, *ON_TOPIC) == "triage"
+        assert prefilter_decision(feed, 1.0, {}) == "triage"
+    finally:
+        monkeypatch.delenv("RELEVANCE_REJECT_ENFORCED")
+        get_settings.cache_clear()
+    # Shadow mode by default: the verdict is recorded, triage still runs.
+    assert _decide(feed, *JOB_POST) == "shadow_reject"
+
+
+def test_prefilter_needs_off_topic_evidence_to_reject(monkeypatch):
+    feed = Source(name="Feed", method=SourceMethod.rss, config_json={})
+    monkeypatch.setenv("RELEVANCE_REJECT_ENFORCED", "true")
+    get_settings.cache_clear()
+    try:
+        # Low scores with no off-topic term, or with an on-topic one, go to the LLM.
+        assert _decide(feed, "Weather", "Sunny tomorrow with light winds.") == "triage"
+        assert _decide(feed, "Altos Labs is hiring: the cell rejuvenation company expands") == "triage"
+        assert _decide(feed, "Register now for the Longevity Summit") == "triage"
+        assert prefilter_decision(feed, 0.001, {}) == "triage"
+        # Negative-only news headlines stay shadow decisions until RELEVANCE_REJECT_ENFORCED is set.
+        assert _decide(feed, "GLP-1 drugs cut heart attacks in large trial presented at ESC conference") == "reject"
+    finally:
+        monkeypatch.delenv("RELEVANCE_REJECT_ENFORCED")
+        get_settings.cache_clear()
+    assert _decide(feed, "GLP-1 drugs cut heart attacks in large trial presented at ESC conference") == "shadow_reject"
+
+
+def test_training_moves_weights_towards_labels(tmp_path):
+    # Labels say mice-only studies are off-topic for this newsletter.
+    samples = [("Mice study", "A cohort of mice was observed for a year.", False)] * 10 + [ON_TOPIC + (True,)] * 10
+    model = train_model(samples, epochs=300, learning_rate=0.5)
+    baseline = RelevanceModel()
+    assert model.weights["mice"] < baseline.weights["mice"]
+    assert model.score("Mice study", "A cohort of mice was observed.") < baseline.score("Mice study", "A cohort of mice was observed.")
+    assert model.samples == 20
+
+    path = tmp_path / "model.json"
+    save_model(model, str(path))
+    loaded = load_model(str(path))
+    assert loaded.weights == model.weights
+    assert load_model("").weights == baseline.weights
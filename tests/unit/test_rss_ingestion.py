@@ -0,0 +1,61 @@
+import asyncio
+
+import httpx
+import respx
+
+from app.services.ingestion import rss
+from app.services.ingestion.rss import estimate_parse_savings, fetch_rss_items
+
+FEED_URL = "https://feeds.example.com/rss"
+FEED = """<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>{items}</channel></rss>"""
+ITEM = """<item><guid>{guid}</guid><link>https://example.com/{guid}</link><title>{guid}</title>
+<description>&lt;p&gt;Body for {guid}&lt;/p&gt;</description></item>"""
+
+
+async def _allow(url: str) -> list[str]:
+    return []
+
+
+@respx.mock
+def test_known_entries_skip_body_extraction(monkeypatch):
+    monkeypatch.setattr(rss, "assert_allowed_url_async", _allow)
+    extracted: list[str] = []
+    original = rss._extract_body
+
+    def _tracking_extract(entry):
+        extracted.append(entry.get("id"))
+        return original(entry)
+
+    monkeypatch.setattr(rss, "_extract_body", _tracking_extract)
+    body = FEED.format(items="".join(ITEM.format(guid=guid) for guid in ("a1", "a2", "a3")))
+    respx.get(FEED_URL).mock(return_value=httpx.Response(200, text=body))
+
+    items, meta = asyncio.run(fetch_rss_items(FEED_URL, known_ids={"a1", "a2"}))
+
+    assert [item.external_id for item in items] == ["a3"]
+    assert items[0].raw_text == "Body for a3"
+    assert extracted == ["a3"]
+    assert meta["skipped_seen"] == 2
+    assert meta["skipped_bytes"] > 0
+
+
+def test_parse_savings_use_learned_rate_when_everything_is_skipped():
+    cursor_json: dict = {}
+    first = estimate_parse_savings(
+        {"skipped_seen": 1, "skipped_bytes": 2048, "extracted_bytes": 1024, "extract_seconds": 0.004},
+        cursor_json,
+    )
+    assert first == {"items_skipped": 1, "parse_ms_saved": 8}
+
+    second = estimate_parse_savings(
+        {"skipped_seen": 3, "skipped_bytes": 4096, "extracted_bytes": 0, "extract_seconds": 0.0},
+        cursor_json,
+    )
+    assert second == {"items_skipped": 3, "parse_ms_saved": 16}
+
+
+def test_parse_savings_unknown_without_history():
+    assert estimate_parse_savings({"skipped_seen": 2, "skipped_bytes": 100}, {}) == {
+        "items_skipped": 2,
+        "parse_ms_saved": None,
+    }
@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+from app.core.time import now_utc
+from app.models.entities import Source, SourceMethod, SourceRun, SourceRunStatus
+from app.services.scheduler import adaptive_poll_interval, due_sources, next_due_at
+
+
+def _source(source_id: int, interval_min: int, scraped_min_ago: int | None, **config) -> Source:
+    now = now_utc()
+    return Source(
+        id=source_id,
+        name=f"s{source_id}",
+        method=SourceMethod.rss,
+        config_json=config,
+        poll_interval_min=interval_min,
+        last_scraped_at=(now - timedelta(minutes=scraped_min_ago)).replace(tzinfo=None)
+        if scraped_min_ago is not None
+        else None,
+    )
+
+
+def test_due_sources_honors_poll_interval():
+    never_polled = _source(1, 60, None)
+    fast_due = _source(2, 10, 15)
+    daily_not_due = _source(3, 1440, 240)
+    hourly_not_due = _source(4, 60, 30)
+
+    due = due_sources([daily_not_due, fast_due, hourly_not_due, never_polled])
+
+    assert {source.id for source in due} == {1, 2}
+
+
+def test_next_due_respects_cooldown_and_jitter_bounds():
+    source = _source(5, 60, 0, cooldown_seconds=7200)
+    source.last_success_at = source.last_scraped_at
+    due = next_due_at(source)
+    assert due is not None
+    assert due - now_utc() > timedelta(minutes=110)
+
+    plain = _source(6, 60, 0)
+    plain_due = next_due_at(plain)
+    assert plain_due is not None
+    delta = plain_due - now_utc()
+    assert timedelta(minutes=59) < delta <= timedelta(minutes=66)
+
+
+def _runs(items: list[int], every_min: int) -> list[SourceRun]:
+    now = now_utc()
+    return [
+        SourceRun(
+            source_id=1,
+            status=SourceRunStatus.success,
+            started_at=now - timedelta(minutes=every_min * (len(items) - index)),
+            items_ingested=count,
+        )
+        for index, count in enumerate(items)
+    ]
+
+
+def test_adaptive_interval_widens_for_quiet_sources():
+    source = _source(7, 60, 0)
+    assert adaptive_poll_interval(source, _runs([0, 0], 60)) is None
+    assert adaptive_poll_interval(source, _runs([0] * 6, 60)) == 90
+
+    source.effective_poll_interval_min = 1200
+    assert adaptive_poll_interval(source, _runs([0] * 6, 1200)) == 1440
+
+
+def test_adaptive_interval_tightens_for_busy_sources():
+    source = _source(8, 60, 0)
+    assert adaptive_poll_interval(source, _runs([3] * 6, 60)) == 20
+    assert adaptive_poll_interval(source, _runs([20] * 6, 60)) == 15
+
+    bounded = _source(9, 60, 0, min_poll_interval_min=30)
+    assert adaptive_poll_interval(bounded, _runs([20] * 6, 60)) == 30
+
+
+def test_adaptive_interval_ignores_cooldown_skips_and_drives_next_due():
+    source = _source(10, 60, 0)
+    runs = _runs([1] * 3, 60)
+    runs.append(
+        SourceRun(source_id=1, status=SourceRunStatus.skipped, error="cooldown_active", started_at=now_utc(), items_ingested=0)
+    )
+    assert adaptive_poll_interval(source, runs) == 60
+
+    source.effective_poll_interval_min = 240
+    due = next_due_at(source)
+    assert due is not None
+    assert due - now_utc() > timedelta(minutes=239)
@@ -0,0 +1,123 @@
+import asyncio
+import gzip
+from datetime import timedelta
+
+import httpx
+import pytest
+import respx
+
+from app.core.time import now_utc
+from app.services.ingestion import html, sitemap
+from app.services.ingestion.download import DownloadTooLarge
+from app.services.ingestion.sitemap import SitemapStream, fetch_sitemap_items, iter_sitemap_entries
+
+BASE = "https://podcast.example.com"
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+TODAY = now_utc().date().isoformat()
+LAST_WEEK = (now_utc() - timedelta(days=7)).date().isoformat()
+LAST_YEAR = (now_utc() - timedelta(days=365)).date().isoformat()
+ARTICLE = "<html><body><article><p>Episode notes on {slug} and sleep.</p></article></body></html>"
+
+
+def _urlset(*entries: tuple[str, str]) -> str:
+    urls = "".join(f"<url><loc>{BASE}{path}</loc><lastmod>{lastmod}</lastmod></url>" for path, lastmod in entries)
+    return f'<?xml version="1.0"?><urlset {NS}>{urls}</urlset>'
+
+
+async def _allow(url: str) -> list[str]:
+    return []
+
+
+def test_stream_parses_gzipped_sitemap_index_in_chunks():
+    payload = gzip.compress(
+        f'<sitemapindex {NS}><sitemap><loc>{BASE}/a.xml</loc><lastmod>{TODAY}</lastmod></sitemap>'
+        f"<sitemap><loc>{BASE}/b.xml</loc></sitemap></sitemapindex>".encode()
+    )
+    stream = SitemapStream()
+    entries = []
+    for index in range(0, len(payload), 7):
+        entries.extend(stream.feed(payload[index : index + 7]))
+    entries.extend(stream.close())
+
+    assert [(entry.kind, entry.loc, entry.lastmod) for entry in entries] == [
+        ("sitemap", f"{BASE}/a.xml", TODAY),
+        ("sitemap", f"{BASE}/b.xml", None),
+    ]
+
+
+def test_stream_caps_inflated_size():
+    payload = gzip.compress(_urlset(*((f"/episode-{index}", TODAY) for index in range(2000))).encode())
+    stream = SitemapStream(max_bytes=4096)
+
+    with pytest.raises(DownloadTooLarge):
+        for index in range(0, len(payload), 512):
+            stream.feed(payload[index : index + 512])
+
+
+@respx.mock
+def test_content_encoded_gz_sitemap_is_not_inflated_twice(monkeypatch):
+    monkeypatch.setattr(sitemap, "assert_allowed_url_async", _allow)
+    # httpx strips Content-Encoding itself, so the body reaching the parser is already plain XML.
+    respx.get(f"{BASE}/sitemap.xml.gz").mock(
+        return_value=httpx.Response(
+            200,
+            content=gzip.compress(_urlset(("/episode-1", TODAY)).encode()),
+            headers={"Content-Type": "application/x-gzip", "Content-Encoding": "gzip"},
+        )
+    )
+
+    async def entries() -> list[str]:
+        return [entry.loc async for entry in iter_sitemap_entries(f"{BASE}/sitemap.xml.gz")]
+
+    assert asyncio.run(entries()) == [f"{BASE}/episode-1"]
+
+
+@respx.mock
+def test_fetches_only_new_or_changed_urls(monkeypatch):
+    monkeypatch.setattr(sitemap, "assert_allowed_url_async", _allow)
+    monkeypatch.setattr(html, "assert_allowed_url_async", _allow)
+    respx.get(f"{BASE}/sitemap.xml").mock(
+        return_value=httpx.Response(
+            200,
+            text=f'<sitemapindex {NS}>'
+            f"<sitemap><loc>{BASE}/episodes.xml</loc><lastmod>{TODAY}</lastmod></sitemap>"
+            f"<sitemap><loc>{BASE}/pages.xml</loc><lastmod>{LAST_WEEK}</lastmod></sitemap>"
+            "</sitemapindex>",
+            headers={"Content-Type": "application/xml"},
+        )
+    )
+    respx.get(f"{BASE}/episodes.xml").mock(
+        return_value=httpx.Response(
+            200,
+            text=_urlset(
+                ("/episode/known", LAST_WEEK),
+                ("/episode/changed", TODAY),
+                ("/episode/new", TODAY),
+                ("/episode/ancient", LAST_YEAR),
+                ("/shop/merch", TODAY),
+            ),
+            headers={"Content-Type": "application/xml"},
+        )
+    )
+    unchanged_child = respx.get(f"{BASE}/pages.xml")
+    for slug in ("changed", "new"):
+        respx.get(f"{BASE}/episode/{slug}").mock(
+            return_value=httpx.Response(200, text=ARTICLE.format(slug=slug))
+        )
+
+    cursor_json = {
+        "lastmod": {f"{BASE}/episode/known": LAST_WEEK, f"{BASE}/episode/changed": LAST_WEEK},
+        "sitemaps": {f"{BASE}/pages.xml": LAST_WEEK},
+    }
+    items, next_cursor = asyncio.run(
+        fetch_sitemap_items(f"{BASE}/sitemap.xml", cursor_json, link_pattern="/episode/")
+    )
+
+    assert not unchanged_child.called
+    assert sorted(item.external_id for item in items) == [
+        f"{BASE}/episode/changed@{TODAY}",
+        f"{BASE}/episode/new",
+    ]
+    assert next_cursor["lastmod"][f"{BASE}/episode/changed"] == TODAY
+    assert next_cursor["lastmod"][f"{BASE}/episode/new"] == TODAY
+    assert next_cursor["sitemaps"][f"{BASE}/episodes.xml"] == TODAY
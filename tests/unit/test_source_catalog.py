@@ -1,3 +1,4 @@
+from app.models.entities import SourceMethod
 from scripts.source_catalog import SOURCE_CATALOG
 
 
@@ -27,3 +28,10 @@ def test_ready_sources_are_active_and_scaffold_are_inactive():
             assert item["active"] is True
         if status == "scaffold":
             assert item["active"] is False
+
+
+def test_pubmed_queries_leave_date_bounds_to_the_cursor():
+    queries = [item["config_json"]["pubmed_query"] for item in SOURCE_CATALOG if item["method"] == SourceMethod.pubmed]
+    assert queries
+    # A publication-date filter would drop late-indexed records the edat window is meant to catch.
+    assert not any("[PDat]" in query or "[dp]" in query for query in queries)
@@ -0,0 +1,39 @@
+from app.utils.urls import canonical_link, canonicalize_url, url_hash
+
+
+def test_canonicalize_strips_tracking_and_variants():
+    variants = [
+        "https://example.com/story/aging?b=2&a=1",
+        "HTTP://WWW.Example.com/story/aging/?a=1&utm_source=rss&b=2&fbclid=xyz#comments",
+        "https://example.com:443//story/./aging?a=1&b=2&utm_medium=email",
+        "https://www.google.com/url?q=https://example.com/story/aging%3Fa%3D1%26b%3D2&sa=D",
+    ]
+    assert {canonicalize_url(url) for url in variants} == {"https://example.com/story/aging?a=1&b=2"}
+    assert len({url_hash(url) for url in variants}) == 1
+    assert canonicalize_url("https://example.com/story/aging?page=2") != canonicalize_url(variants[0])
+
+
+def test_canonicalize_known_redirect_patterns():
+    assert canonicalize_url("http://www.ncbi.nlm.nih.gov/pubmed/12345/") == "https://pubmed.ncbi.nlm.nih.gov/12345"
+    assert canonicalize_url("https://dx.doi.org/10.1038/nature123") == "https://doi.org/10.1038/nature123"
+    assert canonicalize_url("https://example.com/") == "https://example.com/"
+
+
+def test_canonicalize_youtube_short_links():
+    watch = "https://youtube.com/watch?v=dQw4w9WgXcQ"
+    assert canonicalize_url("https://youtu.be/dQw4w9WgXcQ") == watch
+    assert canonicalize_url("https://m.youtube.com/watch?v=dQw4w9WgXcQ&utm_source=share") == watch
+    assert canonicalize_url("https://youtu.be/dQw4w9WgXcQ?t=42") == "https://youtube.com/watch?t=42&v=dQw4w9WgXcQ"
+    # Distinct videos must not collapse onto one key.
+    assert canonicalize_url("https://youtu.be/abc123") != canonicalize_url("https://youtu.be/xyz789")
+
+
+def test_canonical_link_from_head():
+    html = (
+        '<html><head><link rel="stylesheet" href="/s.css">'
+        '<link href="/news/aging-clock" rel="Canonical"></head><body></body></html>'
+    )
+    assert canonical_link(html, "https://example.com/news/aging-clock?ref=feed") == "https://example.com/news/aging-clock"
+    root = '<head><link rel="canonical" href="https://example.com/"></head>'
+    assert canonical_link(root, "https://example.com/news/aging-clock") is None
+    assert canonical_link("<p>no head</p>", "https://example.com/x") is None
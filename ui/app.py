@@ -60,7 +60,7 @@ with source_tab:
     st.subheader("Add Source")
     with st.form("add_source"):
         name = st.text_input("Name")
-        method = st.selectbox("Method", ["rss", "pubmed", "html", "manual"])
+        method = st.selectbox("Method", ["rss", "pubmed", "html", "sitemap", "manual"])
         url = st.text_input("URL")
         selectors = st.text_input("HTML Selectors (comma-separated)")
         pubmed_query = st.text_input("PubMed Query", value='(longevity OR "health span" OR aging)')
@@ -231,14 +231,32 @@ with explorer_tab:
                 "normalized_text", value=detail_data.get("normalized_text") or "", height=220
             )
             st.markdown("LLM Compression + Prompt")
-            for run in detail_data.get("llm_runs", []):
+            llm_runs = detail_data.get("llm_runs", [])
+            compression_rows = [
+                {
+                    "stage": run["stage"],
+                    "estimated_tokens": run.get("input_tokens_estimated"),
+                    "sent_tokens": run.get("prepared_tokens_estimated"),
+                    "compression_ratio": run.get("compression_ratio"),
+                }
+                for run in llm_runs
+                if run.get("compression_ratio") is not None
+            ]
+            if compression_rows:
+                st.dataframe(compression_rows, use_container_width=True)
+            for run in llm_runs:
+                ratio = run.get("compression_ratio")
+                ratio_label = f" | x{ratio:.2f}" if ratio is not None else ""
                 with st.expander(
-                    f"{run['stage']} | {run['provider']}:{run['model']} | v={run['prompt_version']}"
+                    f"{run['stage']} | {run['provider']}:{run['model']} | v={run['prompt_version']}{ratio_label}"
                 ):
                     st.write(
                         {
                             "input_tokens": run.get("input_tokens"),
                             "output_tokens": run.get("output_tokens"),
+                            "input_tokens_estimated": run.get("input_tokens_estimated"),
+                            "prepared_tokens_estimated": run.get("prepared_tokens_estimated"),
+                            "compression_ratio": ratio,
                             "latency_ms": run.get("latency_ms"),
                             "cost_usd": run.get("cost_usd"),
                             "created_at": run.get("created_at"),